@@ -42,6 +42,7 @@ class FlaUiError(AttributeError):
     KeyboardExtractionFailed = "Can't extract value from input"
     ListviewItemNotFound = "Item name '{}' could not be found in column with index '{}'"
     FalseSyntax = "Incorrect syntax usage '{}'"
+    FalseSyntaxAtPosition = "Incorrect syntax usage '{}' at position {}"
     ArgumentShouldBeList = "The given argument should be an array"
     ArgumentShouldNotBeList = "The given argument should not be an array"
     PropertyNotSupported = "Property from element is not supported"
@@ -50,6 +51,18 @@ class FlaUiError(AttributeError):
     PatternNotSupported = "Supports '{}' Pattern only, method cannot be used with invalid Pattern"
     InvalidSeparator = "Try to set invalid separator"
     GridIsSingleSelect = "The Grid only supports single select. Change the muliselect argument to false"
+    ControlIsSingleSelect = "The Control only supports single select"
+    FileFormatNotSupported = "File format '{}' is not supported"
+    ColumnNotFound = "Column '{}' could not be found"
+    TreeSnapshotNotEqual = "Tree snapshot differs at item {}. Actual '{}' but expected '{}'"
+    TreeSnapshotCountNotEqual = "Tree snapshot contains {} items but expected {} items"
+    TextNotSet = "Textbox contains '{}' but expected '{}' after text was set"
+    KeyboardMacroFileError = "Keyboard macro file '{}' could not be read. {}"
+    KeyboardMacroSyntax = "Keyboard macro file '{}' contains invalid syntax at line {}: {}"
+    KeyboardMacroInvalid = "Keyboard macro '{}' is invalid. {}"
+    KeyboardMacroNotFound = "Keyboard macro '{}' could not be found"
+    ClickSequenceStepFailed = "Click sequence step {} failed. {}"
+    DragPathInvalid = "Drag path is invalid. {}"
 
     @staticmethod
     def raise_fla_ui_error(message):
@@ -26,6 +26,7 @@ class Element(ModuleInterface):
         name: Optional[str]
         use_exception: Optional[bool]
         retries: Optional[int]
+        element: Optional[Any]
 
     class Action(Enum):
         """
@@ -51,6 +52,7 @@ class Element(ModuleInterface):
         WAIT_UNTIL_ELEMENT_IS_ENABLED = "WAIT_UNTIL_ELEMENT_IS_ENABLED"
         WAIT_UNTIL_ELEMENT_EXIST = "WAIT_UNTIL_ELEMENT_EXIST"
         WAIT_UNTIL_ELEMENT_DOES_NOT_EXIST = "WAIT_UNTIL_ELEMENT_DOES_NOT_EXIST"
+        SET_SEARCH_ROOT = "SET_SEARCH_ROOT"
 
     def __init__(self, automation: Any, timeout: int = 1000):
         """
@@ -61,11 +63,12 @@ class Element(ModuleInterface):
             timeout (Integer): Timeout handler for element wait if not found.
         """
         self._element = None
+        self._search_root = None
         self._automation = automation
         self._timeout = timeout
 
     @staticmethod
-    def create_value_container(name=None, xpath=None, retries=None, use_exception=None, msg=None):
+    def create_value_container(name=None, xpath=None, retries=None, use_exception=None, element=None, msg=None):
         """
         Helper to create container object.
 
@@ -77,12 +80,14 @@ class Element(ModuleInterface):
             xpath (String | AutomationElement): Searched element as xpath from string or AutomationElement
             retries (Number): Retry counter to repeat calls as number
             use_exception (Bool) : Indicator to ignore exception handling by Flaui
+            element (Object): Element from FlaUI to use
             msg (String): Optional error message
         """
         return Element.Container(name=Converter.cast_to_string(name),
                                  xpath=Converter.cast_to_xpath_string(xpath),
                                  use_exception=Converter.cast_to_bool(use_exception),
-                                 retries=Converter.cast_to_int(retries, msg))
+                                 retries=Converter.cast_to_int(retries, msg),
+                                 element=element)
 
     def execute_action(self, action: Action, values: Container):
         """
@@ -130,7 +135,9 @@ class Element(ModuleInterface):
             self.Action.WAIT_UNTIL_ELEMENT_EXIST:
                 lambda: self._wait_until_element_exist(values["xpath"], values["retries"]),
             self.Action.WAIT_UNTIL_ELEMENT_DOES_NOT_EXIST:
-                lambda: self._wait_until_element_does_not_exist(values["xpath"], values["retries"])
+                lambda: self._wait_until_element_does_not_exist(values["xpath"], values["retries"]),
+            self.Action.SET_SEARCH_ROOT:
+                lambda: self._set_search_root(values["element"])
         }
 
         return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
@@ -221,15 +228,41 @@ class Element(ModuleInterface):
         except CSharpException:
             raise FlaUiError(FlaUiError.XPathNotFound.format(xpath)) from None
 
+    def _set_search_root(self, element: Any):
+        """
+        Sets element from which relative xpaths starting with '.' are searched instead of desktop.
+
+        Args:
+            element (Object): Element from FlaUI or None to search all xpaths from desktop.
+
+        Returns:
+            Previous search root element or None, so callers can restore it.
+        """
+        previous = self._search_root
+        self._search_root = element
+        return previous
+
+    def _get_search_root(self, xpath: str):
+        """
+        Get element to search xpath from. Relative xpaths are searched from search root if set.
+
+        Args:
+            xpath (string): XPath identifier from element.
+        """
+        if self._search_root is not None and xpath.startswith("."):
+            return self._search_root
+
+        return self._automation.GetDesktop()
+
     def _get_element_by_xpath(self, xpath: str):
         """
-        Try to get element from xpath by desktop.
+        Try to get element from xpath by desktop or search root.
 
         Args:
             xpath (string): XPath identifier from element.
         """
         try:
-            return self._automation.GetDesktop().FindFirstByXPath(xpath)
+            return self._get_search_root(xpath).FindFirstByXPath(xpath)
         except ElementNotAvailableException:
             return None
 
@@ -259,7 +292,7 @@ class Element(ModuleInterface):
         Args:
             xpath (string): XPath identifier from element.
         """
-        return self._automation.GetDesktop().FindAllByXPath(xpath)
+        return self._get_search_root(xpath).FindAllByXPath(xpath)
 
     def _element_should_exist(self, xpath: str, use_exception: bool):
         """
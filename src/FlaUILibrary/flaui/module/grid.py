@@ -1,11 +1,16 @@
+import time
 from enum import Enum
-from typing import Optional, Any
+from typing import Optional, Any, List, Dict
 from System import ArgumentOutOfRangeException  # pylint: disable=import-error
 from System import NullReferenceException  # pylint: disable=import-error
 from System import InvalidOperationException  # pylint: disable=import-error
 from FlaUILibrary.flaui.util.converter import Converter
+from FlaUILibrary.flaui.util.gridrows import GridRows
+from FlaUILibrary.flaui.util.gridexport import GridExport
+from FlaUILibrary.flaui.util.gridindex import GridIndex
 from FlaUILibrary.flaui.exception import FlaUiError
 from FlaUILibrary.flaui.interface import (ModuleInterface, ValueContainer)
+from FlaUILibrary.robotframework import robotlog
 
 
 class Grid(ModuleInterface):
@@ -14,6 +19,9 @@ class Grid(ModuleInterface):
     Wrapper module executes methods from Grid.cs implementation.
     """
 
+    def __init__(self):
+        self._index = GridIndex()
+
     class Container(ValueContainer):
         """
         Value container from grid module.
@@ -21,7 +29,16 @@ class Grid(ModuleInterface):
         element: Optional[Any]
         index: Optional[int]
         name: Optional[str]
+        names: Optional[List[str]]
         multiselect: Optional[bool]
+        columns: Optional[List[int]]
+        start: Optional[int]
+        end: Optional[int]
+        path: Optional[str]
+        file_format: Optional[str]
+        include_header: Optional[bool]
+        filters: Optional[Dict[Any, Any]]
+        virtualized: Optional[bool]
 
     class Action(Enum):
         """
@@ -30,13 +47,19 @@ class Grid(ModuleInterface):
         SELECT_ROW_BY_INDEX = "SELECT_ROW_BY_INDEX"
         GET_ROW_COUNT = "GET_ROW_COUNT"
         SELECT_ROW_BY_NAME = "SELECT_ROW_BY_NAME"
+        SELECT_ROWS_BY_NAMES = "SELECT_ROWS_BY_NAMES"
         GET_SELECTED_ROWS = "GET_SELECTED_ROWS"
+        GET_SELECTED_ROWS_AS_LIST = "GET_SELECTED_ROWS_AS_LIST"
         GET_ALL_DATA = "GET_ALL_DATA"
         GET_HEADER = "GET_HEADER"
         GET_COLUMN_COUNT = "GET_COLUMN_COUNT"
+        EXPORT_TO_FILE = "EXPORT_TO_FILE"
+        GET_ALL_DATA_VIRTUALIZED = "GET_ALL_DATA_VIRTUALIZED"
 
     @staticmethod
-    def create_value_container(element=None, index=None, name=None, multiselect=None, msg=None):
+    def create_value_container(element=None, index=None, name=None, multiselect=None, columns=None, start=None,
+                               end=None, path=None, file_format=None, include_header=None, filters=None,
+                               virtualized=None, names=None, msg=None):
         """
         Helper to create container object.
 
@@ -48,12 +71,30 @@ class Grid(ModuleInterface):
             index (Number): Index value to select from grid data
             name (String): Name from grid element
             multiselect (Boolean): If grid supports multiselect
+            columns (List): Column indices to read from grid data
+            start (Number): First row index to read from grid data
+            end (Number): Row index to stop reading grid data before
+            path (String): Filepath to export grid data
+            file_format (String): File format to export grid data as csv or jsonl
+            include_header (Boolean): If header should be exported as first row
+            filters (Dict): Column index or header name mapped to expected cell value to export
+            virtualized (Boolean): If grid rows should be read by scrolling through a virtualized grid
+            names (List): Names from grid elements
             msg (String): Optional error message
         """
         return Grid.Container(element=element,
                               index=Converter.cast_to_int(index, msg),
                               multiselect=Converter.cast_to_bool(multiselect),
-                              name=Converter.cast_to_string(name))
+                              name=Converter.cast_to_string(name),
+                              columns=Converter.cast_to_int_list(columns, msg),
+                              start=Converter.cast_to_int(start, msg),
+                              end=Converter.cast_to_int(end, msg),
+                              path=path,
+                              file_format=file_format,
+                              include_header=Converter.cast_to_bool(include_header),
+                              filters=filters,
+                              virtualized=Converter.cast_to_bool(virtualized),
+                              names=Converter.cast_to_string_list(names))
 
     def execute_action(self, action: Action, values: Container):
         """
@@ -78,62 +119,134 @@ class Grid(ModuleInterface):
                                                                              values["index"],
                                                                              values["name"],
                                                                              values["multiselect"]),
+            self.Action.SELECT_ROWS_BY_NAMES: lambda: self._select_rows_by_names(values["element"],
+                                                                                 values["index"],
+                                                                                 values["names"],
+                                                                                 values["multiselect"]),
             self.Action.GET_SELECTED_ROWS: lambda: self._get_selected_rows(values["element"]),
-            self.Action.GET_ALL_DATA: lambda: self._get_all_data(values["element"]),
-            self.Action.GET_HEADER: lambda: self._get_header(values["element"]),
+            self.Action.GET_SELECTED_ROWS_AS_LIST: lambda: GridRows.get_selected_rows(values["element"]),
+            self.Action.GET_ALL_DATA: lambda: self._get_all_data(values["element"],
+                                                                 values["columns"],
+                                                                 values["start"],
+                                                                 values["end"]),
+            self.Action.GET_HEADER: lambda: self._get_header(values["element"], values["columns"]),
+            self.Action.EXPORT_TO_FILE: lambda: self._export_to_file(values["element"],
+                                                                     values["path"],
+                                                                     values["file_format"],
+                                                                     values["include_header"],
+                                                                     values["filters"],
+                                                                     values["columns"],
+                                                                     values["virtualized"]),
+            self.Action.GET_ALL_DATA_VIRTUALIZED: lambda: self._get_all_data_virtualized(values["element"],
+                                                                                         values["columns"]),
         }
 
         return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
 
     @staticmethod
-    def _get_all_data(control: Any):
+    def _get_all_data(control: Any, columns: Optional[List[int]] = None, start: Optional[int] = None,
+                      end: Optional[int] = None):
         # pylint: disable=C0301
         """
         Try to get all rows as string.
+        Cells are fetched by a single cache request per row so each cell value is only read once.
 
         Args:
             control (Object): List view to select items.
+            columns (List): Optional column indices to read.
+            start (Number): Optional first row index to read.
+            end (Number): Optional row index to stop before.
 
         Returns:
             String array of header and columns as texts [[header1, header2, ...], [row1column1, row1column2, ...], [row2column1, row2column2, ...] ...] 
         """
         # pylint: enable=C0301
-        values = []
-        data = []
+        values = [GridRows.get_header(control, columns)]
+        values.extend(GridRows.iter_rows(control, columns, start, end))
 
-        for column in control.Header.Columns:
-            data.append(column.Text)
+        return values
 
-        values.append(data)
+    @staticmethod
+    def _get_all_data_virtualized(control: Any, columns: Optional[List[int]] = None):
+        """
+        Try to get all rows as string from a grid with UI virtualization.
+        Rows which are not realized by the grid are read by scrolling through the grid.
+        Throughput in rows per second will be logged.
 
-        for row in control.Rows:
-            data = []
-            for cell in row.Cells:
-                if "NewItemPlaceholder" not in cell.Value:
-                    data.append(cell.Value)
+        Args:
+            control (Object): List view to read items.
+            columns (List): Optional column indices to read.
 
-            if data:
-                values.append(data)
+        Returns:
+            String array of header and columns as texts [[header1, header2, ...], [row1column1, row1column2, ...] ...]
+        """
+        start = time.perf_counter()
+        values = [GridRows.get_header(control, columns)]
+        values.extend(GridRows.iter_virtualized_rows(control, columns))
+        Grid._log_throughput(len(values) - 1, start)
 
         return values
 
     @staticmethod
-    def _get_header(control: Any):
+    def _log_throughput(count: int, start: float):
+        """
+        Log count from read rows and throughput in rows per second.
+
+        Args:
+            count (Number): Count from read rows.
+            start (Float): Start time from performance counter.
+        """
+        elapsed = time.perf_counter() - start
+        rate = count / elapsed if elapsed > 0 else float(count)
+        robotlog.log(f"Read {count} rows from grid in {elapsed:.3f}s ({rate:.1f} rows/s)")
+
+    @staticmethod
+    def _get_header(control: Any, columns: Optional[List[int]] = None):
         """
         Try to get all selected rows as string.
 
         Args:
             control (Object): List view to select items.
+            columns (List): Optional column indices to read.
 
         Returns:
             String array of header columns as texts [header1, header2, ...]
         """
-        data = []
+        return GridRows.get_header(control, columns)
+
+    @staticmethod
+    def _export_to_file(control: Any, path: str, file_format: str, include_header: bool,
+                        filters: Optional[Dict[Any, Any]], columns: Optional[List[int]] = None,
+                        virtualized: bool = False):
+        """
+        Streams all rows from grid to a file without collecting grid data in memory.
+
+        Args:
+            control (Object): List view to export items.
+            path (String): Filepath to write.
+            file_format (String): File format csv or jsonl.
+            include_header (Boolean): If header should be written.
+            filters (Dict): Column index or header name mapped to expected cell value.
+            columns (List): Optional column indices to export.
+            virtualized (Boolean): If rows should be read by scrolling through a virtualized grid.
+
+        Raises:
+            FlaUiError: If file format is not supported.
+            FlaUiError: If filter column could not be found.
+
+        Returns:
+            Count from all exported rows.
+        """
+        GridExport.get_file_format(file_format)
+        start = time.perf_counter()
+        header = GridRows.get_header(control, columns)
+        row_filter = GridExport.create_row_filter(filters, header)
+        rows = GridRows.iter_virtualized_rows(control, columns) if virtualized else GridRows.iter_rows(control, columns)
 
-        for column in control.Header.Columns:
-            data.append(column.Text)
+        count = GridExport.write(rows, path, file_format, header if include_header else None, row_filter)
+        Grid._log_throughput(count, start)
 
-        return data
+        return count
 
     @staticmethod
     def _get_selected_rows(control: Any):
@@ -146,16 +259,8 @@ class Grid(ModuleInterface):
         Returns:
             String from all selected items separated as pipe for example | Value_1 | Value_2 |
         """
-
-        values = ""
-
-        for row in control.SelectedItems:
-            values += "| "
-            for cell in row.Cells:
-                values += cell.Value + " | "
-            values += "\n"
-
-        return values
+        return "".join("| " + "".join(value + " | " for value in row) + "\n"
+                       for row in GridRows.get_selected_rows(control))
 
     @staticmethod
     def _select_row_by_index(control: Any, index: int, multiselect:bool):
@@ -187,10 +292,10 @@ class Grid(ModuleInterface):
         except NullReferenceException:
             raise FlaUiError(FlaUiError.ArrayOutOfBoundException.format(index)) from None
 
-    @staticmethod
-    def _select_row_by_name(control: Any, index: int, name: str, multiselect:bool):
+    def _select_row_by_name(self, control: Any, index: int, name: str, multiselect:bool):
         """
-        Try to select element from given name from given column index
+        Try to select element from given name from given column index.
+        Row is looked up by a cached column index from grid.
 
         Args:
             control (Object): List view to select items.
@@ -202,18 +307,51 @@ class Grid(ModuleInterface):
             FlaUiError: If value is not a number.
             FlaUIError: If Name Could not be found in the given Index.
         """
+        if control.RowCount > 0:
+            Grid._select_row_by_index(control, self._get_row_indices_by_names(control, index, [name])[0],
+                                      multiselect)
+
+    def _select_rows_by_names(self, control: Any, index: int, names: List[str], multiselect: bool):
+        """
+        Try to select all elements from given names from given column index.
+        Column is read only once and all rows are looked up by a cached column index from grid.
+        If multiselect is False the selection is replaced by all given rows.
+
+        Args:
+            control (Object): List view to select items.
+            index   (Number): Column index to search names.
+            names   (List): Expected row names.
+            multiselect   (bool): Add rows to existing selection or replace selection.
+
+        Raises:
+            FlaUIError: If any name could not be found in the given index.
+            FlaUiError: If grid only supports single select.
+        """
+        row_indices = self._get_row_indices_by_names(control, index, names)
+
+        for position, row_index in enumerate(row_indices):
+            Grid._select_row_by_index(control, row_index, multiselect or position > 0)
+
+    def _get_row_indices_by_names(self, control: Any, index: int, names: List[str]):
+        """
+        Get first row index from grid for each name which is contained in column.
+        Each row from cached column index is verified and the index is rebuilt at most once for all names.
+
+        Args:
+            control (Object): List view to search items.
+            index   (Number): Column index to search names.
+            names   (List): Expected row names.
+
+        Raises:
+            FlaUIError: If any name could not be found in the given index.
+        """
         try:
-            if control.RowCount > 0:
-                if multiselect:
-                    try:
-                        control.AddToSelection(index, name)
-                    except InvalidOperationException:
-                        raise FlaUiError(FlaUiError.GridIsSingleSelect) from None
-                else:
-                    control.Select(index, name)
-        except IndexError:
-            raise FlaUiError(FlaUiError.ArrayOutOfBoundException.format(index)) from None
-        except ArgumentOutOfRangeException:
-            raise FlaUiError(FlaUiError.ListviewItemNotFound.format(name, index)) from None
-        except NullReferenceException:
-            raise FlaUiError(FlaUiError.ListviewItemNotFound.format(name, index)) from None
+            rows = self._index.get_row_indices(control, index, names)
+        except (ArgumentOutOfRangeException, NullReferenceException):
+            rows = [None for _ in names]
+
+        for name, row_index in zip(names, rows):
+            if row_index is None:
+                raise FlaUiError(FlaUiError.ListviewItemNotFound.format(name, index))
+
+        return rows
@@ -1,9 +1,8 @@
-import time
 from enum import Enum
 from typing import Optional, Any
 from FlaUI.Core.Input import Keyboard as FlaUIKeyboard  # pylint: disable=import-error
 from FlaUILibrary.flaui.util.converter import Converter
-from FlaUILibrary.flaui.util import KeyboardInputConverter
+from FlaUILibrary.flaui.util import KeyboardInputConverter, KeyboardMacro, KeyboardSequence, PreciseTimer
 from FlaUILibrary.flaui.interface import (ModuleInterface, ValueContainer)
 from FlaUILibrary.flaui.exception import FlaUiError
 
@@ -14,6 +13,9 @@ class Keyboard(ModuleInterface):
     Wrapper module executes methods from Keyboard.cs implementation.
     """
 
+    def __init__(self):
+        self._macros = {}
+
     class Container(ValueContainer):
         """
         Value container from keyboard module.
@@ -23,15 +25,19 @@ class Keyboard(ModuleInterface):
         delay_in_ms: Optional[int]
         press_only: Optional[bool]
         release_only: Optional[bool]
+        path: Optional[str]
+        name: Optional[str]
 
     class Action(Enum):
         """Supported actions for execute action implementation."""
         KEY_COMBINATION = "KEY_COMBINATION"
         KEYS_COMBINATIONS = "KEYS_COMBINATIONS"
+        LOAD_KEYBOARD_MACROS = "LOAD_KEYBOARD_MACROS"
+        PLAY_KEYBOARD_MACRO = "PLAY_KEYBOARD_MACRO"
 
     @staticmethod
     def create_value_container(shortcut=None, shortcuts=None, delay_in_ms=None,
-                               press_only=False, release_only=False):
+                               press_only=False, release_only=False, path=None, name=None):
         """
         Helper to create container object.
 
@@ -41,12 +47,16 @@ class Keyboard(ModuleInterface):
             delay_in_ms (Number): Delay in ms to wait until key was pressed
             press_only (Bool): Press key only without releasing
             release_only (Bool): Release key only without pressing
+            path (String): Filepath from keyboard macro file
+            name (String): Name from keyboard macro
         """
         return Keyboard.Container(shortcut=Converter.cast_to_string(shortcut),
                                   shortcuts=shortcuts,
                                   delay_in_ms=delay_in_ms,
                                   press_only=press_only,
-                                  release_only=release_only)
+                                  release_only=release_only,
+                                  path=path,
+                                  name=name)
 
     def execute_action(self, action: Action, values: Container):
         """If action is not supported an ActionNotSupported error will be raised.
@@ -61,6 +71,14 @@ class Keyboard(ModuleInterface):
               * Values ["shortcuts"] : user defined sequence of shortcuts and text values.
               * Returns : None
 
+            * Action.LOAD_KEYBOARD_MACROS
+              * Values ["path"] : keyboard macro file to load and compile.
+              * Returns : List from loaded macro names.
+
+            * Action.PLAY_KEYBOARD_MACRO
+              * Values ["name", "delay_in_ms"] : name from a loaded keyboard macro.
+              * Returns : None
+
         Raises:
             FlaUiError: If action is not supported.
 
@@ -77,7 +95,9 @@ class Keyboard(ModuleInterface):
         self.Action.KEY_COMBINATION: lambda: self._type_key_combination(values["shortcut"],
                                                                         values["delay_in_ms"],
                                                                         values['press_only'],
-                                                                        values['release_only'])
+                                                                        values['release_only']),
+        self.Action.LOAD_KEYBOARD_MACROS: lambda: self._load_keyboard_macros(values["path"]),
+        self.Action.PLAY_KEYBOARD_MACRO: lambda: self._play_keyboard_macro(values["name"], values["delay_in_ms"])
         }
 
         return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
@@ -140,26 +160,8 @@ class Keyboard(ModuleInterface):
         if isinstance(key_combination, list):
             raise FlaUiError(FlaUiError.ArgumentShouldNotBeList)
         try:
-            action, converting_result = KeyboardInputConverter.convert_key_combination(key_combination)
-
-            if action == KeyboardInputConverter.InputType.TEXT:
-                if press_only or release_only:
-                    raise FlaUiError(
-                        FlaUiError.PatternNotSupported.format(" s'SOMEKEY' ") + \
-                            " for key press_only and release_only events")
-
-                Keyboard._type_text(converting_result)
-            elif action == KeyboardInputConverter.InputType.SHORTCUT:
-                if press_only:
-                    Keyboard._press_keys(converting_result)
-                elif release_only:
-                    Keyboard._release_keys(converting_result)
-                else:
-                    Keyboard._type_keys(converting_result)
-
-            if delay_in_ms:
-                time.sleep(int(delay_in_ms) / 1000)
-
+            sequence = KeyboardInputConverter.compile_key_combinations([key_combination])
+            Keyboard._type_sequence(sequence, delay_in_ms, press_only, release_only)
         except Exception as ex:
             raise FlaUiError.raise_fla_ui_error(str(ex))
 
@@ -167,7 +169,7 @@ class Keyboard(ModuleInterface):
     def _type_keys_combinations(keys_combination: Any, delay_in_ms: Any,
                                 press_only: bool, release_only: bool):
         """
-        Parse a sequence of key controls.
+        Parse a sequence of key controls. The whole sequence is compiled once before any key is typed.
 
         Args:
             keys_combination (String array): Array from String to execute keyboard actions or send input data.
@@ -178,10 +180,83 @@ class Keyboard(ModuleInterface):
         if not isinstance(keys_combination, list):
             raise FlaUiError(FlaUiError.ArgumentShouldBeList)
         try:
-            for key_combination in keys_combination:
-                Keyboard._type_key_combination(key_combination, delay_in_ms,
-                                               press_only=press_only,
-                                               release_only=release_only
-                                               )
+            sequence = KeyboardInputConverter.compile_key_combinations(keys_combination)
+            Keyboard._type_sequence(sequence, delay_in_ms, press_only, release_only)
         except Exception as ex:
             raise FlaUiError.raise_fla_ui_error(str(ex))
+
+    def _load_keyboard_macros(self, path: str):
+        """
+        Reads and compiles all keyboard macros from file. Loaded macros replace macros with equal names.
+
+        Args:
+            path (String): Filepath from keyboard macro file.
+
+        Raises:
+            FlaUiError: If file could not be read or a macro contains an invalid keys combination.
+
+        Returns:
+            List from loaded macro names.
+        """
+        macros = {}
+
+        for name, keys_combinations in KeyboardMacro.read(path).items():
+            try:
+                macros[name] = KeyboardInputConverter.compile_key_combinations(keys_combinations)
+            except FlaUiError as ex:
+                raise FlaUiError(FlaUiError.KeyboardMacroInvalid.format(name, str(ex))) from None
+
+        self._macros.update(macros)
+        return list(macros)
+
+    def _play_keyboard_macro(self, name: str, delay_in_ms: Any):
+        """
+        Types a loaded keyboard macro.
+
+        Args:
+            name (String): Name from keyboard macro.
+            delay_in_ms (Number): Delay in ms to wait until key was pressed
+
+        Raises:
+            FlaUiError: If keyboard macro was not loaded.
+        """
+        if name not in self._macros:
+            raise FlaUiError(FlaUiError.KeyboardMacroNotFound.format(name))
+
+        Keyboard._type_sequence(self._macros[name], delay_in_ms, False, False)
+
+    @staticmethod
+    def _type_sequence(sequence: Any, delay_in_ms: Any, press_only: bool, release_only: bool):
+        """
+        Execution of a compiled keyboard sequence.
+        press_only and release_only supports keys only, not text.
+
+        If no delay is set, adjacent text operations are typed by one input call. Delays between operations are
+        waited by a precise timer instead of the operating system sleep granularity.
+
+        Args:
+            sequence (Tuple): Compiled shortcut and text operations from KeyboardInputConverter.
+            delay_in_ms (Number): Delay in ms to wait until key was pressed
+            press_only (Bool): Press key only without releasing
+            release_only (Bool): Release key only without pressing
+        """
+        if not delay_in_ms:
+            sequence = KeyboardSequence.merge_texts(sequence)
+
+        for operation in sequence:
+            if isinstance(operation, KeyboardSequence.Text):
+                if press_only or release_only:
+                    raise FlaUiError(
+                        FlaUiError.PatternNotSupported.format(" s'SOMEKEY' ") + \
+                            " for key press_only and release_only events")
+
+                Keyboard._type_text(operation.text)
+            elif press_only:
+                Keyboard._press_keys(operation.keys)
+            elif release_only:
+                Keyboard._release_keys(operation.keys)
+            else:
+                Keyboard._type_keys(list(operation.keys))
+
+            if delay_in_ms:
+                PreciseTimer.sleep(int(delay_in_ms) / 1000)
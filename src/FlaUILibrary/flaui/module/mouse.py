@@ -1,12 +1,15 @@
 from enum import Enum
-from typing import Optional, Any
+from typing import Optional, Any, Callable, List, Tuple
 import time
 import FlaUI.Core.Input  # pylint: disable=import-error
 from FlaUI.Core.Input import Mouse as FlaUIMouse # pylint: disable=import-error
 from FlaUI.Core.Input import MouseButton # pylint: disable=import-error
 from FlaUI.Core.Exceptions import NoClickablePointException  # pylint: disable=import-error
+from FlaUI.Core.Exceptions import ElementNotAvailableException  # pylint: disable=import-error
+from System.Drawing import Point  # pylint: disable=import-error
 from FlaUILibrary.flaui.exception import FlaUiError
 from FlaUILibrary.flaui.interface import (ModuleInterface, ValueContainer)
+from FlaUILibrary.flaui.util import ClickablePointCache, DragPath, PreciseTimer
 from FlaUILibrary.flaui.module.element import Element
 
 
@@ -25,6 +28,7 @@ class Mouse(ModuleInterface):
         """
         self._automation = automation
         self._element_module = Element(self._automation, timeout=0)
+        self._clickable_points = ClickablePointCache()
 
     class Container(ValueContainer):
         """
@@ -34,12 +38,15 @@ class Mouse(ModuleInterface):
         second_element: Optional[Any]
         timeout_in_ms: Optional[int]
         hold_time_in_ms: Optional[int]
+        hold_callback: Optional[Callable[[], Any]]
         max_repeat: Optional[int]
         click_element_xpath: Optional[str]
         goal_element_xpath: Optional[str]
         focus_element_xpath_before: Optional[str]
         focus_element_xpath_after: Optional[str]
         ignore_if: Optional[bool]
+        steps: Optional[List[Tuple[Any, Any]]]
+        drag_path: Optional[DragPath]
 
     class Action(Enum):
         """Supported actions for execute action implementation."""
@@ -65,12 +72,20 @@ class Mouse(ModuleInterface):
         SCROLL_DOWN = "SCROLL_DOWN"
         LEFT_CLICK_HOLD_OPEN = "LEFT_CLICK_HOLD_OPEN"
         LEFT_CLICK_HOLD_CLOSE= "LEFT_CLICK_HOLD_CLOSE"
+        CLICK_SEQUENCE = "CLICK_SEQUENCE"
+        DRAG_AND_DROP_BY_PATH = "DRAG_AND_DROP_BY_PATH"
+        GET_CLICKABLE_POINT_STATISTICS = "GET_CLICKABLE_POINT_STATISTICS"
+
+    ClickSequenceActions = (Action.LEFT_CLICK, Action.DOUBLE_CLICK, Action.RIGHT_CLICK, Action.MIDDLE_CLICK)
+    ClickSequenceSeparator = ":"
+    PollIntervalInMs = 50
 
     @staticmethod
     def create_value_container(element=None, second_element=None, timeout_in_ms=None, hold_time_in_ms=None,
+                               hold_callback=None,
                                max_repeat=None, click_element_xpath=None, goal_element_xpath=None,
                                focus_element_xpath_before=None, focus_element_xpath_after=None,
-                               ignore_if=None, scroll_amount=None):
+                               ignore_if=None, scroll_amount=None, steps=None, drag_path=None):
         # pylint: disable=C0301
         """
         Helper to create container object.
@@ -80,6 +95,7 @@ class Mouse(ModuleInterface):
             second_element (Object): To Element from drag and drop
             timeout_in_ms: Timeout in between waiting loops between clicking and existance profing of Click Open/ Click Close
             hold_time_in_ms: Total time of hold in Click Hold
+            hold_callback: Function to execute while mouse button is held in Click Hold
             max_repeat: Maximum number of repeats of clicking and wating in Click Open/ Click Close
             click_element_xpath: The element to be clicked in Click Open/ Click Close
             goal_element_xpath: Close element from Click Close/ open element from Click Open
@@ -87,15 +103,18 @@ class Mouse(ModuleInterface):
             focus_element_xpath_after: Focus element after clicking in Click Open/ Click Close
             ignore_if: The execution will be ignored if the clicking element exist in Click Open / does not exist in Click Close
             scroll_amount: The amount of scrolles to be made by mouse
+            steps: Pairs from click action and element to click in Click Sequence
+            drag_path: Drag path planner from Drag And Drop By Path
         """
         # pylint: enable=C0301
         return Mouse.Container(element=element, second_element=second_element, timeout_in_ms=timeout_in_ms,
                                max_repeat=max_repeat,
-                               hold_time_in_ms=hold_time_in_ms,
+                               hold_time_in_ms=hold_time_in_ms, hold_callback=hold_callback,
                                click_element_xpath=click_element_xpath, goal_element_xpath=goal_element_xpath,
                                focus_element_xpath_before=focus_element_xpath_before,
                                focus_element_xpath_after=focus_element_xpath_after,
-                               ignore_if=ignore_if, scroll_amount=scroll_amount)
+                               ignore_if=ignore_if, scroll_amount=scroll_amount, steps=steps,
+                               drag_path=drag_path)
 
     def execute_action(self, action: Action, values: Container):
         """If action is not supported an ActionNotSupported error will be raised.
@@ -110,58 +129,58 @@ class Mouse(ModuleInterface):
 
         switcher = {
             self.Action.LEFT_CLICK: lambda: self._click(values["element"]),
-            self.Action.LEFT_CLICK_OPEN: lambda: self._click_open(Mouse._click, values["click_element_xpath"],
+            self.Action.LEFT_CLICK_OPEN: lambda: self._click_open(self._click, values["click_element_xpath"],
                                                                   values["goal_element_xpath"],
                                                                   values["focus_element_xpath_before"],
                                                                   values["focus_element_xpath_after"],
                                                                   values["max_repeat"], values["timeout_in_ms"],
                                                                   values["ignore_if"]),
-            self.Action.RIGHT_CLICK_OPEN: lambda: self._click_open(Mouse._right_click, values["click_element_xpath"],
+            self.Action.RIGHT_CLICK_OPEN: lambda: self._click_open(self._right_click, values["click_element_xpath"],
                                                                    values["goal_element_xpath"],
                                                                    values["focus_element_xpath_before"],
                                                                    values["focus_element_xpath_after"],
                                                                    values["max_repeat"], values["timeout_in_ms"],
                                                                    values["ignore_if"]),
-            self.Action.DOUBLE_CLICK_OPEN: lambda: self._click_open(Mouse._double_click, values["click_element_xpath"],
+            self.Action.DOUBLE_CLICK_OPEN: lambda: self._click_open(self._double_click, values["click_element_xpath"],
                                                                     values["goal_element_xpath"],
                                                                     values["focus_element_xpath_before"],
                                                                     values["focus_element_xpath_after"],
                                                                     values["max_repeat"], values["timeout_in_ms"],
                                                                     values["ignore_if"]),
-            self.Action.MIDDLE_CLICK_OPEN: lambda: self._click_open(Mouse._middle_click, values["click_element_xpath"],
+            self.Action.MIDDLE_CLICK_OPEN: lambda: self._click_open(self._middle_click, values["click_element_xpath"],
                                                                     values["goal_element_xpath"],
                                                                     values["focus_element_xpath_before"],
                                                                     values["focus_element_xpath_after"],
                                                                     values["max_repeat"], values["timeout_in_ms"],
                                                                     values["ignore_if"]),
             self.Action.LEFT_CLICK_HOLD_OPEN: lambda: self._click_open(
-                                                                    Mouse._click_hold_relay(values["hold_time_in_ms"]),
+                                                                    self._click_hold_relay(values["hold_time_in_ms"]),
                                                                     values["click_element_xpath"],
                                                                     values["goal_element_xpath"],
                                                                     values["focus_element_xpath_before"],
                                                                     values["focus_element_xpath_after"],
                                                                     values["max_repeat"], values["timeout_in_ms"],
                                                                     values["ignore_if"]),
-            self.Action.LEFT_CLICK_CLOSE: lambda: self._click_close(Mouse._click, values["click_element_xpath"],
+            self.Action.LEFT_CLICK_CLOSE: lambda: self._click_close(self._click, values["click_element_xpath"],
                                                                     values["goal_element_xpath"],
                                                                     values["focus_element_xpath_before"],
                                                                     values["focus_element_xpath_after"],
                                                                     values["max_repeat"], values["timeout_in_ms"],
                                                                     values["ignore_if"]),
-            self.Action.RIGHT_CLICK_CLOSE: lambda: self._click_close(Mouse._right_click, values["click_element_xpath"],
+            self.Action.RIGHT_CLICK_CLOSE: lambda: self._click_close(self._right_click, values["click_element_xpath"],
                                                                      values["goal_element_xpath"],
                                                                      values["focus_element_xpath_before"],
                                                                      values["focus_element_xpath_after"],
                                                                      values["max_repeat"], values["timeout_in_ms"],
                                                                      values["ignore_if"]),
-            self.Action.DOUBLE_CLICK_CLOSE: lambda: self._click_close(Mouse._double_click,
+            self.Action.DOUBLE_CLICK_CLOSE: lambda: self._click_close(self._double_click,
                                                                       values["click_element_xpath"],
                                                                       values["goal_element_xpath"],
                                                                       values["focus_element_xpath_before"],
                                                                       values["focus_element_xpath_after"],
                                                                       values["max_repeat"], values["timeout_in_ms"],
                                                                       values["ignore_if"]),
-            self.Action.MIDDLE_CLICK_CLOSE: lambda: self._click_close(Mouse._middle_click,
+            self.Action.MIDDLE_CLICK_CLOSE: lambda: self._click_close(self._middle_click,
                                                                       values["click_element_xpath"],
                                                                       values["goal_element_xpath"],
                                                                       values["focus_element_xpath_before"],
@@ -169,7 +188,7 @@ class Mouse(ModuleInterface):
                                                                       values["max_repeat"], values["timeout_in_ms"],
                                                                       values["ignore_if"]),
             self.Action.LEFT_CLICK_HOLD_CLOSE: lambda: self._click_close(
-                                                                    Mouse._click_hold_relay(values["hold_time_in_ms"]),
+                                                                    self._click_hold_relay(values["hold_time_in_ms"]),
                                                                     values["click_element_xpath"],
                                                                     values["goal_element_xpath"],
                                                                     values["focus_element_xpath_before"],
@@ -179,16 +198,25 @@ class Mouse(ModuleInterface):
             self.Action.RIGHT_CLICK: lambda: self._right_click(values["element"]),
             self.Action.MIDDLE_CLICK: lambda: self._middle_click(values["element"]),
             self.Action.DOUBLE_CLICK: lambda: self._double_click(values["element"]),
-            self.Action.LEFT_CLICK_HOLD: lambda: self._click_hold(values["element"], values["hold_time_in_ms"]),
-            self.Action.RIGHT_CLICK_HOLD: lambda: self._right_click_hold(values["element"], values["hold_time_in_ms"]),
+            self.Action.LEFT_CLICK_HOLD: lambda: self._click_hold(values["element"], values["hold_time_in_ms"],
+                                                                  values["hold_callback"]),
+            self.Action.RIGHT_CLICK_HOLD: lambda: self._right_click_hold(values["element"], values["hold_time_in_ms"],
+                                                                         values["hold_callback"]),
             self.Action.DOUBLE_CLICK_HOLD: lambda: self._double_click_hold(values["element"],
-                                                                           values["hold_time_in_ms"]),
+                                                                           values["hold_time_in_ms"],
+                                                                           values["hold_callback"]),
             self.Action.MIDDLE_CLICK_HOLD: lambda: self._middle_click_hold(values["element"],
-                                                                           values["hold_time_in_ms"]),
+                                                                           values["hold_time_in_ms"],
+                                                                           values["hold_callback"]),
             self.Action.MOVE_TO: lambda: self._move_to(values["element"]),
             self.Action.DRAG_AND_DROP: lambda: self._drag_and_drop(values["element"], values["second_element"]),
             self.Action.SCROLL_UP: lambda: self._scroll(values["element"], values['scroll_amount']),
-            self.Action.SCROLL_DOWN: lambda: self._scroll(values["element"], -1*float(values['scroll_amount']))
+            self.Action.SCROLL_DOWN: lambda: self._scroll(values["element"], -1*float(values['scroll_amount'])),
+            self.Action.CLICK_SEQUENCE: lambda: self._click_sequence(values["steps"]),
+            self.Action.DRAG_AND_DROP_BY_PATH: lambda: self._drag_and_drop_by_path(values["element"],
+                                                                                   values["second_element"],
+                                                                                   values["drag_path"]),
+            self.Action.GET_CLICKABLE_POINT_STATISTICS: self._clickable_points.get_statistics
         }
 
         return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
@@ -198,45 +226,29 @@ class Mouse(ModuleInterface):
                     max_repeat: int = 5, timeout_between_repeats: int = 1000, ignore_if_already_open: bool = True):
         """
         Clicks on click element and expects the open element to be opened.
-        Trys for max_repeat times and sleeps between every try for timeout_between_repeats.
+        Trys for max_repeat times and waits after every try up to timeout_between_repeats for the open element.
         
         Raises:
             FlaUiError: If Click Element is not available.
             FlaUiError: If Open Element is not available after clicking for maximal times on Click Element.
         """
+        open_container = Element.create_value_container(xpath=open_element_xpath)
+
         try:
-            if ignore_if_already_open:
-                container = Element.create_value_container(xpath=open_element_xpath)
-                if self._element_module.execute_action(Element.Action.GET_ELEMENT_BY_XPATH, container):
-                    return True
+            if ignore_if_already_open and self._element_exists(open_container):
+                return True
 
             if focus_element_xpath_before_click:
-                container = Element.create_value_container(xpath=focus_element_xpath_before_click)
-                self._element_module.execute_action(Element.Action.FOCUS_ELEMENT, container)
-            _open_element_found = False
-            _click_element_found = False
-            for _ in range(max_repeat):
-                container = Element.create_value_container(xpath=click_element_xpath)
-                click_element = self._element_module.execute_action(Element.Action.GET_ELEMENT_BY_XPATH, container)
-
-                if click_element:
-                    _click_element_found = True
-                    click_type(click_element)
-
-                if _click_element_found:
-                    container = Element.create_value_container(xpath=open_element_xpath)
-                    open_element = self._element_module.execute_action(Element.Action.GET_ELEMENT_BY_XPATH, container)
-
-                    if open_element:
-                        _open_element_found = True
-                        if focus_element_xpath_after_open:
-                            container = Element.create_value_container(xpath=focus_element_xpath_after_open)
-                            self._element_module.execute_action(Element.Action.FOCUS_ELEMENT, container)
-                        return True
+                self._focus_element(focus_element_xpath_before_click)
 
-                time.sleep(float(timeout_between_repeats) / 1000)
+            click_element_found, opened = self._click_until(click_type, click_element_xpath, open_container, True,
+                                                            max_repeat, timeout_between_repeats)
+            if opened:
+                if focus_element_xpath_after_open:
+                    self._focus_element(focus_element_xpath_after_open)
+                return True
 
-            if not _click_element_found and not _open_element_found:
+            if not click_element_found:
                 raise FlaUiError(FlaUiError.ElementNotExists.format(click_element_xpath))
             raise FlaUiError(FlaUiError.ElementNotOpened.format(open_element_xpath, click_element_xpath))
         except NoClickablePointException:
@@ -247,143 +259,288 @@ class Mouse(ModuleInterface):
                      max_repeat: int = 5, timeout_between_repeats: int = 1000, ignore_if_already_close: bool = True):
         """
         Clicks on click element and expects the close element to be closed.
-        Trys for max_repeat time and sleeps between every try for timeout_between_repeats.
+        Trys for max_repeat time and waits after every try up to timeout_between_repeats for the close element.
         
         Raises:
             FlaUiError: If Click Element is not available and ignore_if_already_close set to False.
             FlaUiError: If Close Element is still available after clicking for maximal times on Click Element.
         """
+        close_container = Element.create_value_container(xpath=close_element_xpath)
+
         try:
-            if ignore_if_already_close:
-                container = Element.create_value_container(xpath=close_element_xpath)
-                if not self._element_module.execute_action(Element.Action.GET_ELEMENT_BY_XPATH, container):
-                    return True
+            if ignore_if_already_close and not self._element_exists(close_container):
+                return True
 
             if focus_element_xpath_before_click:
-                container = Element.create_value_container(xpath=focus_element_xpath_before_click)
-                self._element_module.execute_action(Element.Action.FOCUS_ELEMENT, container)
+                self._focus_element(focus_element_xpath_before_click)
 
-            _click_element_found = False
-            for _ in range(max_repeat):
-                container = Element.create_value_container(xpath=click_element_xpath)
-                click_element = self._element_module.execute_action(Element.Action.GET_ELEMENT_BY_XPATH, container)
+            click_element_found, closed = self._click_until(click_type, click_element_xpath, close_container, False,
+                                                            max_repeat, timeout_between_repeats)
+            if closed:
+                if focus_element_xpath_after_close:
+                    self._focus_element(focus_element_xpath_after_close)
+                return True
 
-                if click_element:
-                    _click_element_found = True
-                    click_type(click_element)
+            if not click_element_found:
+                raise FlaUiError(FlaUiError.ElementNotExists.format(click_element_xpath))
+            raise FlaUiError(FlaUiError.ElementNotClosed.format(close_element_xpath, click_element_xpath))
+        except NoClickablePointException:
+            raise FlaUiError(FlaUiError.ElementNotClickable) from None
 
-                if _click_element_found:
-                    container = Element.create_value_container(xpath=close_element_xpath)
-                    close_element = self._element_module.execute_action(Element.Action.GET_ELEMENT_BY_XPATH, container)
+    def _click_until(self, click_type, click_element_xpath: str, goal_container: Element.Container,
+                     goal_exists: bool, max_repeat: int, timeout_between_repeats: int):
+        """
+        Clicks on click element until goal element exists or does not exist anymore.
+        The click element is searched once and reused for all tries until it is not available anymore.
 
-                    if not close_element and _click_element_found:
-                        if focus_element_xpath_after_close:
-                            container = Element.create_value_container(xpath=focus_element_xpath_after_close)
-                            self._element_module.execute_action(Element.Action.FOCUS_ELEMENT, container)
-                        return True
+        Args:
+            click_type (Function): Click action to execute on click element.
+            click_element_xpath (String): XPath from element to click.
+            goal_container (Container): Element container with XPath from goal element.
+            goal_exists (Bool): True to wait until goal element exists, False to wait until it does not exist.
+            max_repeat (Number): Maximum number from clicks.
+            timeout_between_repeats (Number): Maximum time in ms to wait for goal element after each click.
+
+        Returns:
+            Pair from indicator if click element was found and if goal was reached.
+        """
+        click_container = Element.create_value_container(xpath=click_element_xpath)
+        click_element = None
+        click_element_found = False
 
+        for _ in range(int(max_repeat)):
+            if click_element is None:
+                click_element = self._element_module.execute_action(Element.Action.GET_ELEMENT_BY_XPATH,
+                                                                     click_container)
+
+            if not click_element:
+                click_element = None
                 time.sleep(float(timeout_between_repeats) / 1000)
+                continue
 
-            if not _click_element_found:
-                raise FlaUiError(FlaUiError.ElementNotExists.format(click_element_xpath))
-            raise FlaUiError(FlaUiError.ElementNotClosed.format(close_element_xpath, click_element_xpath))
-        except NoClickablePointException:
-            raise FlaUiError(FlaUiError.ElementNotClickable) from None
+            click_element_found = True
+            try:
+                click_type(click_element)
+            except ElementNotAvailableException:
+                click_element = None
+                continue
 
-    @staticmethod
-    def _click(element: Any):
-        try:
-            return element.Click()
-        except NoClickablePointException:
-            raise FlaUiError(FlaUiError.ElementNotClickable) from None
+            if self._wait_for_element(goal_container, goal_exists, timeout_between_repeats):
+                return click_element_found, True
+
+        return click_element_found, False
+
+    def _wait_for_element(self, container: Element.Container, exists: bool, timeout_in_ms: int):
+        """
+        Polls element until it exists or does not exist anymore or timeout occurs.
+
+        Args:
+            container (Container): Element container with XPath from element.
+            exists (Bool): True to wait until element exists, False to wait until it does not exist.
+            timeout_in_ms (Number): Maximum time to wait in ms.
+
+        Returns:
+            True if element reached the expected state otherwise False.
+        """
+        deadline = time.perf_counter() + float(timeout_in_ms) / 1000
+
+        while self._element_exists(container) != exists:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return False
+
+            time.sleep(min(remaining, Mouse.PollIntervalInMs / 1000))
+
+        return True
+
+    def _element_exists(self, container: Element.Container):
+        """
+        Checks if element from container exists.
+
+        Args:
+            container (Container): Element container with XPath from element.
+        """
+        return bool(self._element_module.execute_action(Element.Action.GET_ELEMENT_BY_XPATH, container))
+
+    def _focus_element(self, xpath: str):
+        """
+        Focus element by XPath.
+
+        Args:
+            xpath (String): XPath from element to focus.
+        """
+        self._element_module.execute_action(Element.Action.FOCUS_ELEMENT, Element.create_value_container(xpath=xpath))
 
     @staticmethod
-    def _click_hold(element: Any, timeout_in_ms: int):
+    def get_click_step(step: str):
+        """
+        Get click action and xpath from a click sequence step like 'DOUBLE_CLICK:<XPATH>'.
+        Steps without a supported click action prefix are left clicks.
+
+        Args:
+            step (String): Click sequence step.
+
+        Returns:
+            Pair from click action and xpath.
+        """
+        prefix, separator, xpath = step.partition(Mouse.ClickSequenceSeparator)
+        action = Mouse.Action.__members__.get(prefix.strip().upper()) if separator else None
+
+        if action in Mouse.ClickSequenceActions:
+            return action, xpath.strip()
+
+        return Mouse.Action.LEFT_CLICK, step
+
+    def _click_sequence(self, steps: List[Tuple[Any, Any]]):
+        """
+        Clicks all elements back to back. Clickable points from all elements are computed before the first click.
+
+        Args:
+            steps (List): Pairs from click action and element to click.
+
+        Raises:
+            FlaUiError: If an element from a step is not clickable.
+        """
+        points = []
+
+        for index, (_, element) in enumerate(steps, start=1):
+            try:
+                points.append(self._clickable_points.get_clickable_point(element))
+            except NoClickablePointException:
+                raise FlaUiError(FlaUiError.ClickSequenceStepFailed.format(index, FlaUiError.ElementNotClickable)) \
+                    from None
+
+        for (action, _), point in zip(steps, points):
+            if action == Mouse.Action.DOUBLE_CLICK:
+                FlaUIMouse.DoubleClick(point, MouseButton.Left)
+            elif action == Mouse.Action.RIGHT_CLICK:
+                FlaUIMouse.Click(point, MouseButton.Right)
+            elif action == Mouse.Action.MIDDLE_CLICK:
+                FlaUIMouse.Click(point, MouseButton.Middle)
+            else:
+                FlaUIMouse.Click(point, MouseButton.Left)
+
+    def _click(self, element: Any):
         try:
-            FlaUI.Core.Input.Mouse.Position = element.GetClickablePoint()
+            return FlaUIMouse.Click(self._clickable_points.get_clickable_point(element), MouseButton.Left)
         except NoClickablePointException:
             raise FlaUiError(FlaUiError.ElementNotClickable) from None
-        FlaUI.Core.Input.Mouse.Down()
-        time.sleep(float(timeout_in_ms) / 1000)
-        FlaUI.Core.Input.Mouse.Up()
 
-    @staticmethod
-    def _click_hold_relay(holdtime):
+    def _click_hold(self, element: Any, timeout_in_ms: int, callback: Optional[Callable[[], Any]] = None):
+        return self._hold(element, MouseButton.Left, timeout_in_ms, callback)
+
+    def _click_hold_relay(self, holdtime):
         def _f(element):
-            Mouse._click_hold(element, holdtime)
+            self._click_hold(element, holdtime)
         return _f
 
-    @staticmethod
-    def _scroll(element: Any, scroll_amount: float):
+    def _scroll(self, element: Any, scroll_amount: float):
         try:
-            FlaUI.Core.Input.Mouse.Position = element.GetClickablePoint()
+            FlaUI.Core.Input.Mouse.Position = self._clickable_points.get_clickable_point(element)
         except NoClickablePointException:
             raise FlaUiError(FlaUiError.ElementNotClickable) from None
         FlaUI.Core.Input.Mouse.Scroll(float(scroll_amount))
 
-    @staticmethod
-    def _middle_click(element: Any):
+    def _middle_click(self, element: Any):
         try:
-            return FlaUIMouse.Click(element.GetClickablePoint(), MouseButton.Middle)
+            return FlaUIMouse.Click(self._clickable_points.get_clickable_point(element), MouseButton.Middle)
         except NoClickablePointException:
             raise FlaUiError(FlaUiError.ElementNotClickable) from None
 
-    @staticmethod
-    def _middle_click_hold(element: Any, timeout_in_ms: int):
+    def _middle_click_hold(self, element: Any, timeout_in_ms: int, callback: Optional[Callable[[], Any]] = None):
+        return self._hold(element, MouseButton.Middle, timeout_in_ms, callback)
+
+    def _right_click(self, element: Any):
         try:
-            FlaUI.Core.Input.Mouse.Position = element.GetClickablePoint()
+            return FlaUIMouse.Click(self._clickable_points.get_clickable_point(element), MouseButton.Right)
         except NoClickablePointException:
             raise FlaUiError(FlaUiError.ElementNotClickable) from None
-        FlaUI.Core.Input.Mouse.Down(FlaUI.Core.Input.MouseButton.Middle)
-        time.sleep(float(timeout_in_ms) / 1000)
-        FlaUI.Core.Input.Mouse.Up(FlaUI.Core.Input.MouseButton.Middle)
 
-    @staticmethod
-    def _right_click(element: Any):
+    def _right_click_hold(self, element: Any, timeout_in_ms: int, callback: Optional[Callable[[], Any]] = None):
+        return self._hold(element, MouseButton.Right, timeout_in_ms, callback)
+
+    def _double_click(self, element: Any):
         try:
-            return element.RightClick()
+            return FlaUIMouse.DoubleClick(self._clickable_points.get_clickable_point(element), MouseButton.Left)
         except NoClickablePointException:
             raise FlaUiError(FlaUiError.ElementNotClickable) from None
 
-    @staticmethod
-    def _right_click_hold(element: Any, timeout_in_ms: int):
+    def _double_click_hold(self, element: Any, timeout_in_ms: int, callback: Optional[Callable[[], Any]] = None):
+        return self._hold(element, MouseButton.Left, timeout_in_ms, callback, double_click=True)
+
+    def _hold(self, element: Any, button: Any, timeout_in_ms: int, callback: Optional[Callable[[], Any]] = None,
+              double_click: bool = False):
+        """
+        Presses mouse button on element and releases it after hold time measured by a high resolution timer.
+
+        Args:
+            element (Object): Element to hold mouse button on.
+            button (Object): MouseButton from FlaUI to hold.
+            timeout_in_ms (Number): Hold time in ms.
+            callback (Function): Optional function to execute while mouse button is held.
+            double_click (Bool): Click once before mouse button is held.
+
+        Returns:
+            Result from callback.
+        """
         try:
-            FlaUI.Core.Input.Mouse.Position = element.GetClickablePoint()
+            FlaUI.Core.Input.Mouse.Position = self._clickable_points.get_clickable_point(element)
         except NoClickablePointException:
             raise FlaUiError(FlaUiError.ElementNotClickable) from None
-        FlaUI.Core.Input.Mouse.Down(FlaUI.Core.Input.MouseButton.Right)
-        time.sleep(float(timeout_in_ms) / 1000)
-        FlaUI.Core.Input.Mouse.Up(FlaUI.Core.Input.MouseButton.Right)
 
-    @staticmethod
-    def _double_click(element: Any):
+        if double_click:
+            FlaUI.Core.Input.Mouse.Down(button)
+            FlaUI.Core.Input.Mouse.Up(button)
+
+        FlaUI.Core.Input.Mouse.Down(button)
         try:
-            return element.DoubleClick()
-        except NoClickablePointException:
-            raise FlaUiError(FlaUiError.ElementNotClickable) from None
+            return PreciseTimer.run_for(float(timeout_in_ms) / 1000, callback)
+        finally:
+            FlaUI.Core.Input.Mouse.Up(button)
 
-    @staticmethod
-    def _double_click_hold(element: Any, timeout_in_ms: int):
+    def _move_to(self, element: Any):
         try:
-            FlaUI.Core.Input.Mouse.Position = element.GetClickablePoint()
+            FlaUI.Core.Input.Mouse.MoveTo(self._clickable_points.get_clickable_point(element))
         except NoClickablePointException:
             raise FlaUiError(FlaUiError.ElementNotClickable) from None
-        FlaUI.Core.Input.Mouse.Down()
-        FlaUI.Core.Input.Mouse.Up()
-        FlaUI.Core.Input.Mouse.Down()
-        time.sleep(float(timeout_in_ms) / 1000)
-        FlaUI.Core.Input.Mouse.Up()
 
-    @staticmethod
-    def _move_to(element: Any):
+    def _drag_and_drop(self, element_from: Any, element_to: Any):
         try:
-            FlaUI.Core.Input.Mouse.MoveTo(element.GetClickablePoint())
+            FlaUI.Core.Input.Mouse.Drag(self._clickable_points.get_clickable_point(element_from),
+                                        self._clickable_points.get_clickable_point(element_to))
         except NoClickablePointException:
             raise FlaUiError(FlaUiError.ElementNotClickable) from None
 
-    @staticmethod
-    def _drag_and_drop(element_from: Any, element_to: Any):
+    def _drag_and_drop_by_path(self, element_from: Any, element_to: Any, drag_path: DragPath):
+        """
+        Drags from element to element by all moves planned from drag path.
+
+        Args:
+            element_from (Object): Element to start drag from.
+            element_to (Object): Element to drop on.
+            drag_path (DragPath): Planner for mouse moves between both elements.
+
+        Returns:
+            Count from mouse moves.
+        """
         try:
-            FlaUI.Core.Input.Mouse.Drag(element_from.GetClickablePoint(), element_to.GetClickablePoint())
+            start = self._clickable_points.get_clickable_point(element_from)
+            end = self._clickable_points.get_clickable_point(element_to)
         except NoClickablePointException:
             raise FlaUiError(FlaUiError.ElementNotClickable) from None
+
+        steps = drag_path.plan((start.X, start.Y), (end.X, end.Y))
+
+        FlaUI.Core.Input.Mouse.Position = start
+        FlaUI.Core.Input.Mouse.Down(MouseButton.Left)
+        try:
+            PreciseTimer.sleep(drag_path.hover)
+            begin = time.perf_counter()
+            for step in steps:
+                PreciseTimer.sleep_until(begin + step.time)
+                FlaUI.Core.Input.Mouse.Position = Point(step.x, step.y)
+            PreciseTimer.sleep(drag_path.hover)
+        finally:
+            FlaUI.Core.Input.Mouse.Up(MouseButton.Left)
+
+        return len(steps)
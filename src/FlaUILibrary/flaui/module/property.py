@@ -1,10 +1,11 @@
 from enum import Enum
-from typing import Optional, Any
+from typing import Optional, Any, Callable, Dict, List, Tuple
 from FlaUI.UIA2.Identifiers import TextAttributes as AttributesUia2  # pylint: disable=import-error
 from FlaUI.UIA3.Identifiers import TextAttributes as AttributesUia3  # pylint: disable=import-error
 from FlaUI.Core.Definitions import WindowVisualState  # pylint: disable=import-error
 from FlaUILibrary.flaui.exception import FlaUiError
 from FlaUILibrary.flaui.interface import (ModuleInterface, ValueContainer)
+from FlaUILibrary.flaui.util.patterncache import PatternCache
 
 class Property(ModuleInterface):
     """
@@ -17,6 +18,7 @@ class Property(ModuleInterface):
         """
         element: Optional[Any]
         uia: str
+        properties: Optional[List[Any]]
 
     class Action(Enum):
         """Supported actions for execute action implementation."""
@@ -50,132 +52,191 @@ class Property(ModuleInterface):
         IS_SELECTION_ITEM_PATTERN_SUPPORTED = "IS_SELECTION_ITEM_PATTERN_SUPPORTED"
         IS_SELECTED = "IS_SELECTED"
         STAGE_FOR_COMBOBOX_SELECTIONITEM = "STAGE_FOR_COMBOBOX_SELECTIONITEM"
+        GET_PROPERTIES = "GET_PROPERTIES"
+
+    class Source(Enum):
+        """Sources from element to read property values. Each source is fetched once per property read."""
+        ELEMENT = "ELEMENT"
+        DOCUMENT_RANGE = "DOCUMENT_RANGE"
+        WINDOW = "WINDOW"
+        TOGGLE = "TOGGLE"
+        READ_ONLY = "READ_ONLY"
+        VALUE = "VALUE"
+        RANGEVALUE = "RANGEVALUE"
+        EXPAND_COLLAPSE = "EXPAND_COLLAPSE"
+        SELECTION_ITEM = "SELECTION_ITEM"
 
     @staticmethod
-    def create_value_container(element: Any = None, uia: str = None) -> Container:
+    def create_value_container(element: Any = None, uia: str = None,
+                               properties: Optional[List[Any]] = None) -> Container:
         """
         Helper to create container object.
 
         Args:
             element (Object): Element to grab property.
             uia (string): User interface identifier
+            properties (List): Property actions to read at once
         """
-        return Property.Container(element=element, uia=uia)
+        return Property.Container(element=element, uia=uia, properties=properties)
 
     def execute_action(self, action: Action, values: Container):
-        switcher = {
-            self.Action.FOREGROUND_COLOR: lambda: self._get_foreground_color(values["element"], values["uia"]),
-            self.Action.BACKGROUND_COLOR: lambda: self._get_background_color(values["element"], values["uia"]),
-            self.Action.FONT_SIZE: lambda: self._get_font_size(values["element"], values["uia"]),
-            self.Action.FONT_NAME: lambda: self._get_font_name(values["element"], values["uia"]),
-            self.Action.FONT_WEIGHT: lambda: self._get_font_weight(values["element"], values["uia"]),
-            self.Action.CULTURE: lambda: self._get_culture(values["element"], values["uia"]),
-            self.Action.IS_HIDDEN: lambda: self._is_hidden(values["element"], values["uia"]),
-            self.Action.WINDOW_VISUAL_STATE: lambda: self._get_window_visual_state(values["element"]),
-            self.Action.WINDOW_INTERACTION_STATE: lambda: self._get_window_interaction_state(values["element"]),
-            self.Action.TOGGLE_STATE: lambda: self._get_toggle_state(values["element"]),
+        switcher = dict.fromkeys(self._get_property_readers(),
+                                 lambda: self._get_property(values["element"], action, values["uia"]))
+        switcher.update({
             self.Action.MAXIMIZE_WINDOW: lambda: self._set_window_visual_state(values["element"],
                                                                                WindowVisualState.Maximized),
             self.Action.MINIMIZE_WINDOW: lambda: self._set_window_visual_state(values["element"],
                                                                                WindowVisualState.Minimized),
             self.Action.NORMALIZE_WINDOW: lambda: self._set_window_visual_state(values["element"],
                                                                                 WindowVisualState.Normal),
-            self.Action.CAN_WINDOW_MAXIMIZE: lambda: self._can_window_maximize(values["element"]),
-            self.Action.CAN_WINDOW_MINIMIZE: lambda: self._can_window_minimize(values["element"]),
-            self.Action.IS_READ_ONLY: lambda: self._is_read_only(values["element"]),
-            self.Action.IS_WINDOW_PATTERN_SUPPORTED: lambda: self._is_window_pattern_supported(values["element"]),
-            self.Action.IS_TEXT_PATTERN_SUPPORTED: lambda: self._is_text_pattern_supported(values["element"]),
-            self.Action.IS_TOGGLE_PATTERN_SUPPORTED: lambda: self._is_toggle_pattern_supported(values["element"]),
-            self.Action.IS_VALUE_PATTERN_SUPPORTED: lambda: self._is_value_pattern_supported(values["element"]),
-            self.Action.IS_RANGEVALUE_PATTERN_SUPPORTED: \
-                lambda: self._is_rangevalue_pattern_supported(values["element"]),
-            self.Action.VALUE: lambda: self._get_value_from_value_pattern(values["element"]),
-            self.Action.RANGEVALUE: lambda: self._get_value_from_rangevalue_pattern(values["element"]),
-            self.Action.RANGEMINIMUM: lambda: self._get_minimum_from_rangevalue_pattern(values["element"]),
-            self.Action.RANGEMAXIMUM: lambda: self._get_maximum_from_rangevalue_pattern(values["element"]),
-            self.Action.IS_EXPAND_COLLAPSE_PATTERN_SUPPORTED: lambda: self._is_expand_collapse_pattern_supported(
-                values["element"]),
-            self.Action.EXPAND_COLLAPSE_STATE: lambda: self._get_expand_collapse_pattern_state(values["element"]),
-            self.Action.IS_SELECTION_ITEM_PATTERN_SUPPORTED: lambda: self._is_selection_item_pattern_supported(
-                values["element"]),
-            self.Action.IS_SELECTED: lambda: self._is_selected(values["element"]),
             self.Action.STAGE_FOR_COMBOBOX_SELECTIONITEM: lambda: self._stage_for_combobox_selectionitem(
                 values["element"]),
-        }
+            self.Action.GET_PROPERTIES: lambda: self._get_properties(values["element"],
+                                                                     values["properties"],
+                                                                     values["uia"]),
+        })
 
         return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
 
     @staticmethod
-    def _get_window_visual_state(element: Any) -> str:
-        pattern = Property._get_window_pattern_from_element(element)
-        return str(pattern.WindowVisualState.Value.ToString())
+    def _get_property_readers() -> Dict[Action, Tuple[Source, Callable[[Any, str], Any]]]:
+        """
+        Get all readable properties with the source to fetch from element and a reader to get the value from source.
+        Properties from the same source are read from one fetched pattern or document range.
+        """
+        action = Property.Action
+        source = Property.Source
+        return {
+            action.FOREGROUND_COLOR: (source.DOCUMENT_RANGE, lambda document_range, uia: Property._int_to_rgba(
+                Property._get_text_attribute(document_range, uia, "ForegroundColor"))),
+            action.BACKGROUND_COLOR: (source.DOCUMENT_RANGE, lambda document_range, uia: Property._int_to_rgba(
+                Property._get_text_attribute(document_range, uia, "BackgroundColor"))),
+            action.FONT_SIZE: (source.DOCUMENT_RANGE, lambda document_range, uia: float(
+                Property._get_text_attribute(document_range, uia, "FontSize"))),
+            action.FONT_NAME: (source.DOCUMENT_RANGE, lambda document_range, uia: str(
+                Property._get_text_attribute(document_range, uia, "FontName"))),
+            action.FONT_WEIGHT: (source.DOCUMENT_RANGE, lambda document_range, uia: float(
+                Property._get_text_attribute(document_range, uia, "FontWeight"))),
+            action.CULTURE: (source.DOCUMENT_RANGE, Property._get_culture),
+            action.IS_HIDDEN: (source.DOCUMENT_RANGE, lambda document_range, uia: Property._prop_to_bool(
+                Property._get_text_attribute(document_range, uia, "IsHidden"))),
+            action.WINDOW_VISUAL_STATE: (source.WINDOW, lambda pattern, _: str(
+                pattern.WindowVisualState.Value.ToString())),
+            action.WINDOW_INTERACTION_STATE: (source.WINDOW, lambda pattern, _: str(
+                pattern.WindowInteractionState.Value.ToString())),
+            action.CAN_WINDOW_MINIMIZE: (source.WINDOW, lambda pattern, _: Property._prop_to_bool(
+                pattern.CanMinimize)),
+            action.CAN_WINDOW_MAXIMIZE: (source.WINDOW, lambda pattern, _: Property._prop_to_bool(
+                pattern.CanMaximize)),
+            action.TOGGLE_STATE: (source.TOGGLE, lambda pattern, _: str(
+                pattern.ToggleState.Value.ToString()).upper()),
+            action.IS_READ_ONLY: (source.READ_ONLY, lambda pattern, _: Property._prop_to_bool(pattern.IsReadOnly)),
+            action.VALUE: (source.VALUE, lambda pattern, _: str(pattern.Value)),
+            action.RANGEVALUE: (source.RANGEVALUE, lambda pattern, _: str(pattern.Value)),
+            action.RANGEMINIMUM: (source.RANGEVALUE, lambda pattern, _: str(pattern.Minimum)),
+            action.RANGEMAXIMUM: (source.RANGEVALUE, lambda pattern, _: str(pattern.Maximum)),
+            action.EXPAND_COLLAPSE_STATE: (source.EXPAND_COLLAPSE, lambda pattern, _: str(
+                pattern.ExpandCollapseState)),
+            action.IS_SELECTED: (source.SELECTION_ITEM, lambda pattern, _: Property._prop_to_bool(
+                pattern.IsSelected)),
+            action.IS_WINDOW_PATTERN_SUPPORTED: (source.ELEMENT, lambda element, _: (
+                Property._is_window_pattern_supported(element))),
+            action.IS_TEXT_PATTERN_SUPPORTED: (source.ELEMENT, lambda element, _: (
+                Property._is_text_pattern_supported(element))),
+            action.IS_TOGGLE_PATTERN_SUPPORTED: (source.ELEMENT, lambda element, _: (
+                Property._is_toggle_pattern_supported(element))),
+            action.IS_VALUE_PATTERN_SUPPORTED: (source.ELEMENT, lambda element, _: (
+                Property._is_value_pattern_supported(element))),
+            action.IS_RANGEVALUE_PATTERN_SUPPORTED: (source.ELEMENT, lambda element, _: (
+                Property._is_rangevalue_pattern_supported(element))),
+            action.IS_EXPAND_COLLAPSE_PATTERN_SUPPORTED: (source.ELEMENT, lambda element, _: (
+                Property._is_expand_collapse_pattern_supported(element))),
+            action.IS_SELECTION_ITEM_PATTERN_SUPPORTED: (source.ELEMENT, lambda element, _: (
+                Property._is_selection_item_pattern_supported(element))),
+        }
 
     @staticmethod
-    def _get_foreground_color(element: Any, uia: str) -> int:
-        pattern = Property._get_text_pattern_from_element(element)
-        if uia == "UIA2":
-            return Property._int_to_rgba(pattern.DocumentRange.GetAttributeValue(AttributesUia2.ForegroundColor))
+    def _get_source(element: Any, source: Source) -> Any:
+        """
+        Fetch source from element to read property values.
+
+        Args:
+            element (Object): Element to fetch source from.
+            source (Source): Source to fetch.
+        """
+        switcher = {
+            Property.Source.ELEMENT: lambda: element,
+            Property.Source.DOCUMENT_RANGE: lambda: Property._get_text_pattern_from_element(element).DocumentRange,
+            Property.Source.WINDOW: lambda: Property._get_window_pattern_from_element(element),
+            Property.Source.TOGGLE: lambda: Property._get_toggle_pattern_from_element(element),
+            Property.Source.READ_ONLY: lambda: Property._get_read_only_pattern_from_element(element),
+            Property.Source.VALUE: lambda: Property._get_value_pattern_from_element(element),
+            Property.Source.RANGEVALUE: lambda: Property._get_rangevalue_pattern_from_element(element),
+            Property.Source.EXPAND_COLLAPSE: lambda: Property._get_expand_collapse_pattern_from_element(element),
+            Property.Source.SELECTION_ITEM: lambda: Property._get_selection_item_pattern_from_element(element),
+        }
 
-        return Property._int_to_rgba(pattern.DocumentRange.GetAttributeValue(AttributesUia3.ForegroundColor))
+        return switcher[source]()
 
     @staticmethod
-    def _get_background_color(element: Any, uia: str) -> (int, int, int, int):
-        pattern = Property._get_text_pattern_from_element(element)
-        if uia == "UIA2":
-            return Property._int_to_rgba(pattern.DocumentRange.GetAttributeValue(AttributesUia2.BackgroundColor))
+    def _get_property(element: Any, action: Action, uia: str) -> Any:
+        """
+        Get a single property value from element.
 
-        return Property._int_to_rgba(pattern.DocumentRange.GetAttributeValue(AttributesUia3.BackgroundColor))
+        Args:
+            element (Object): Element to read property from.
+            action (Action): Property to read.
+            uia (String): User interface identifier.
+        """
+        source, reader = Property._get_property_readers()[action]
+        return reader(Property._get_source(element, source), uia)
 
     @staticmethod
-    def _get_font_size(element: Any, uia: str) -> (int, int, int, int):
-        pattern = Property._get_text_pattern_from_element(element)
-        if uia == "UIA2":
-            return float(pattern.DocumentRange.GetAttributeValue(AttributesUia2.FontSize))
+    def _get_properties(element: Any, actions: List[Action], uia: str) -> Dict[str, Any]:
+        """
+        Get many property values from element. Properties are grouped by their source, so each pattern and the text
+        document range is fetched only once from element.
 
-        return float(pattern.DocumentRange.GetAttributeValue(AttributesUia3.FontSize))
+        Args:
+            element (Object): Element to read properties from.
+            actions (List): Properties to read.
+            uia (String): User interface identifier.
 
-    @staticmethod
-    def _get_font_name(element: Any, uia: str) -> str:
-        pattern = Property._get_text_pattern_from_element(element)
-        if uia == "UIA2":
-            return str(pattern.DocumentRange.GetAttributeValue(AttributesUia2.FontName))
+        Returns:
+            Dictionary from property name to property value in requested order.
+        """
+        readers = Property._get_property_readers()
+        sources = {}
+        properties = {}
 
-        return str(pattern.DocumentRange.GetAttributeValue(AttributesUia3.FontName))
+        for action in actions:
+            source, reader = readers[action]
+            if source not in sources:
+                sources[source] = Property._get_source(element, source)
+            properties[action.value] = reader(sources[source], uia)
+
+        return properties
 
     @staticmethod
-    def _get_font_weight(element: Any, uia: str) -> float:
-        pattern = Property._get_text_pattern_from_element(element)
-        if uia == "UIA2":
-            return float(pattern.DocumentRange.GetAttributeValue(AttributesUia2.FontWeight))
+    def _get_text_attribute(document_range: Any, uia: str, name: str) -> Any:
+        """
+        Get text attribute value by name from document range.
 
-        return float(pattern.DocumentRange.GetAttributeValue(AttributesUia3.FontWeight))
+        Args:
+            document_range (Object): Document range from text pattern.
+            uia (String): User interface identifier.
+            name (String): Text attribute name.
+        """
+        attributes = AttributesUia2 if uia == "UIA2" else AttributesUia3
+        return document_range.GetAttributeValue(getattr(attributes, name))
 
     @staticmethod
-    def _get_culture(element: Any, uia: str) -> str:
-        pattern = Property._get_text_pattern_from_element(element)
+    def _get_culture(document_range: Any, uia: str) -> str:
         if uia == "UIA2":
             # See --> https://github.com/FlaUI/FlaUI/issues/554
             raise FlaUiError(FlaUiError.PropertyNotSupported)
 
-        return str(pattern.DocumentRange.GetAttributeValue(AttributesUia3.Culture).ToString())
-
-    @staticmethod
-    def _is_hidden(element: Any, uia: str) -> bool:
-        pattern = Property._get_text_pattern_from_element(element)
-        if uia == "UIA2":
-            return Property._prop_to_bool(pattern.DocumentRange.GetAttributeValue(AttributesUia2.IsHidden))
-
-        return Property._prop_to_bool(pattern.DocumentRange.GetAttributeValue(AttributesUia3.IsHidden))
-
-    @staticmethod
-    def _get_toggle_state(element: Any) -> str:
-        pattern = Property._get_toggle_pattern_from_element(element)
-        return str(pattern.ToggleState.Value.ToString()).upper()
-
-    @staticmethod
-    def _get_window_interaction_state(element: Any) -> str:
-        pattern = Property._get_window_pattern_from_element(element)
-        return str(pattern.WindowInteractionState.Value.ToString())
+        return str(document_range.GetAttributeValue(AttributesUia3.Culture).ToString())
 
     @staticmethod
     def _get_text_pattern_from_element(element) -> Any:
@@ -204,57 +265,47 @@ class Property(ModuleInterface):
 
         raise FlaUiError(FlaUiError.PropertyNotSupported)
 
-    @staticmethod
-    def _can_window_minimize(element: Any) -> bool:
-        pattern = Property._get_window_pattern_from_element(element)
-        return Property._prop_to_bool(pattern.CanMinimize)
-
-    @staticmethod
-    def _can_window_maximize(element: Any) -> bool:
-        pattern = Property._get_window_pattern_from_element(element)
-        return Property._prop_to_bool(pattern.CanMaximize)
-
     @staticmethod
     def _set_window_visual_state(element: Any, window_visual_state: Any) -> None:
         pattern = Property._get_window_pattern_from_element(element)
         pattern.SetWindowVisualState(window_visual_state)
 
     @staticmethod
-    def _is_read_only(element: Any) -> bool:
+    def _get_read_only_pattern_from_element(element) -> Any:
         if Property._is_value_pattern_supported(element):
             pattern = element.Patterns.Value.Pattern
             if pattern is not None:
-                return Property._prop_to_bool(pattern.IsReadOnly)
+                return pattern
 
         raise FlaUiError(FlaUiError.PropertyNotSupported)
 
     @staticmethod
     def _is_window_pattern_supported(element: Any) -> bool:
-        return Property._prop_to_bool(element.Patterns.Window.IsSupported)
+        return PatternCache.is_supported(element, "Window")
 
     @staticmethod
     def _is_text_pattern_supported(element: Any) -> bool:
-        return Property._prop_to_bool(element.Patterns.Text.IsSupported)
+        return PatternCache.is_supported(element, "Text")
 
     @staticmethod
     def _is_toggle_pattern_supported(element: Any) -> bool:
-        return Property._prop_to_bool(element.Patterns.Toggle.IsSupported)
+        return PatternCache.is_supported(element, "Toggle")
 
     @staticmethod
     def _is_value_pattern_supported(element: Any) -> bool:
-        return Property._prop_to_bool(element.Patterns.Value.IsSupported)
+        return PatternCache.is_supported(element, "Value")
 
     @staticmethod
     def _is_rangevalue_pattern_supported(element: Any) -> bool:
-        return Property._prop_to_bool(element.Patterns.RangeValue.IsSupported)
+        return PatternCache.is_supported(element, "RangeValue")
 
     @staticmethod
     def _is_expand_collapse_pattern_supported(element: Any) -> bool:
-        return Property._prop_to_bool(element.Patterns.ExpandCollapse.IsSupported)
+        return PatternCache.is_supported(element, "ExpandCollapse")
 
     @staticmethod
     def _is_selection_item_pattern_supported(element: Any) -> bool:
-        return Property._prop_to_bool(element.Patterns.SelectionItem.IsSupported)
+        return PatternCache.is_supported(element, "SelectionItem")
 
     @staticmethod
     def _int_to_rgba(argb_int: int) -> (int, int, int, int):
@@ -282,11 +333,6 @@ class Property(ModuleInterface):
 
         raise FlaUiError(FlaUiError.PatternNotSupported.format("ExpandCollapse"))
 
-    @staticmethod
-    def _get_expand_collapse_pattern_state(element: Any) -> str:
-        pattern = Property._get_expand_collapse_pattern_from_element(element)
-        return str(pattern.ExpandCollapseState)
-
     @staticmethod
     def _get_value_pattern_from_element(element) -> Any:
         if Property._is_value_pattern_supported(element):
@@ -296,11 +342,6 @@ class Property(ModuleInterface):
 
         raise FlaUiError(FlaUiError.PatternNotSupported.format("Value"))
 
-    @staticmethod
-    def _get_value_from_value_pattern(element: Any) -> str:
-        pattern = Property._get_value_pattern_from_element(element)
-        return str(pattern.Value)
-
     @staticmethod
     def _get_rangevalue_pattern_from_element(element) -> Any:
         if Property._is_rangevalue_pattern_supported(element):
@@ -310,21 +351,6 @@ class Property(ModuleInterface):
 
         raise FlaUiError(FlaUiError.PatternNotSupported.format("RangeValue"))
 
-    @staticmethod
-    def _get_value_from_rangevalue_pattern(element: Any) -> str:
-        pattern = Property._get_rangevalue_pattern_from_element(element)
-        return str(pattern.Value)
-
-    @staticmethod
-    def _get_minimum_from_rangevalue_pattern(element: Any) -> str:
-        pattern = Property._get_rangevalue_pattern_from_element(element)
-        return str(pattern.Minimum)
-
-    @staticmethod
-    def _get_maximum_from_rangevalue_pattern(element: Any) -> str:
-        pattern = Property._get_rangevalue_pattern_from_element(element)
-        return str(pattern.Maximum)
-
     @staticmethod
     def _get_selection_item_pattern_from_element(element) -> Any:
         if Property._is_selection_item_pattern_supported(element):
@@ -334,14 +360,9 @@ class Property(ModuleInterface):
 
         raise FlaUiError(FlaUiError.PatternNotSupported.format("SelectionItem"))
 
-    @staticmethod
-    def _is_selected(element: Any) -> str:
-        pattern = Property._get_selection_item_pattern_from_element(element)
-        return Property._prop_to_bool(pattern.IsSelected)
-
     @staticmethod
     def _stage_for_combobox_selectionitem(element):
-        state = Property._get_expand_collapse_pattern_state(element)
+        state = Property._get_property(element, Property.Action.EXPAND_COLLAPSE_STATE, None)
         if state == "Expanded":
             element.Collapse()
         if state == "Collapsed":
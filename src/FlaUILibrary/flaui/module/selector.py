@@ -1,9 +1,13 @@
 from enum import Enum
-from typing import Optional, Any
+from typing import Optional, Any, List
 from System import InvalidOperationException  # pylint: disable=import-error
+from FlaUI.Core.Definitions import ControlType  # pylint: disable=import-error
 from FlaUILibrary.flaui.exception import FlaUiError
 from FlaUILibrary.flaui.interface import (ModuleInterface, ValueContainer)
 from FlaUILibrary.flaui.util.converter import Converter
+from FlaUILibrary.flaui.util.selectoritems import SelectorItems
+from FlaUILibrary.flaui.util.comboboxcache import ComboboxCache
+from FlaUILibrary.flaui.util.patterncache import PatternCache
 
 
 class Selector(ModuleInterface):
@@ -13,29 +17,39 @@ class Selector(ModuleInterface):
     https://docs.microsoft.com/de-de/dotnet/api/system.windows.controls.primitives.selector?view=net-5.0
     """
 
+    def __init__(self):
+        self._combobox_cache = ComboboxCache()
+
     class Container(ValueContainer):
         """
         Value container from selector module.
         """
         index: Optional[int]
         name: Optional[str]
+        names: Optional[List[str]]
+        indices: Optional[List[int]]
         element: Optional[Any]
 
     class Action(Enum):
         """Supported actions for execute action implementation."""
         SELECT_ITEM_BY_INDEX = "SELECT_ITEM_BY_INDEX"
         SELECT_ITEM_BY_NAME = "SELECT_ITEM_BY_NAME"
+        SELECT_ITEMS_BY_NAMES = "SELECT_ITEMS_BY_NAMES"
+        SELECT_ITEMS_BY_INDICES = "SELECT_ITEMS_BY_INDICES"
         SHOULD_CONTAIN = "SHOULD_CONTAIN"
         SHOULD_NOT_CONTAIN = "SHOULD_NOT_CONTAIN"
+        SHOULD_CONTAIN_ITEMS = "SHOULD_CONTAIN_ITEMS"
         GET_ITEMS_COUNT = "GET_ITEMS_COUNT"
         GET_ALL_NAMES_FROM_SELECTION = "GET_ALL_NAMES_FROM_SELECTION"
         SHOULD_HAVE_SELECTED_ITEM = "SHOULD_HAVE_SELECTED_ITEM"
         GET_ALL_TEXTS_FROM_SELECTION = "GET_ALL_TEXTS_FROM_SELECTION"
         GET_ALL_NAMES = "GET_ALL_NAMES"
         GET_ALL_TEXTS = "GET_ALL_TEXTS"
+        GET_SNAPSHOT = "GET_SNAPSHOT"
+        INVALIDATE_ITEMS = "INVALIDATE_ITEMS"
 
     @staticmethod
-    def create_value_container(element=None, index=None, name=None, msg=None):
+    def create_value_container(element=None, index=None, name=None, names=None, indices=None, msg=None):
         """
         Helper to create container object.
 
@@ -46,11 +60,15 @@ class Selector(ModuleInterface):
             element (Object): ListBox or Combobox elements.
             index (Number): Number to select from element
             name (String): Name from element to select
+            names (List): Names from elements to use
+            indices (List): Numbers from elements to use
             msg (String): Optional error message
         """
         return Selector.Container(name=Converter.cast_to_string(name),
+                                  names=Converter.cast_to_string_list(names),
                                   element=None if not element else element,
-                                  index=Converter.cast_to_int(index, msg))
+                                  index=Converter.cast_to_int(index, msg),
+                                  indices=Converter.cast_to_int_list(indices, msg))
 
     def execute_action(self, action: Action, values: Container):
         """If action is not supported an ActionNotSupported error will be raised.
@@ -67,10 +85,16 @@ class Selector(ModuleInterface):
                 lambda: self._select_by_index(values["element"], values["index"]),
             self.Action.SELECT_ITEM_BY_NAME:
                 lambda: self._select_by_name(values["element"], values["name"]),
+            self.Action.SELECT_ITEMS_BY_NAMES:
+                lambda: self._select_by_names(values["element"], values["names"]),
+            self.Action.SELECT_ITEMS_BY_INDICES:
+                lambda: self._select_by_indices(values["element"], values["indices"]),
             self.Action.SHOULD_CONTAIN:
                 lambda: self._should_contain(values["element"], values["name"]),
             self.Action.SHOULD_NOT_CONTAIN:
                 lambda: self._should_not_contain(values["element"], values["name"]),
+            self.Action.SHOULD_CONTAIN_ITEMS:
+                lambda: self._should_contain_items(values["element"], values["names"]),
             self.Action.SHOULD_HAVE_SELECTED_ITEM:
                 lambda: self._should_have_selected_item(values["element"], values["name"]),
             self.Action.GET_ITEMS_COUNT:
@@ -82,13 +106,16 @@ class Selector(ModuleInterface):
             self.Action.GET_ALL_NAMES:
                 lambda: self._get_all_names(values["element"]),
             self.Action.GET_ALL_TEXTS:
-                lambda: self._get_all_texts(values["element"])
+                lambda: self._get_all_texts(values["element"]),
+            self.Action.GET_SNAPSHOT:
+                lambda: self._get_snapshot(values["element"]),
+            self.Action.INVALIDATE_ITEMS:
+                lambda: self._combobox_cache.invalidate(values["element"]),
         }
 
         return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
 
-    @staticmethod
-    def _select_by_index(element: Any, index: int):
+    def _select_by_index(self, element: Any, index: int):
         """
         Try to select element from a given index.
 
@@ -100,6 +127,8 @@ class Selector(ModuleInterface):
             FlaUiError: By an array out of bound exception
             FlaUiError: If value is not a number.
         """
+        self._combobox_cache.invalidate(element)
+
         try:
             element.Items[index].Select()
         except IndexError:
@@ -107,8 +136,7 @@ class Selector(ModuleInterface):
         except ValueError:
             raise FlaUiError(FlaUiError.ValueShouldBeANumber.format(index)) from None
 
-    @staticmethod
-    def _select_by_name(element: Any, name: str):
+    def _select_by_name(self, element: Any, name: str):
         """
         Try to select element from given name.
 
@@ -119,13 +147,76 @@ class Selector(ModuleInterface):
         Raises:
             FlaUiError: If value can not be found by element.
         """
+        self._combobox_cache.invalidate(element)
+
         try:
             element.Select(name)
         except InvalidOperationException:
             raise FlaUiError(FlaUiError.ElementNameNotFound.format(name)) from None
 
-    @staticmethod
-    def _should_contain(control: Any, name: str):
+    def _select_by_names(self, control: Any, names: List[str]):
+        """
+        Selects all items with given names. Items are searched in one pass over the selector.
+
+        Args:
+            control (Object): Selector object to use (Combobox, Listbox).
+            names (List): Names from items to select.
+
+        Raises:
+            FlaUiError: If selector does not support multiple selection.
+
+        Returns:
+            List from all names which could not be found.
+        """
+        items = {}
+        for name, item in SelectorItems.get_items(control):
+            items.setdefault(name, item)
+
+        self._select_items(control, [items[name] for name in names if name in items])
+        return [name for name in names if name not in items]
+
+    def _select_by_indices(self, control: Any, indices: List[int]):
+        """
+        Selects all items with given indices. Items are enumerated once.
+
+        Args:
+            control (Object): Selector object to use (Combobox, Listbox).
+            indices (List): Indices from items to select.
+
+        Raises:
+            FlaUiError: If selector does not support multiple selection.
+
+        Returns:
+            List from all indices which could not be found.
+        """
+        items = [item for _, item in SelectorItems.get_items(control)]
+
+        self._select_items(control, [items[index] for index in indices if 0 <= index < len(items)])
+        return [index for index in indices if not 0 <= index < len(items)]
+
+    def _select_items(self, control: Any, items: List[Any]):
+        """
+        Replaces selection by given items. First item is selected and all other items are added to selection.
+
+        Args:
+            control (Object): Selector object to use (Combobox, Listbox).
+            items (List): Items from selector to select.
+
+        Raises:
+            FlaUiError: If selector does not support multiple selection.
+        """
+        self._combobox_cache.invalidate(control)
+
+        try:
+            for position, item in enumerate(items):
+                if position == 0:
+                    item.Select()
+                else:
+                    item.AddToSelection()
+        except InvalidOperationException:
+            raise FlaUiError(FlaUiError.ControlIsSingleSelect) from None
+
+    def _should_contain(self, control: Any, name: str):
         """
         Checks if selector contains a given item by name or text.
 
@@ -136,19 +227,25 @@ class Selector(ModuleInterface):
         Returns:
             True if name from combobox item exists otherwise False.
         """
-        is_contain = False
+        if SelectorItems.find_missing(self._get_items(control), [name]):
+            raise FlaUiError(FlaUiError.ControlDoesNotContainItem.format(name))
 
-        for item in control.Items:
-            if name in (item.Name, item.Text):
-                is_contain = True
+    def _should_contain_items(self, control: Any, names: List[str]):
+        """
+        Checks if selector contains all given items by name or text in one pass.
 
-        Selector._restore_for_expand_collapse_pattern(control)
+        Args:
+            control (Object): Selector object to use (Combobox, Listbox).
+            names (List): Names or Texts from selector items which should exist.
 
-        if not is_contain:
-            raise FlaUiError(FlaUiError.ControlDoesNotContainItem.format(name))
+        Raises:
+            FlaUiError: If any item does not exist. Error contains all missing items.
+        """
+        missing = SelectorItems.find_missing(self._get_items(control), names)
+        if missing:
+            raise FlaUiError(FlaUiError.ControlDoesNotContainItem.format(", ".join(missing)))
 
-    @staticmethod
-    def _should_not_contain(control: Any, name: str):
+    def _should_not_contain(self, control: Any, name: str):
         """
         Checks if selector does not contain a given item by name or text.
 
@@ -159,15 +256,7 @@ class Selector(ModuleInterface):
         Returns:
             True if name from combobox item does not exist otherwise False.
         """
-        is_contain = False
-
-        for item in control.Items:
-            if name in (item.Name, item.Text):
-                is_contain = True
-
-        Selector._restore_for_expand_collapse_pattern(control)
-
-        if is_contain:
+        if not SelectorItems.find_missing(self._get_items(control), [name]):
             raise FlaUiError(FlaUiError.ControlContainsItem.format(name))
 
     @staticmethod
@@ -186,11 +275,17 @@ class Selector(ModuleInterface):
         if item not in names:
             raise FlaUiError(FlaUiError.ItemNotSelected.format(item))
 
-    @staticmethod
-    def _get_items_count(control: Any):
-        count = control.Items.Length
-        Selector._restore_for_expand_collapse_pattern(control)
-        return count
+    def _get_items_count(self, control: Any):
+        """
+        Get count from all items from selector.
+
+        Args:
+            control (Object): Selector object to use (Combobox, Listbox).
+        """
+        if not Selector._is_combobox(control):
+            return SelectorItems.get_count(control)
+
+        return len(self._get_combobox_items(control))
 
     @staticmethod
     def _get_all_selected_names(control: Any):
@@ -229,8 +324,7 @@ class Selector(ModuleInterface):
 
         return texts
 
-    @staticmethod
-    def _get_all_names(control: Any):
+    def _get_all_names(self, control: Any):
         """
         Get all names from selector.
 
@@ -240,16 +334,9 @@ class Selector(ModuleInterface):
         Returns:
             List from all names from list control if exists otherwise empty list.
         """
-        names = []
-        for item in control.Items:
-            names.append(item.Name)
-
-        Selector._restore_for_expand_collapse_pattern(control)
+        return [name for name, _ in self._get_items(control)]
 
-        return names
-
-    @staticmethod
-    def _get_all_texts(control: Any):
+    def _get_all_texts(self, control: Any):
         """
         Get all texts from selector.
 
@@ -259,20 +346,69 @@ class Selector(ModuleInterface):
         Returns:
             List from all texts from a selector if exists otherwise empty list.
         """
-        texts = []
+        return [item.Text for _, item in self._get_items(control)]
 
-        for item in control.Items:
-            texts.append(item.Text)
+    def _get_snapshot(self, control: Any):
+        """
+        Get names, texts, selected names and count from selector items by one read from all items.
 
-        Selector._restore_for_expand_collapse_pattern(control)
+        Args:
+            control (Object): Selector object to use (Combobox, Listbox).
 
-        return texts
+        Returns:
+            Dictionary with names, texts, selected and count.
+        """
+        items = self._get_items(control)
+
+        return {"names": [name for name, _ in items],
+                "texts": [item.Text for _, item in items],
+                "selected": Selector._get_all_selected_names(control),
+                "count": len(items)}
+
+    def _get_items(self, control: Any):
+        """
+        Get all items from selector with their names. Combobox items are served from combobox cache.
+
+        Args:
+            control (Object): Selector object to use (Combobox, Listbox).
+
+        Returns:
+            List from tuples (name, item).
+        """
+        if not Selector._is_combobox(control):
+            return SelectorItems.get_items(control)
+
+        return [(item.Name, item) for item in self._get_combobox_items(control)]
+
+    def _get_combobox_items(self, control: Any):
+        """
+        Get cached items from combobox. If items are not cached or changed all items are read in one expand and
+        read cycle and combobox is collapsed afterwards.
+
+        Args:
+            control (Object): Combobox element from FlaUI.
+        """
+        items = self._combobox_cache.get(control)
+
+        if items is None:
+            items = self._combobox_cache.fill(control,
+                                              lambda: Selector._restore_for_expand_collapse_pattern(control))
+
+        return items
+
+    @staticmethod
+    def _is_combobox(control: Any):
+        """
+        Checks if selector is a combobox.
+
+        Args:
+            control (Object): Selector object to use (Combobox, Listbox).
+        """
+        return control.ControlType == ControlType.ComboBox
 
     @staticmethod
     def _restore_for_expand_collapse_pattern(control: Any):
-        is_supported = control.Patterns.ExpandCollapse.IsSupported
-        is_supported = bool(is_supported) if isinstance(is_supported, bool) else bool(is_supported.Value)
-        if is_supported:
+        if PatternCache.is_supported(control, "ExpandCollapse"):
             pattern = control.Patterns.ExpandCollapse.Pattern
             state = str(pattern.ExpandCollapseState)
             if state == "Expanded":
@@ -1,7 +1,10 @@
 from enum import Enum
 from typing import Optional, Any
 from System import Exception as CSharpException  # pylint: disable=import-error
+from FlaUI.Core.AutomationElements import AutomationElementExtensions  # pylint: disable=import-error
+from FlaUI.Core.Definitions import ControlType  # pylint: disable=import-error
 from FlaUILibrary.flaui.util.converter import Converter
+from FlaUILibrary.flaui.util.elementcache import ElementCache
 from FlaUILibrary.flaui.exception import FlaUiError
 from FlaUILibrary.flaui.interface import (ModuleInterface, ValueContainer)
 
@@ -18,6 +21,7 @@ class Tab(ModuleInterface):
         """
         element: Optional[Any]
         name: Optional[str]
+        item: Optional[Any]
 
     class Action(Enum):
         """
@@ -25,18 +29,22 @@ class Tab(ModuleInterface):
         """
         GET_TAB_ITEMS_NAMES = "GET_TAB_ITEMS_NAMES"
         SELECT_TAB_ITEM_BY_NAME = "SELECT_TAB_ITEM_BY_NAME"
+        GET_TAB_ITEMS = "GET_TAB_ITEMS"
+        SELECT_TAB_ITEM = "SELECT_TAB_ITEM"
 
     @staticmethod
-    def create_value_container(element=None, name=None):
+    def create_value_container(element=None, name=None, item=None):
         """
         Helper to create container object.
 
         Args:
             element (Object): Tab element to use
             name (String): Name from tab item to search
+            item (Object): Tab item element to use
         """
         return Tab.Container(element=element,
-                             name=Converter.cast_to_string(name))
+                             name=Converter.cast_to_string(name),
+                             item=item)
 
     def execute_action(self, action: Action, values: Container):
         """
@@ -52,6 +60,14 @@ class Tab(ModuleInterface):
             * Values ["element"]
             * Returns : None
 
+          *  Action.GET_TAB_ITEMS
+            * Values ["element"]
+            * Returns : List from tuples (name, tab item) in tab order
+
+          *  Action.SELECT_TAB_ITEM
+            * Values ["element", "item"]
+            * Returns : Content element from selected tab item
+
         Raises:
             FlaUiError: If action is not supported.
 
@@ -62,7 +78,9 @@ class Tab(ModuleInterface):
 
         switcher = {
             self.Action.GET_TAB_ITEMS_NAMES: lambda: self._get_tab_items_names(values["element"]),
-            self.Action.SELECT_TAB_ITEM_BY_NAME: lambda: self._select_tab_item(values["element"], values["name"])
+            self.Action.SELECT_TAB_ITEM_BY_NAME: lambda: self._select_tab_item(values["element"], values["name"]),
+            self.Action.GET_TAB_ITEMS: lambda: self._get_tab_items(values["element"]),
+            self.Action.SELECT_TAB_ITEM: lambda: self._select_tab_item_content(values["element"], values["item"]),
         }
 
         return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
@@ -78,12 +96,41 @@ class Tab(ModuleInterface):
         Returns:
             List of all TabItem elements names from Tab control if exists otherwise empty list.
         """
-        child_tab_items_names = []
+        return [name for name, _ in Tab._get_tab_items(element)]
+
+    @staticmethod
+    def _get_tab_items(element: Any):
+        """
+        Get all TabItems with their names from Tab element by one cache request.
+
+        Args:
+            element (Object): Tab element from FlaUI.
+
+        Returns:
+            List from tuples (name, tab item) in tab order.
+        """
+        request = ElementCache.create_request([element.Automation.PropertyLibrary.Element.Name])
+
+        with ElementCache.activate(request):
+            condition = element.ConditionFactory.ByControlType(ControlType.TabItem)
+            return [(child.Name, AutomationElementExtensions.AsTabItem(child))
+                    for child in element.FindAllChildren(condition)]
+
+    @staticmethod
+    def _select_tab_item_content(element: Any, item: Any):
+        """
+        Selects tab item and returns the element which contains the content from selected tab.
+        Depending on the ui framework the content is part from the tab item or from the tab control.
 
-        for tab_items in element.TabItems:
-            child_tab_items_names.append(tab_items.Name)
+        Args:
+            element (Object): Tab element from FlaUI.
+            item (Object): Tab item element from FlaUI.
 
-        return child_tab_items_names
+        Returns:
+            Tab item if it contains the content otherwise Tab element.
+        """
+        item.Select()
+        return item if item.FindFirstChild() is not None else element
 
     @staticmethod
     def _select_tab_item(element: Any, name: str):
@@ -1,8 +1,12 @@
+import time
 from enum import Enum
 from typing import Optional, Any
+from FlaUI.Core.Input import Keyboard as FlaUIKeyboard, Wait  # pylint: disable=import-error
+from FlaUI.Core.WindowsAPI import VirtualKeyShort  # pylint: disable=import-error
 from FlaUILibrary.flaui.exception import FlaUiError
 from FlaUILibrary.flaui.interface import (ModuleInterface, ValueContainer)
 from FlaUILibrary.flaui.util.converter import Converter
+from FlaUILibrary.robotframework import robotlog
 
 
 class Textbox(ModuleInterface):
@@ -25,6 +29,15 @@ class Textbox(ModuleInterface):
         SET_TEXT_TO_TEXTBOX = "SET_TEXT_TO_TEXTBOX"
         GET_TEXT_FROM_TEXTBOX = "GET_TEXT_FROM_TEXTBOX"
 
+    class Strategy(Enum):
+        """
+        Strategies to set text to a textbox.
+        """
+        VALUE_PATTERN = "VALUE_PATTERN"
+        KEYBOARD = "KEYBOARD"
+
+    ChunkSize = 1024
+
     @staticmethod
     def create_value_container(element=None, value=None):
         """
@@ -52,7 +65,7 @@ class Textbox(ModuleInterface):
 
           *  Action.SET_TEXT_TO_TEXTBOX
             * Values ["element", "value"]
-            * Returns : None
+            * Returns (String) : Strategy which was used to set the text.
 
         Raises:
             FlaUiError: If action is not supported.
@@ -72,10 +85,77 @@ class Textbox(ModuleInterface):
     @staticmethod
     def _set_textbox_text(element: Any, value: str):
         """
-        Set textbox text.
+        Set textbox text by value pattern if supported otherwise by keyboard input in chunks.
+        If the textbox ignores the value from value pattern the text is typed by keyboard.
+
+        Args:
+            element (Object): Textbox element from FlaUI.
+            value (String): String value to set to textbox.
+
+        Raises:
+            FlaUiError: If textbox does not contain the value after keyboard input.
+
+        Returns:
+            Strategy name which was used to set the text.
+        """
+        start = time.perf_counter()
+        strategy = Textbox.Strategy.VALUE_PATTERN
+
+        if not Textbox._set_text_by_value_pattern(element, value):
+            strategy = Textbox.Strategy.KEYBOARD
+            Textbox._set_text_by_keyboard(element, value)
+
+            if not Textbox._contains_text(element, value):
+                raise FlaUiError(FlaUiError.TextNotSet.format(element.Text, value))
+
+        robotlog.log(f"Set {len(value)} characters to textbox by {strategy.value} in "
+                     f"{time.perf_counter() - start:.3f}s")
+        return strategy.value
+
+    @staticmethod
+    def _set_text_by_value_pattern(element: Any, value: str):
+        """
+        Set textbox text by value pattern.
 
         Args:
             element (Object): Textbox element from FlaUI.
             value (String): String value to set to textbox.
+
+        Returns:
+            True if value pattern is supported, writable and textbox contains the value afterwards.
+        """
+        pattern = element.Patterns.Value.PatternOrDefault
+        if pattern is None or pattern.IsReadOnly.Value:
+            return False
+
+        pattern.SetValue(value)
+        return Textbox._contains_text(element, value)
+
+    @staticmethod
+    def _set_text_by_keyboard(element: Any, value: str):
+        """
+        Replace textbox text by keyboard input. Text is typed in chunks and each chunk waits until the input
+        was processed, so long texts do not overflow the input queue from the application.
+
+        Args:
+            element (Object): Textbox element from FlaUI.
+            value (String): String value to set to textbox.
+        """
+        element.Focus()
+        FlaUIKeyboard.TypeSimultaneously(VirtualKeyShort.CONTROL, VirtualKeyShort.KEY_A)
+        FlaUIKeyboard.Type(VirtualKeyShort.DELETE)
+
+        for index in range(0, len(value), Textbox.ChunkSize):
+            FlaUIKeyboard.Type(value[index:index + Textbox.ChunkSize])
+            Wait.UntilInputIsProcessed()
+
+    @staticmethod
+    def _contains_text(element: Any, value: str):
+        """
+        Checks if textbox text is equal to value. Line breaks are compared without carriage returns.
+
+        Args:
+            element (Object): Textbox element from FlaUI.
+            value (String): Expected text from textbox.
         """
-        element.Text = value
+        return element.Text.replace("\r\n", "\n") == value.replace("\r\n", "\n")
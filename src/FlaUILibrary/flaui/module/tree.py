@@ -1,10 +1,14 @@
+import time
 from enum import Enum
-from typing import Optional, Any
+from typing import Optional, Any, List
 from FlaUILibrary.flaui.exception import FlaUiError
 from FlaUILibrary.flaui.interface import (ModuleInterface, ValueContainer)
 from FlaUILibrary.flaui.util.treeitems import TreeItems
+from FlaUILibrary.flaui.util.treepathindex import TreePathIndex
+from FlaUILibrary.flaui.util.treesnapshot import TreeSnapshot
 from FlaUILibrary.flaui.util.converter import Converter
 from FlaUILibrary.flaui.enum.treeitemaction import TreeItemAction
+from FlaUILibrary.robotframework import robotlog
 
 
 class Tree(ModuleInterface):
@@ -15,6 +19,7 @@ class Tree(ModuleInterface):
 
     def __init__(self):
         self._seperator = "->"
+        self._path_index = TreePathIndex()
 
     class Container(ValueContainer):
         """
@@ -22,7 +27,13 @@ class Tree(ModuleInterface):
         """
         element: Optional[Any]
         item: Optional[str]
+        items: Optional[List[str]]
         seperator: Optional[str]
+        max_depth: Optional[int]
+        name_filter: Optional[str]
+        path: Optional[str]
+        expected_path: Optional[str]
+        file_format: Optional[str]
 
     class Action(Enum):
         """
@@ -36,14 +47,18 @@ class Tree(ModuleInterface):
         COLLAPSE_ALL = "COLLAPSE_ALL"
         SELECT_ITEM_BY_NAME = "SELECT_ITEM_BY_NAME"
         SELECT_ITEM = "SELECT_ITEM"
+        SELECT_ITEMS = "SELECT_ITEMS"
         EXPAND_ITEM = "EXPAND_ITEM"
         COLLAPSE_ITEM = "COLLAPSE_ITEM"
         SELECTED_ITEM_SHOULD_BE = "SELECTED_ITEM_SHOULD_BE"
         GET_SELECTED_ITEMS_NAME = "GET_SELECTED_ITEMS_NAME"
         SET_SEPERATOR = "SET_SEPERATOR"
+        EXPORT_SNAPSHOT = "EXPORT_SNAPSHOT"
+        SNAPSHOT_SHOULD_MATCH = "SNAPSHOT_SHOULD_MATCH"
 
     @staticmethod
-    def create_value_container(element=None, item=None, seperator=None):
+    def create_value_container(element=None, item=None, items=None, seperator=None, max_depth=None,
+                               name_filter=None, path=None, expected_path=None, file_format=None, msg=None):
         """
         Helper to create container object.
 
@@ -53,11 +68,24 @@ class Tree(ModuleInterface):
         Args:
             element (Object): Tree element to execute action
             item (String): Value from item to use
+            items (List): Values from items to use
             seperator (String): Seperator to split up tree items.
+            max_depth (Number): Maximum depth from tree items to use.
+            name_filter (String): Glob pattern from tree item names to use.
+            path (String): Filepath from tree snapshot.
+            expected_path (String): Filepath from expected tree snapshot.
+            file_format (String): File format from tree snapshot.
+            msg (String): Optional error message
         """
         return Tree.Container(element=element,
                               item=Converter.cast_to_string(item),
-                              seperator=seperator)
+                              items=Converter.cast_to_string_list(items),
+                              seperator=seperator,
+                              max_depth=Converter.cast_to_int(max_depth, msg),
+                              name_filter=name_filter,
+                              path=path,
+                              expected_path=expected_path,
+                              file_format=file_format)
 
     def execute_action(self, action: Action, values: Container):
         """If action is not supported an ActionNotSupported error will be raised.
@@ -73,38 +101,53 @@ class Tree(ModuleInterface):
             self.Action.GET_ROOT_ITEMS_COUNT:
                 lambda: values["element"].Items.Length,
             self.Action.EXPAND_ALL:
-                lambda: TreeItems.expand_all_tree_nodes(values["element"].Items),
+                lambda: self._expand_all(values["element"], values["max_depth"], values["name_filter"]),
             self.Action.COLLAPSE_ALL:
                 lambda: TreeItems.collapse(values["element"].Items),
             self.Action.GET_VISIBLE_ITEMS_NAMES:
-                lambda: TreeItems.get_all_names_from_tree_nodes(values["element"].Items),
+                lambda: TreeItems.get_all_names_from_tree_nodes(values["element"]),
             self.Action.GET_VISIBLE_ITEMS_COUNT:
-                lambda: TreeItems.get_visible_leaf_count(values["element"].Items),
+                lambda: TreeItems.get_visible_leaf_count(values["element"]),
             self.Action.ITEM_SHOULD_BE_VISIBLE:
                 lambda: self._should_be_visible(values["element"], values["item"]),
             self.Action.SELECT_ITEM_BY_NAME:
-                lambda: TreeItems.select_visible_node_by_name(values["element"].Items, values["item"]),
+                lambda: TreeItems.select_visible_node_by_name(values["element"], values["item"]),
             self.Action.SELECT_ITEM:
-                lambda: TreeItems.execute_by_location(values["element"].Items,
+                lambda: TreeItems.execute_by_location(values["element"],
                                                       values["item"],
                                                       self._seperator,
-                                                      TreeItemAction.SELECT),
+                                                      TreeItemAction.SELECT,
+                                                      self._path_index),
+            self.Action.SELECT_ITEMS:
+                lambda: TreeItems.select_by_locations(values["element"],
+                                                      values["items"],
+                                                      self._seperator,
+                                                      self._path_index),
             self.Action.EXPAND_ITEM:
-                lambda: TreeItems.execute_by_location(values["element"].Items,
+                lambda: TreeItems.execute_by_location(values["element"],
                                                       values["item"],
                                                       self._seperator,
-                                                      TreeItemAction.EXPAND),
+                                                      TreeItemAction.EXPAND,
+                                                      self._path_index),
             self.Action.COLLAPSE_ITEM:
-                lambda: TreeItems.execute_by_location(values["element"].Items,
+                lambda: TreeItems.execute_by_location(values["element"],
                                                       values["item"],
                                                       self._seperator,
-                                                      TreeItemAction.COLLAPSE),
+                                                      TreeItemAction.COLLAPSE,
+                                                      self._path_index),
             self.Action.SELECTED_ITEM_SHOULD_BE:
                 lambda: self._selected_item_should_be(values["element"], values["item"]),
             self.Action.GET_SELECTED_ITEMS_NAME:
                 lambda: self._get_selected_items_name(values["element"]),
             self.Action.SET_SEPERATOR:
                 lambda: self._set_seperator(values["seperator"]),
+            self.Action.EXPORT_SNAPSHOT:
+                lambda: self._export_snapshot(values["element"],
+                                              values["path"],
+                                              values["file_format"],
+                                              values["max_depth"]),
+            self.Action.SNAPSHOT_SHOULD_MATCH:
+                lambda: TreeSnapshot.should_match(values["path"], values["expected_path"]),
         }
 
         return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
@@ -125,6 +168,50 @@ class Tree(ModuleInterface):
         self._seperator = seperator
 
 
+    @staticmethod
+    def _expand_all(control: Any, max_depth: Optional[int], name_filter: Optional[str]):
+        """
+        Expands all tree items level by level and logs count from nodes and elapsed time.
+
+        Args:
+            control (Object): Tree control element from FlaUI.
+            max_depth (Number): Optional maximum depth from tree items to expand.
+            name_filter (String): Optional glob pattern from tree item names to expand.
+
+        Returns:
+            Count from expanded tree items.
+        """
+        start = time.perf_counter()
+        node_count, expand_count = TreeItems.expand_all_tree_nodes(control, max_depth, name_filter)
+        robotlog.log(f"Expanded {expand_count} from {node_count} tree items in {time.perf_counter() - start:.3f}s")
+
+        return expand_count
+
+    @staticmethod
+    def _export_snapshot(control: Any, path: str, file_format: str, max_depth: Optional[int]):
+        """
+        Writes name, depth, expand state and selection state from all visible tree items to a file.
+
+        Args:
+            control (Object): Tree control element from FlaUI.
+            path (String): Filepath to write.
+            file_format (String): File format json or jsonl.
+            max_depth (Number): Optional maximum depth from tree items to write.
+
+        Raises:
+            FlaUiError: If file format is not supported.
+
+        Returns:
+            Count from written tree items.
+        """
+        TreeSnapshot.get_file_format(file_format)
+
+        start = time.perf_counter()
+        count = TreeSnapshot.write(TreeItems.iter_snapshot(control, max_depth), path, file_format)
+        robotlog.log(f"Exported {count} tree items to '{path}' in {time.perf_counter() - start:.3f}s")
+
+        return count
+
     @staticmethod
     def _should_be_visible(control: Any, name: str):
         """
@@ -137,7 +224,7 @@ class Tree(ModuleInterface):
         Returns:
             True if name from combobox item exists otherwise False.
         """
-        if name not in TreeItems.get_all_names_from_tree_nodes(control.Items):
+        if not TreeItems.is_visible_node(control, name):
             raise FlaUiError(FlaUiError.ElementNotVisible.format(name))
 
     @staticmethod
@@ -1,5 +1,19 @@
+from .keyboardsequence import KeyboardSequence
 from .keyboardinputconverter import KeyboardInputConverter
+from .keyboardmacro import KeyboardMacro
+from .precisetimer import PreciseTimer
+from .dragpath import DragPath
 from .treeitems import TreeItems
-from .treeitemsparser import TreeItemsParser
+from .treelocation import TreeLocation
+from .treepathindex import TreePathIndex
+from .treesnapshot import TreeSnapshot
 from .automationinterfacecontainer import AutomationInterfaceContainer
 from .automationelement import AutomationElement
+from .elementcache import ElementCache
+from .gridrows import GridRows
+from .gridexport import GridExport
+from .gridindex import GridIndex
+from .selectoritems import SelectorItems
+from .comboboxcache import ComboboxCache
+from .patterncache import PatternCache
+from .clickablepointcache import ClickablePointCache
@@ -0,0 +1,156 @@
+import time
+from typing import Any, Dict, Tuple
+from FlaUI.Core.Exceptions import ElementNotAvailableException  # pylint: disable=import-error
+from System.Drawing import Point  # pylint: disable=import-error
+from System.Runtime.InteropServices import COMException  # pylint: disable=import-error
+from FlaUILibrary.flaui.util.elementcache import ElementCache
+
+
+class ClickablePointCache:
+    """
+    Cache for clickable points from elements with a slow provider keyed by runtime id.
+
+    Getting a clickable point lets the provider hit test the element area, which is slow for large or partially
+    covered elements. Only elements whose provider took longer than SlowProviderThreshold are cached, all other
+    elements ask the provider on each click because it is cheaper than validating a cached point. No runtime id
+    is read while no slow element is cached. A cached point is reused while the bounding rectangle from the
+    element is unchanged, otherwise the center from the new bounding rectangle is used. Both are only used if the
+    element is not offscreen and a hit test on the point finds the element or one of its descendants. In all
+    other cases the provider is asked again, so covered or scrolled out elements still raise
+    NoClickablePointException. Elements without runtime id are not cached.
+    """
+
+    MaxCachedElements = 1024
+    SlowProviderThreshold = 0.1
+    MaxHitTestDepth = 16
+
+    def __init__(self):
+        self._points: Dict[Tuple[Any, ...], Tuple[Tuple[int, int, int, int], Any, float]] = {}
+        self._statistics = {"hits": 0, "misses": 0, "fallbacks": 0, "rejected": 0, "fetch_time": 0.0,
+                            "saved_time": 0.0}
+
+    def get_clickable_point(self, element: Any):
+        """
+        Get clickable point from element by cache or provider.
+
+        Args:
+            element (Object): Element from FlaUI.
+
+        Raises:
+            NoClickablePointException: If element has no clickable point.
+        """
+        key = ClickablePointCache._get_key(element) if self._points else None
+        cached = self._points.get(key) if key else None
+        statistics = self._statistics
+
+        if cached is not None:
+            start = time.perf_counter()
+            rectangle = element.BoundingRectangle
+            bounds = (rectangle.X, rectangle.Y, rectangle.Width, rectangle.Height)
+            is_center = cached[0] != bounds
+            point = Point(bounds[0] + bounds[2] // 2, bounds[1] + bounds[3] // 2) if is_center else cached[1]
+            is_hit = bounds[2] > 0 and bounds[3] > 0 and ClickablePointCache._is_hit(element, key, point)
+            duration = time.perf_counter() - start
+
+            if is_hit:
+                statistics["fallbacks" if is_center else "hits"] += 1
+                statistics["saved_time"] += cached[2] - duration
+                if is_center:
+                    self._store(key, bounds, point, cached[2])
+                return point
+
+            statistics["rejected"] += 1
+            statistics["saved_time"] -= duration
+
+        start = time.perf_counter()
+        point = element.GetClickablePoint()
+        duration = time.perf_counter() - start
+
+        statistics["misses"] += 1
+        statistics["fetch_time"] += duration
+
+        if duration >= ClickablePointCache.SlowProviderThreshold:
+            key = key or ClickablePointCache._get_key(element)
+            if key:
+                rectangle = element.BoundingRectangle
+                self._store(key, (rectangle.X, rectangle.Y, rectangle.Width, rectangle.Height), point, duration)
+        elif key:
+            self._points.pop(key, None)
+
+        return point
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get counters from cache hits, provider calls, center fallbacks, points rejected by hit test and the time
+        spent and saved in ms. Saved time is the provider time from the cached point minus the time spent to
+        validate cached points.
+        """
+        statistics = self._statistics
+        return {"hits": statistics["hits"],
+                "misses": statistics["misses"],
+                "fallbacks": statistics["fallbacks"],
+                "rejected": statistics["rejected"],
+                "fetch_time_in_ms": round(statistics["fetch_time"] * 1000, 3),
+                "saved_time_in_ms": round(statistics["saved_time"] * 1000, 3)}
+
+    def invalidate(self):
+        """
+        Removes all cached points and resets counters.
+        """
+        self._points.clear()
+        self._statistics.update(hits=0, misses=0, fallbacks=0, rejected=0, fetch_time=0.0, saved_time=0.0)
+
+    def _store(self, key: Tuple[Any, ...], bounds: Tuple[int, int, int, int], point: Any, duration: float):
+        """
+        Stores clickable point from element by key.
+
+        Args:
+            key (Tuple): Cache key from element.
+            bounds (Tuple): Bounding rectangle from element as x, y, width and height.
+            point (Object): Clickable point from element.
+            duration (Number): Time in seconds the provider took to get the clickable point.
+        """
+        if key not in self._points and len(self._points) >= ClickablePointCache.MaxCachedElements:
+            self._points.clear()
+
+        self._points[key] = (bounds, point, duration)
+
+    @staticmethod
+    def _is_hit(element: Any, key: Tuple[Any, ...], point: Any) -> bool:
+        """
+        Checks if element is not offscreen and the topmost element at point is the element or one of its
+        descendants.
+
+        Args:
+            element (Object): Element from FlaUI.
+            key (Tuple): Runtime id from element.
+            point (Object): Point to hit test.
+        """
+        try:
+            if element.IsOffscreen:
+                return False
+
+            walker = element.Automation.TreeWalkerFactory.GetRawViewWalker()
+            hit = element.Automation.FromPoint(point)
+
+            for _ in range(ClickablePointCache.MaxHitTestDepth):
+                if hit is None:
+                    return False
+                if ElementCache.find_runtime_id(hit) == key:
+                    return True
+                hit = walker.GetParent(hit)
+
+        except (ElementNotAvailableException, COMException):
+            return False
+
+        return False
+
+    @staticmethod
+    def _get_key(element: Any):
+        """
+        Get cache key from element by runtime id or None if element has no runtime id.
+
+        Args:
+            element (Object): Element from FlaUI.
+        """
+        return ElementCache.find_runtime_id(element)
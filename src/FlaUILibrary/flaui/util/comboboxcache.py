@@ -0,0 +1,99 @@
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from FlaUILibrary.flaui.util.elementcache import ElementCache
+
+
+class ComboboxCache:
+    """
+    Item cache for comboboxes keyed by runtime id from combobox.
+
+    Reading items from a combobox expands it to realize the drop down, so names and texts from all items are read
+    in one expand and read cycle and reused by later reads. Each read revalidates the cached items by one cache
+    request which fetches runtime ids and names from all descendants of the combobox. Items are read again if
+    items were added, removed, renamed or the shown selection was changed outside of the library. Cached items
+    are also removed by a selection or expand from the combobox.
+    """
+
+    MaxCachedComboboxes = 64
+
+    class Item(NamedTuple):
+        """
+        Cached name and text from combobox item.
+        """
+        Name: str
+        Text: str
+
+    def __init__(self):
+        self._items: Dict[Tuple[Any, ...], Tuple[Tuple[Any, ...], List[ComboboxCache.Item]]] = {}
+
+    def get(self, control: Any):
+        """
+        Get cached items from combobox if they are still valid.
+
+        Args:
+            control (Object): Combobox element from FlaUI.
+
+        Returns:
+            List from cached items or None if combobox items are not cached or changed.
+        """
+        key = ElementCache.get_runtime_id(control)
+        entry = self._items.get(key)
+        if entry is None:
+            return None
+
+        signature, items = entry
+        if signature != ComboboxCache._get_signature(control):
+            del self._items[key]
+            return None
+
+        return items
+
+    def fill(self, control: Any, restore: Optional[Callable[[], Any]] = None):
+        """
+        Reads name and text from all combobox items once and stores them.
+
+        Args:
+            control (Object): Combobox element from FlaUI.
+            restore (Function): Optional function to restore combobox state after items were read. It is called
+                                before the signature from combobox is read to validate later reads.
+
+        Returns:
+            List from cached items.
+        """
+        items = [ComboboxCache.Item(item.Name, item.Text) for item in control.Items]
+
+        if restore is not None:
+            restore()
+
+        if len(self._items) >= ComboboxCache.MaxCachedComboboxes:
+            self._items.clear()
+
+        self._items[ElementCache.get_runtime_id(control)] = (ComboboxCache._get_signature(control), items)
+        return items
+
+    def invalidate(self, control: Any = None):
+        """
+        Removes cached items from given combobox or all comboboxes if no control is given.
+
+        Args:
+            control (Object): Optional combobox element from FlaUI.
+        """
+        if control is None:
+            self._items.clear()
+            return
+
+        self._items.pop(ElementCache.get_runtime_id(control), None)
+
+    @staticmethod
+    def _get_signature(control: Any):
+        """
+        Get runtime ids and names from all descendants of combobox by one cache request.
+
+        Args:
+            control (Object): Combobox element from FlaUI.
+        """
+        library = control.Automation.PropertyLibrary.Element
+        request = ElementCache.create_request([library.RuntimeId, library.Name])
+
+        with ElementCache.activate(request):
+            return tuple((ElementCache.get_runtime_id(element), element.Name)
+                         for element in control.FindAllDescendants())
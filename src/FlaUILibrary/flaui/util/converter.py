@@ -46,6 +46,46 @@ class Converter:
 
         raise FlaUiError(error_msg) from ValueError
 
+    @staticmethod
+    def cast_to_int_list(value: Any, error_msg=None):
+        """
+        Helper to cast value as list of numbers.
+        A string value will be split up by comma. If value is None, None will be returned.
+
+        Raises:
+            FlaUiError: If creation from convert failed by invalid values.
+
+        Args:
+            value (Object): List or comma separated string to convert
+            error_msg (String) : Custom error message
+        """
+        if value is None:
+            return None
+
+        if isinstance(value, str):
+            value = [item for item in value.split(",") if item.strip()]
+        elif not isinstance(value, (list, tuple)):
+            value = [value]
+
+        return [Converter.cast_to_int(item, error_msg) for item in value]
+
+    @staticmethod
+    def cast_to_string_list(value: Any):
+        """
+        Helper to cast value as list of strings.
+        A single value will be returned as list with one element. If value is None, None will be returned.
+
+        Args:
+            value (Object): List or single value to convert
+        """
+        if value is None:
+            return None
+
+        if not isinstance(value, (list, tuple)):
+            value = [value]
+
+        return [Converter.cast_to_string(item) for item in value]
+
     @staticmethod
     def cast_to_string(value: Any):
         """
@@ -0,0 +1,108 @@
+import math
+from enum import Enum
+from typing import List, NamedTuple, Tuple
+from FlaUILibrary.flaui.exception import FlaUiError
+
+
+class DragPath:
+    """
+    Planner for mouse drag paths from a start point to an end point.
+
+    A path is split into equal time steps given by steps per second. The position for each step is interpolated
+    linear or eased, so the mouse starts and ends slowly. Hover time is waited after the mouse button is pressed
+    on start point and before it is released on end point, so controls can register drag enter and drag over events.
+    """
+
+    class Interpolation(Enum):
+        """Supported interpolations between start and end point."""
+        LINEAR = "LINEAR"
+        EASE_IN_OUT = "EASE_IN_OUT"
+
+    class Step(NamedTuple):
+        """
+        Position to move the mouse to at given time offset in seconds from start of movement.
+        """
+        x: int
+        y: int
+        time: float
+
+    def __init__(self, duration_in_ms: int = 500, steps_per_second: int = 60,
+                 interpolation: str = "LINEAR", hover_in_ms: int = 0):
+        """
+        Constructor for drag path planner.
+
+        Args:
+            duration_in_ms (Number): Duration in ms to move from start to end point.
+            steps_per_second (Number): Count from mouse moves per second.
+            interpolation (String): Interpolation name from DragPath.Interpolation.
+            hover_in_ms (Number): Time in ms to wait on start point after press and on end point before release.
+
+        Raises:
+            FlaUiError: If an argument is invalid.
+        """
+        self.duration = DragPath._to_number(duration_in_ms, "duration_in_ms") / 1000
+        self.steps_per_second = DragPath._to_number(steps_per_second, "steps_per_second")
+        self.hover = DragPath._to_number(hover_in_ms, "hover_in_ms") / 1000
+
+        if self.steps_per_second <= 0:
+            raise FlaUiError(FlaUiError.DragPathInvalid.format("steps_per_second must be greater than 0"))
+
+        try:
+            self.interpolation = DragPath.Interpolation(str(interpolation).upper())
+        except ValueError:
+            names = ", ".join(value.value for value in DragPath.Interpolation)
+            raise FlaUiError(FlaUiError.DragPathInvalid.format(
+                f"Interpolation '{interpolation}' is not supported. Supported are {names}")) from None
+
+    def plan(self, start: Tuple[int, int], end: Tuple[int, int]) -> List[Step]:
+        """
+        Plan all mouse moves from start point to end point. The last step is always the end point.
+
+        Args:
+            start (Tuple): X and y coordinate from start point.
+            end (Tuple): X and y coordinate from end point.
+
+        Returns:
+            List from DragPath.Step without start point.
+        """
+        count = max(1, math.ceil(self.duration * self.steps_per_second))
+        steps = []
+
+        for index in range(1, count + 1):
+            progress = self._ease(index / count)
+            steps.append(DragPath.Step(round(start[0] + (end[0] - start[0]) * progress),
+                                       round(start[1] + (end[1] - start[1]) * progress),
+                                       self.duration * index / count))
+
+        return steps
+
+    def _ease(self, progress: float) -> float:
+        """
+        Map linear progress between 0 and 1 to progress from interpolation.
+
+        Args:
+            progress (Number): Linear progress between 0 and 1.
+        """
+        if self.interpolation == DragPath.Interpolation.EASE_IN_OUT:
+            return (1 - math.cos(math.pi * progress)) / 2
+
+        return progress
+
+    @staticmethod
+    def _to_number(value, name: str) -> float:
+        """
+        Convert value to a non negative number.
+
+        Args:
+            value (Object): Value to convert.
+            name (String): Argument name for error message.
+        """
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            raise FlaUiError(FlaUiError.ValueShouldBeANumber.format(value)) from None
+
+        if number < 0 or math.isnan(number) or math.isinf(number):
+            raise FlaUiError(FlaUiError.DragPathInvalid.format(f"{name} must be a finite number greater or equal to 0"))
+
+        return number
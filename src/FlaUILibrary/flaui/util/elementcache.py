@@ -0,0 +1,77 @@
+from contextlib import contextmanager
+from typing import Any, Iterable
+from FlaUI.Core import CacheRequest  # pylint: disable=import-error
+from FlaUI.Core.Definitions import TreeScope  # pylint: disable=import-error
+from FlaUI.Core.Exceptions import ElementNotAvailableException  # pylint: disable=import-error
+from FlaUI.Core.Exceptions import PropertyNotSupportedException  # pylint: disable=import-error
+from System.Runtime.InteropServices import COMException  # pylint: disable=import-error
+
+
+class ElementCache:
+    """
+    Helper class to bundle property and pattern reads from automation elements into one UIA cache request.
+    Elements found while a cache request is active are fetched with all requested values in a single
+    cross-process call and later reads are served from the cache.
+    """
+
+    @staticmethod
+    def create_request(properties: Iterable[Any], patterns: Iterable[Any] = None, tree_scope: Any = None):
+        """
+        Creates a cache request for the given property and pattern identifiers.
+
+        Args:
+            properties (List): PropertyId objects from automation property library.
+            patterns (List): PatternId objects from automation pattern library.
+            tree_scope (Object): TreeScope from cache request. Default is TreeScope.Element.
+
+        Returns:
+            CacheRequest object from FlaUI.
+        """
+        request = CacheRequest()
+        request.TreeScope = TreeScope.Element if tree_scope is None else tree_scope
+
+        for prop in properties:
+            request.Add(prop)
+
+        for pattern in patterns or []:
+            request.Add(pattern)
+
+        return request
+
+    @staticmethod
+    def get_runtime_id(element: Any):
+        """
+        Get runtime id from element as hashable tuple to be used as cache key.
+
+        Args:
+            element (Object): Element from FlaUI.
+        """
+        return tuple(element.Properties.RuntimeId.Value)
+
+    @staticmethod
+    def find_runtime_id(element: Any):
+        """
+        Get runtime id from element as hashable tuple or None if element has no runtime id or is not available.
+
+        Args:
+            element (Object): Element from FlaUI.
+        """
+        try:
+            return ElementCache.get_runtime_id(element) or None
+        except (PropertyNotSupportedException, ElementNotAvailableException, COMException):
+            return None
+
+    @staticmethod
+    @contextmanager
+    def activate(request: Any):
+        """
+        Activates the given cache request for the current thread until the context is left.
+
+        Args:
+            request (Object): CacheRequest object from FlaUI.
+        """
+        handle = request.Activate()
+        try:
+            yield request
+        finally:
+            handle.Dispose()
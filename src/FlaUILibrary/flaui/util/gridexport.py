@@ -0,0 +1,120 @@
+import csv
+import json
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional
+from FlaUILibrary.flaui.exception import FlaUiError
+
+
+class GridExport:
+    """
+    Helper class to stream grid rows to a file with bounded memory usage.
+    Rows are consumed one by one from any iterable, so a grid is never materialized as a nested list.
+    """
+
+    class FileFormat(Enum):
+        """
+        Supported file formats for grid export.
+        """
+        CSV = "csv"
+        JSONL = "jsonl"
+
+    @staticmethod
+    def get_file_format(file_format: str):
+        """
+        Get supported file format from string.
+
+        Args:
+            file_format (String): File format as string like csv or jsonl.
+
+        Raises:
+            FlaUiError: If file format is not supported.
+        """
+        try:
+            return GridExport.FileFormat(str(file_format).lower())
+        except ValueError:
+            raise FlaUiError(FlaUiError.FileFormatNotSupported.format(file_format)) from None
+
+    @staticmethod
+    def create_row_filter(filters: Optional[Dict[Any, Any]], header: Optional[List[str]] = None):
+        """
+        Creates a row filter which matches rows if all given column values are equal.
+
+        Args:
+            filters (Dict): Column index or header name mapped to expected cell value.
+            header (List): Header names to resolve columns by name.
+
+        Raises:
+            FlaUiError: If column from filter could not be found.
+
+        Returns:
+            Callable which returns True if row matches all filters. None if no filters are given.
+        """
+        if not filters:
+            return None
+
+        conditions = [(GridExport._get_column_index(column, header), str(value)) for column, value in filters.items()]
+
+        def _matches(row: List[str]):
+            return all(index < len(row) and row[index] == value for index, value in conditions)
+
+        return _matches
+
+    @staticmethod
+    def write(rows: Iterable[List[str]], path: str, file_format: str = "csv", header: Optional[List[str]] = None,
+              row_filter: Any = None):
+        """
+        Writes all rows to file. Only one row is kept in memory at a time.
+
+        Args:
+            rows (Iterable): Iterable from rows as string arrays.
+            path (String): Filepath to write.
+            file_format (String): File format csv or jsonl.
+            header (List): Optional header row. For jsonl each row will be written as object by header names.
+            row_filter (Callable): Optional callable which returns True if row should be written.
+
+        Raises:
+            FlaUiError: If file format is not supported.
+
+        Returns:
+            Count from all written rows without header.
+        """
+        file_format = GridExport.get_file_format(file_format)
+        count = 0
+
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            if file_format == GridExport.FileFormat.CSV:
+                writer = csv.writer(file)
+                if header:
+                    writer.writerow(header)
+                write_row = writer.writerow
+            else:
+                def write_row(row):
+                    value = dict(zip(header, row)) if header else row
+                    file.write(json.dumps(value, ensure_ascii=False) + "\n")
+
+            for row in rows:
+                if row_filter is None or row_filter(row):
+                    write_row(row)
+                    count += 1
+
+        return count
+
+    @staticmethod
+    def _get_column_index(column: Any, header: Optional[List[str]]):
+        """
+        Get column index from index value or header name.
+
+        Args:
+            column (Object): Column index or header name.
+            header (List): Header names to resolve columns by name.
+
+        Raises:
+            FlaUiError: If column could not be found.
+        """
+        if header and column in header:
+            return header.index(column)
+
+        try:
+            return int(column)
+        except ValueError:
+            raise FlaUiError(FlaUiError.ColumnNotFound.format(column)) from None
@@ -0,0 +1,111 @@
+from typing import Any, Dict, List, Optional, Tuple
+from FlaUILibrary.flaui.util.elementcache import ElementCache
+from FlaUILibrary.flaui.util.gridrows import GridRows
+
+
+class GridIndex:
+    """
+    Lookup cache from cell values to row indices for grid columns.
+
+    Each column is read in one pass and stored by runtime id from grid and column index. Cell values are read by
+    value pattern or name like GridRows does. Each returned row is verified to still contain its name. An index
+    is rebuilt once per lookup if the row count from grid changed, a name is missing or a verified row does not
+    contain the expected value anymore, for example after a sort or cell edit.
+    """
+
+    MaxCachedColumns = 32
+
+    def __init__(self):
+        self._indices: Dict[Tuple[Any, int], Tuple[int, Dict[str, List[int]]]] = {}
+
+    def get_row_indices(self, control: Any, column: int, names: List[str]) -> List[Optional[int]]:
+        """
+        Get first row index from rows which contain the given names in column.
+
+        Args:
+            control (Object): Grid control element from FlaUI.
+            column (Number): Column index to search.
+            names (List): Cell values to search.
+
+        Returns:
+            List from first row index for each name. None if name could not be found.
+        """
+        key = (ElementCache.get_runtime_id(control), column)
+        row_count = control.RowCount
+        entry = self._indices.get(key)
+
+        if entry is not None and entry[0] == row_count:
+            indices = GridIndex._verify(control, column, entry[1], names)
+            if indices is not None:
+                return indices
+
+        entry = self._build(key, control, column, row_count)
+        return [entry[1][name][0] if name in entry[1] else None for name in names]
+
+    def invalidate(self, control: Any = None):
+        """
+        Removes all cached indices from given grid or all grids if no control is given.
+
+        Args:
+            control (Object): Optional grid control element from FlaUI.
+        """
+        if control is None:
+            self._indices.clear()
+            return
+
+        runtime_id = ElementCache.get_runtime_id(control)
+        for key in [key for key in self._indices if key[0] == runtime_id]:
+            del self._indices[key]
+
+    def _build(self, key: Tuple[Any, int], control: Any, column: int, row_count: int):
+        """
+        Reads all values from column in one pass and stores lookup by key.
+
+        Args:
+            key (Tuple): Cache key from runtime id and column index.
+            control (Object): Grid control element from FlaUI.
+            column (Number): Column index to read.
+            row_count (Number): Row count from grid while reading.
+        """
+        lookup: Dict[str, List[int]] = {}
+        request = GridRows.create_cache_request(control)
+
+        for row_index, row in enumerate(control.Rows):
+            value = GridRows.read_cell(row, column, request)
+            if value is not None:
+                lookup.setdefault(value, []).append(row_index)
+
+        if len(self._indices) >= GridIndex.MaxCachedColumns:
+            self._indices.clear()
+
+        self._indices[key] = (row_count, lookup)
+        return self._indices[key]
+
+    @staticmethod
+    def _verify(control: Any, column: int, lookup: Dict[str, List[int]], names: List[str]):
+        """
+        Get first cached row index for each name if all names are cached and each row still contains its name.
+        Lookups without any of the given names are invalid, because the names could have been added since.
+
+        Args:
+            control (Object): Grid control element from FlaUI.
+            column (Number): Column index to verify.
+            lookup (Dictionary): Cached lookup from cell value to row indices.
+            names (List): Cell values to search.
+
+        Returns:
+            List from first row index for each name or None if lookup is invalid.
+        """
+        if not all(name in lookup for name in names):
+            return None
+
+        request = GridRows.create_cache_request(control)
+        indices = []
+
+        for name in names:
+            row_index = lookup[name][0]
+            if GridRows.read_cell(control.GetRowByIndex(row_index), column, request) != name:
+                return None
+            indices.append(row_index)
+
+        return indices
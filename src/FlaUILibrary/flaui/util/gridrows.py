@@ -0,0 +1,320 @@
+from typing import Any, List, Optional
+from FlaUI.Core.Definitions import ControlType, ScrollAmount  # pylint: disable=import-error
+from FlaUILibrary.flaui.exception import FlaUiError
+from FlaUILibrary.flaui.util.elementcache import ElementCache
+
+
+class GridRows:
+    """
+    A helper class to read data from grid controls.
+
+    All cells from a row are fetched by a cache request so each cell value is read only once from the provider.
+    A cache request is only active while cells are fetched and read, because FlaUI fails on property reads from
+    elements which were not fetched by the active cache request.
+    """
+
+    NewItemPlaceholder = "NewItemPlaceholder"
+    NoScroll = -1
+
+    @staticmethod
+    def create_cache_request(control: Any):
+        """
+        Creates a cache request for control type, name, value and row index reads from grid cells.
+
+        Args:
+            control (Object): Grid control element from FlaUI.
+        """
+        automation = control.Automation
+        return ElementCache.create_request([automation.PropertyLibrary.Element.ControlType,
+                                            automation.PropertyLibrary.Element.Name,
+                                            automation.PropertyLibrary.Value.Value,
+                                            automation.PropertyLibrary.GridItem.Row],
+                                           [automation.PatternLibrary.ValuePattern,
+                                            automation.PatternLibrary.GridItemPattern])
+
+    @staticmethod
+    def get_header(control: Any, columns: Optional[List[int]] = None):
+        """
+        Get header texts from grid.
+
+        Args:
+            control (Object): Grid control element from FlaUI.
+            columns (List): Optional column indices to read. If not set all columns will be read.
+
+        Returns:
+            String array of header columns as texts [header1, header2, ...]
+        """
+        header = control.Header
+        if not header:
+            return []
+
+        return GridRows._select_columns([column.Text for column in header.Columns], columns)
+
+    @staticmethod
+    def iter_rows(control: Any, columns: Optional[List[int]] = None, start: Optional[int] = None,
+                  end: Optional[int] = None, cache_request: Any = None):
+        """
+        Generator which yields all cell values from each grid row.
+        Placeholder cells from editable grids are read as empty values to keep column positions and the new item
+        row which only contains placeholder cells is not returned.
+
+        Args:
+            control (Object): Grid control element from FlaUI.
+            columns (List): Optional column indices to read. If not set all columns will be read.
+            start (Number): Optional first row index to read.
+            end (Number): Optional row index to stop before.
+            cache_request (Object): Optional cache request to reuse.
+
+        Returns:
+            Generator from string arrays [row1column1, row1column2, ...]
+        """
+        request = cache_request if cache_request is not None else GridRows.create_cache_request(control)
+        rows = control.Rows
+
+        for index in range(*slice(start, end).indices(rows.Length)):
+            values = GridRows.read_row(rows[index], columns, request)
+            if values:
+                yield values
+
+    @staticmethod
+    def iter_virtualized_rows(control: Any, columns: Optional[List[int]] = None, cache_request: Any = None):
+        """
+        Generator which yields all cell values from each row of a grid with UI virtualization.
+
+        If the grid supports the ItemContainer pattern all items are walked one by one and realized by the
+        VirtualizedItem pattern. Otherwise the grid is scrolled page by page by the Scroll pattern and all
+        realized rows are read. Rows are deduplicated by their row index, so overlapping pages are only returned once.
+
+        Args:
+            control (Object): Grid control element from FlaUI.
+            columns (List): Optional column indices to read. If not set all columns will be read.
+            cache_request (Object): Optional cache request to reuse.
+
+        Returns:
+            Generator from string arrays [row1column1, row1column2, ...]
+        """
+        request = cache_request if cache_request is not None else GridRows.create_cache_request(control)
+
+        if GridRows._is_supported(control.Patterns.ItemContainer):
+            yield from GridRows._iter_item_container_rows(control, columns, request)
+        else:
+            yield from GridRows._iter_scrolled_rows(control, columns, request)
+
+    @staticmethod
+    def get_selected_rows(control: Any):
+        """
+        Get all cell values from each selected grid row.
+
+        Args:
+            control (Object): Grid control element from FlaUI.
+
+        Returns:
+            List from string arrays [[row1column1, row1column2, ...], [row2column1, row2column2, ...] ...]
+        """
+        request = GridRows.create_cache_request(control)
+        return [GridRows.read_row(row, None, request) for row in control.SelectedItems]
+
+    @staticmethod
+    def read_row(row: Any, columns: Optional[List[int]], cache_request: Any):
+        """
+        Read all cell values from a grid row by one cache request.
+
+        Args:
+            row (Object): Grid row element from FlaUI.
+            columns (List): Optional column indices to read. If not set all columns will be read.
+            cache_request (Object): Cache request to fetch cells.
+
+        Returns:
+            String array from cell values with empty values for placeholder cells or an empty array if all cells
+            are placeholder cells.
+        """
+        with ElementCache.activate(cache_request):
+            return GridRows._read_cells(GridRows._get_cells(row), columns)
+
+    @staticmethod
+    def read_cell(row: Any, column: int, cache_request: Any):
+        """
+        Read a single cell value from a grid row by one cache request.
+
+        Args:
+            row (Object): Grid row element from FlaUI.
+            column (Number): Column index to read.
+            cache_request (Object): Cache request to fetch cells.
+
+        Returns:
+            Cell value or None if row does not contain column.
+        """
+        with ElementCache.activate(cache_request):
+            cells = GridRows._get_cells(row)
+            if 0 <= column < len(cells):
+                return GridRows._get_cell_value(cells[column])
+
+        return None
+
+    @staticmethod
+    def _iter_item_container_rows(control: Any, columns: Optional[List[int]], cache_request: Any):
+        """
+        Walks all items from grid by ItemContainer pattern and realizes virtualized items.
+
+        Args:
+            control (Object): Grid control element from FlaUI.
+            columns (List): Optional column indices to read.
+            cache_request (Object): Cache request to read cells.
+        """
+        container = control.Patterns.ItemContainer.Pattern
+        item = container.FindItemByProperty(None, None, None)
+
+        while item is not None:
+            if GridRows._is_supported(item.Patterns.VirtualizedItem):
+                item.Patterns.VirtualizedItem.Pattern.Realize()
+
+            values = GridRows.read_row(item, columns, cache_request)
+            if values:
+                yield values
+
+            item = container.FindItemByProperty(item, None, None)
+
+    @staticmethod
+    def _iter_scrolled_rows(control: Any, columns: Optional[List[int]], cache_request: Any):
+        """
+        Scrolls grid page by page and reads all realized rows which were not read before.
+        Grids without Scroll pattern are read like a non virtualized grid.
+
+        Args:
+            control (Object): Grid control element from FlaUI.
+            columns (List): Optional column indices to read.
+            cache_request (Object): Cache request to read cells.
+        """
+        if not GridRows._is_supported(control.Patterns.Scroll):
+            yield from GridRows.iter_rows(control, columns, cache_request=cache_request)
+            return
+
+        scroll = control.Patterns.Scroll.Pattern
+        if scroll.VerticallyScrollable.Value:
+            scroll.SetScrollPercent(GridRows.NoScroll, 0)
+
+        seen = set()
+
+        while True:
+            for row in control.Rows:
+                with ElementCache.activate(cache_request):
+                    cells = GridRows._get_cells(row)
+                    index = GridRows._get_row_index(cells)
+                    if index in seen:
+                        continue
+
+                    values = GridRows._read_cells(cells, columns)
+
+                seen.add(index)
+                if values:
+                    yield values
+
+            if not scroll.VerticallyScrollable.Value:
+                return
+
+            position = scroll.VerticalScrollPercent.Value
+            if position >= 100:
+                return
+
+            scroll.Scroll(ScrollAmount.NoAmount, ScrollAmount.LargeIncrement)
+            if scroll.VerticalScrollPercent.Value == position:
+                return
+
+    @staticmethod
+    def _get_cells(row: Any):
+        """
+        Get all cells from a grid row without row header. Must be called while a cache request is active.
+
+        Args:
+            row (Object): Grid row element from FlaUI.
+        """
+        return [cell for cell in row.FindAllChildren() if cell.ControlType != ControlType.HeaderItem]
+
+    @staticmethod
+    def _get_cell_value(cell: Any):
+        """
+        Get value from cell by Value pattern or name if pattern is not supported.
+        Must be called while a cache request is active.
+
+        Args:
+            cell (Object): Grid cell element from FlaUI.
+        """
+        pattern = cell.Patterns.Value.PatternOrDefault
+        if pattern is None:
+            return cell.Name
+
+        return pattern.Value.Value
+
+    @staticmethod
+    def _get_row_index(cells: List[Any]):
+        """
+        Get row index from first cell by GridItem pattern. Must be called while a cache request is active.
+        If pattern is not supported all cell values are used as identifier.
+
+        Args:
+            cells (List): Cells from a grid row.
+        """
+        if not cells:
+            return None
+
+        pattern = cells[0].Patterns.GridItem.PatternOrDefault
+        if pattern is not None:
+            return pattern.Row.Value
+
+        return tuple(GridRows._get_cell_value(cell) for cell in cells)
+
+    @staticmethod
+    def _is_supported(pattern: Any):
+        """
+        Checks if automation pattern is supported by element.
+
+        Args:
+            pattern (Object): AutomationPattern from element patterns.
+        """
+        is_supported = pattern.IsSupported
+        return bool(is_supported) if isinstance(is_supported, bool) else bool(is_supported.Value)
+
+    @staticmethod
+    def _read_cells(cells: List[Any], columns: Optional[List[int]] = None):
+        """
+        Read all cell values from cells. Must be called while a cache request is active.
+
+        Args:
+            cells (List): Cells from a grid row.
+            columns (List): Optional column indices to read. If not set all columns will be read.
+
+        Returns:
+            String array from cell values with empty values for placeholder cells or an empty array if all cells
+            are placeholder cells.
+        """
+        values = []
+        placeholders = 0
+
+        for cell in GridRows._select_columns(cells, columns):
+            value = GridRows._get_cell_value(cell)
+            if GridRows.NewItemPlaceholder in value:
+                value = ""
+                placeholders += 1
+            values.append(value)
+
+        return values if placeholders < len(values) else []
+
+    @staticmethod
+    def _select_columns(values: List[Any], columns: Optional[List[int]]):
+        """
+        Select values from given column indices.
+
+        Args:
+            values (List): All values or cells from a row.
+            columns (List): Column indices to select. If None all values will be returned.
+
+        Raises:
+            FlaUiError: If column index is out of range.
+        """
+        if columns is None:
+            return values
+
+        try:
+            return [values[column] for column in columns]
+        except IndexError:
+            raise FlaUiError(FlaUiError.ArrayOutOfBoundException.format(columns)) from None
@@ -1,8 +1,7 @@
-from re import split, match, search
 from enum import Enum
 from typing import Any
 from FlaUI.Core.WindowsAPI import VirtualKeyShort  # pylint: disable=import-error
-from FlaUILibrary.flaui.exception import FlaUiError
+from FlaUILibrary.flaui.util.keyboardsequence import KeyboardSequence
 
 
 class KeyboardInputConverter:
@@ -10,10 +9,6 @@ class KeyboardInputConverter:
     Helper class for simplifying keyboard input converting.
     """
 
-    SHORTCUT = r'^s\'(.+?)\'$'
-    TEXT = r'^t\'(.+?)\'$'
-    SHORTCUT_DELIMITER = r'[+]'
-
     class InputType(Enum):
         """
         Supported input types.
@@ -117,6 +112,8 @@ class KeyboardInputConverter:
         "F12": VirtualKeyShort.F12
     }
 
+    Compiler = KeyboardSequence(Keys)
+
     @staticmethod
     def convert_key_combination(key_combination: Any):
         """
@@ -131,70 +128,26 @@ class KeyboardInputConverter:
         Returns:
             Pair(Action, ConvertedValue): Action type (text or shortcut) and prepared value.
         """
-        if match(KeyboardInputConverter.SHORTCUT, key_combination):
-
-            (is_success, result) = KeyboardInputConverter._try_convert_to_shortcut(key_combination)
+        operation = KeyboardInputConverter.Compiler.compile_input(key_combination)
 
-            if is_success:
-                return KeyboardInputConverter.InputType.SHORTCUT, result
+        if isinstance(operation, KeyboardSequence.Shortcut):
+            return KeyboardInputConverter.InputType.SHORTCUT, list(operation.keys)
 
-            return KeyboardInputConverter.InputType.TEXT, result
-
-        if match(KeyboardInputConverter.TEXT, key_combination):
-            return (KeyboardInputConverter.InputType.TEXT,
-                    KeyboardInputConverter._extract_value_from_input(KeyboardInputConverter.TEXT,
-                                                                     key_combination))
-
-        raise FlaUiError.raise_fla_ui_error(FlaUiError.KeyboardInvalidKeysCombination.format(key_combination))
+        return KeyboardInputConverter.InputType.TEXT, operation.text
 
     @staticmethod
-    def _try_convert_to_shortcut(key_combination: str):
+    def compile_key_combinations(key_combinations: Any):
         """
-        Convert keys combination to shortcut.
+        Compile user-defined keys combinations into an immutable sequence of shortcut and text operations.
+        Compiled sequences are memoized, so equal keys combinations are only parsed once.
 
         Args:
-            key_combination (String): combination of keys to be converted to the shortcut.
-
-        Returns:
-            Tuple (convert_status, convert_result): z.B. (True, VirtualKeyShort Array), (False, String).
-        """
-
-        shortcut_keys = []
-        extracted_key_combination = KeyboardInputConverter._extract_value_from_input(KeyboardInputConverter.SHORTCUT,
-                                                                                     key_combination)
-
-        keys = split(KeyboardInputConverter.SHORTCUT_DELIMITER,
-                     extracted_key_combination)
-
-        for key in keys:
-
-            if key not in KeyboardInputConverter.Keys:
-                return False, extracted_key_combination
-
-            shortcut_keys.append(KeyboardInputConverter.Keys[key])
-
-        return True, shortcut_keys
-
-    @staticmethod
-    def _extract_value_from_input(value_type, keyboard_input):
-        """
-        Extract input, which should be processed, from the following patterns:
-        - s'CTRL+A'
-        - t'Text to be processed'
-
-        Args:
-            value_type (KeyboardInputConverter.SHORTCUT or TEXT): expected value type.
-            keyboard_input (String): Keyboard input in the format like s'<shortcut>' or t'<text>'.
+            key_combinations (String array): Array of Strings to execute keyboard actions.
 
         Raises:
-            FlaUiError: If key_combination is impossible to extract.
+            FlaUiError: If a key combination is invalid.
 
         Returns:
-            extracted_value (String): extracted from the input value.
+            Tuple from KeyboardSequence.Shortcut and KeyboardSequence.Text operations.
         """
-
-        value = search(value_type, keyboard_input)
-        if value:
-            return value.group(1)
-
-        raise FlaUiError.raise_fla_ui_error(FlaUiError.KeyboardExtractionFailed)
+        return KeyboardInputConverter.Compiler.compile(key_combinations)
@@ -0,0 +1,103 @@
+import json
+import os
+from typing import Dict, List
+from FlaUILibrary.flaui.exception import FlaUiError
+
+
+class KeyboardMacro:
+    """
+    Helper class to read keyboard macros from a file.
+
+    Json macro files contain an object from macro name to a list of keyboard inputs. All other files are read as
+    line format where each macro starts with a [name] section followed by one keyboard input per line. Empty lines
+    and lines starting with # are ignored.
+
+    Example from line format:
+        [login]
+        t'admin'
+        s'TAB'
+        t'secret'
+        s'ENTER'
+    """
+
+    JsonExtension = ".json"
+    Comment = "#"
+
+    @staticmethod
+    def read(path: str) -> Dict[str, List[str]]:
+        """
+        Reads all keyboard macros from file.
+
+        Args:
+            path (String): Filepath to read.
+
+        Raises:
+            FlaUiError: If file could not be read or contains invalid syntax.
+
+        Returns:
+            Dictionary from macro name to keyboard inputs.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                if os.path.splitext(path)[1].lower() == KeyboardMacro.JsonExtension:
+                    return KeyboardMacro._read_json(path, file)
+
+                return KeyboardMacro._read_lines(path, file)
+        except OSError as ex:
+            raise FlaUiError(FlaUiError.KeyboardMacroFileError.format(path, ex.strerror)) from None
+        except UnicodeDecodeError:
+            raise FlaUiError(FlaUiError.KeyboardMacroFileError.format(path, "File is not UTF-8 encoded")) from None
+
+    @staticmethod
+    def _read_json(path: str, file) -> Dict[str, List[str]]:
+        """
+        Reads keyboard macros from json file.
+
+        Args:
+            path (String): Filepath from file.
+            file (Object): Opened file to read.
+        """
+        try:
+            content = json.load(file)
+        except json.JSONDecodeError as ex:
+            raise FlaUiError(FlaUiError.KeyboardMacroSyntax.format(path, ex.lineno, ex.msg)) from None
+
+        if not isinstance(content, dict):
+            raise FlaUiError(FlaUiError.KeyboardMacroSyntax.format(path, 1, "Expected object from macro names"))
+
+        for name, inputs in content.items():
+            if not isinstance(inputs, list) or not all(isinstance(value, str) for value in inputs):
+                raise FlaUiError(FlaUiError.KeyboardMacroSyntax.format(path, 1,
+                                                                       f"Macro '{name}' must be a list of strings"))
+
+        return content
+
+    @staticmethod
+    def _read_lines(path: str, file) -> Dict[str, List[str]]:
+        """
+        Reads keyboard macros from line format file.
+
+        Args:
+            path (String): Filepath from file.
+            file (Object): Opened file to read.
+        """
+        macros: Dict[str, List[str]] = {}
+        inputs = None
+
+        for line_number, line in enumerate(file, start=1):
+            line = line.strip()
+            if not line or line.startswith(KeyboardMacro.Comment):
+                continue
+
+            if line.startswith("[") and line.endswith("]"):
+                name = line[1:-1].strip()
+                if not name:
+                    raise FlaUiError(FlaUiError.KeyboardMacroSyntax.format(path, line_number, line))
+
+                inputs = macros.setdefault(name, [])
+            elif inputs is None:
+                raise FlaUiError(FlaUiError.KeyboardMacroSyntax.format(path, line_number, line))
+            else:
+                inputs.append(line)
+
+        return macros
@@ -0,0 +1,128 @@
+import re
+from typing import Any, Dict, Iterable, Mapping, NamedTuple, Tuple, Union
+from FlaUILibrary.flaui.exception import FlaUiError
+
+
+class KeyboardSequence:
+    """
+    Compiler for keyboard inputs like s'CTRL+A' or t'Text' into an immutable sequence of typed operations.
+
+    Compiled sequences are memoized by their input tuple, so replaying the same inputs does not parse them again.
+    The key table is given by constructor to map shortcut key names to VirtualKeyShort values.
+    """
+
+    Pattern = re.compile(r"^([st])'(.+?)'$")
+    ShortcutDelimiter = "+"
+    MaxCachedSequences = 1024
+
+    class Shortcut(NamedTuple):
+        """
+        Keys to press simultaneously.
+        """
+        keys: Tuple[Any, ...]
+
+    class Text(NamedTuple):
+        """
+        Text to type.
+        """
+        text: str
+
+    def __init__(self, keys: Mapping[str, Any]):
+        """
+        Constructor for keyboard sequence compiler.
+
+        Args:
+            keys (Dictionary): Key names to VirtualKeyShort values.
+        """
+        self._keys = keys
+        self._sequences: Dict[Tuple[str, ...],
+                              Tuple[Union[KeyboardSequence.Shortcut, KeyboardSequence.Text], ...]] = {}
+
+    def compile(self, keyboard_inputs: Iterable[str]):
+        """
+        Compile all keyboard inputs into a sequence of shortcut and text operations.
+
+        Args:
+            keyboard_inputs (List): Keyboard inputs in the format like s'<shortcut>' or t'<text>'.
+
+        Raises:
+            FlaUiError: If a keyboard input is invalid.
+
+        Returns:
+            Tuple from KeyboardSequence.Shortcut and KeyboardSequence.Text operations.
+        """
+        key = tuple(keyboard_inputs)
+        for keyboard_input in key:
+            if not isinstance(keyboard_input, str):
+                raise FlaUiError(FlaUiError.KeyboardInvalidKeysCombination.format(keyboard_input))
+
+        sequence = self._sequences.get(key)
+
+        if sequence is None:
+            sequence = tuple(self.compile_input(keyboard_input) for keyboard_input in key)
+
+            if len(self._sequences) >= KeyboardSequence.MaxCachedSequences:
+                self._sequences.clear()
+
+            self._sequences[key] = sequence
+
+        return sequence
+
+    def compile_input(self, keyboard_input: str):
+        """
+        Compile a single keyboard input into a shortcut or text operation.
+        Shortcuts which contain unknown keys are typed as text.
+
+        Args:
+            keyboard_input (String): Keyboard input in the format like s'<shortcut>' or t'<text>'.
+
+        Raises:
+            FlaUiError: If keyboard input is invalid.
+
+        Returns:
+            KeyboardSequence.Shortcut or KeyboardSequence.Text operation.
+        """
+        result = KeyboardSequence.Pattern.match(keyboard_input)
+        if result is None:
+            raise FlaUiError(FlaUiError.KeyboardInvalidKeysCombination.format(keyboard_input))
+
+        input_type, value = result.groups()
+        if input_type == "t":
+            return KeyboardSequence.Text(value)
+
+        names = value.split(KeyboardSequence.ShortcutDelimiter)
+        if all(name in self._keys for name in names):
+            return KeyboardSequence.Shortcut(tuple(self._keys[name] for name in names))
+
+        return KeyboardSequence.Text(value)
+
+    @staticmethod
+    def merge_texts(sequence: Tuple[Union[Shortcut, Text], ...]):
+        """
+        Merge all adjacent text operations from sequence into one text operation, so each text block can be
+        typed by a single input call.
+
+        Args:
+            sequence (Tuple): Compiled sequence from shortcut and text operations.
+
+        Returns:
+            Tuple from KeyboardSequence.Shortcut and KeyboardSequence.Text operations.
+        """
+        merged = []
+        texts = []
+
+        for operation in sequence:
+            if isinstance(operation, KeyboardSequence.Text):
+                texts.append(operation.text)
+                continue
+
+            if texts:
+                merged.append(KeyboardSequence.Text("".join(texts)))
+                texts = []
+
+            merged.append(operation)
+
+        if texts:
+            merged.append(KeyboardSequence.Text("".join(texts)))
+
+        return tuple(merged)
@@ -0,0 +1,115 @@
+from typing import Any, Dict, Optional, Tuple
+from FlaUILibrary.flaui.util.elementcache import ElementCache
+
+
+class PatternCache:
+    """
+    Cache for supported patterns from elements keyed by runtime id. Elements without a runtime id are not cached
+    and pattern support is read from the element on each probe.
+
+    Pattern support from an element does not change while the element exists, so all known pattern availabilities
+    are fetched by one cache request on first usage and later probes are served from memory. The number of probes
+    which were served from memory is counted as saved cross process calls.
+    """
+
+    MaxCachedElements = 1024
+
+    Patterns = ("Window", "Text", "Toggle", "Value", "RangeValue", "ExpandCollapse", "SelectionItem", "Invoke",
+                "Selection", "Scroll", "ScrollItem", "Grid", "GridItem", "Table", "TableItem")
+
+    _patterns: Dict[Tuple[Any, ...], Dict[str, bool]] = {}
+    _saved_calls = 0
+
+    @staticmethod
+    def is_supported(element: Any, pattern: str) -> bool:
+        """
+        Checks if pattern is supported by element.
+
+        Args:
+            element (Object): Element from FlaUI.
+            pattern (String): Pattern name from element patterns like 'Window' or 'ExpandCollapse'.
+        """
+        key = PatternCache._get_key(element)
+        if key is None:
+            return PatternCache._to_bool(getattr(element.Patterns, pattern).IsSupported)
+
+        patterns = PatternCache._patterns.get(key)
+
+        if patterns is not None and pattern in patterns:
+            PatternCache._saved_calls += 1
+            return patterns[pattern]
+
+        if patterns is None:
+            patterns = PatternCache._fill(key, element)
+
+        if pattern not in patterns:
+            patterns[pattern] = PatternCache._to_bool(getattr(element.Patterns, pattern).IsSupported)
+
+        return patterns[pattern]
+
+    @staticmethod
+    def get_saved_calls() -> int:
+        """
+        Get count from pattern probes which were served from memory instead of a cross process call.
+        """
+        return PatternCache._saved_calls
+
+    @staticmethod
+    def invalidate(element: Any = None):
+        """
+        Removes cached patterns from given element or all elements if no element is given.
+
+        Args:
+            element (Object): Optional element from FlaUI.
+        """
+        if element is None:
+            PatternCache._patterns.clear()
+            return
+
+        key = PatternCache._get_key(element)
+        if key is not None:
+            PatternCache._patterns.pop(key, None)
+
+    @staticmethod
+    def _fill(key: Tuple[Any, ...], element: Any) -> Dict[str, bool]:
+        """
+        Reads availability from all known patterns by one cache request and stores them by key.
+
+        Args:
+            key (Tuple): Cache key from element.
+            element (Object): Element from FlaUI.
+        """
+        library = element.Automation.PatternLibrary
+        patterns = [getattr(library, f"{pattern}Pattern") for pattern in PatternCache.Patterns]
+        request = ElementCache.create_request([pattern.AvailabilityProperty for pattern in patterns])
+
+        with ElementCache.activate(request):
+            cached = element.GetUpdatedCache()
+            supported = {pattern: PatternCache._to_bool(getattr(cached.Patterns, pattern).IsSupported)
+                         for pattern in PatternCache.Patterns}
+
+        if len(PatternCache._patterns) >= PatternCache.MaxCachedElements:
+            PatternCache._patterns.clear()
+
+        PatternCache._patterns[key] = supported
+        return supported
+
+    @staticmethod
+    def _get_key(element: Any) -> Optional[Tuple[Any, ...]]:
+        """
+        Get cache key from element by runtime id or None if element has no runtime id.
+
+        Args:
+            element (Object): Element from FlaUI.
+        """
+        return ElementCache.find_runtime_id(element)
+
+    @staticmethod
+    def _to_bool(is_supported: Any) -> bool:
+        """
+        Convert pattern support from bool or FlaUI.Core.AutomationProperty[Boolean] to bool.
+
+        Args:
+            is_supported (Object): IsSupported value from automation pattern.
+        """
+        return bool(is_supported) if isinstance(is_supported, bool) else bool(is_supported.Value)
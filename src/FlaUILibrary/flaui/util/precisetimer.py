@@ -0,0 +1,57 @@
+import time
+from typing import Any, Callable, Optional
+
+
+class PreciseTimer:
+    """
+    Helper class to wait for a duration by a high resolution monotonic timer.
+
+    The operating system sleep is used for most of the duration and the last milliseconds are spun on
+    time.perf_counter, so the wait is not extended by the sleep granularity from the operating system.
+    """
+
+    SpinThreshold = 0.002
+
+    @staticmethod
+    def sleep(seconds: float):
+        """
+        Wait for the given duration.
+
+        Args:
+            seconds (Number): Duration to wait in seconds.
+        """
+        PreciseTimer.sleep_until(time.perf_counter() + seconds)
+
+    @staticmethod
+    def sleep_until(deadline: float):
+        """
+        Wait until the given time.perf_counter deadline is reached.
+
+        Args:
+            deadline (Number): Deadline from time.perf_counter in seconds.
+        """
+        remaining = deadline - time.perf_counter() - PreciseTimer.SpinThreshold
+        if remaining > 0:
+            time.sleep(remaining)
+
+        while time.perf_counter() < deadline:
+            pass
+
+    @staticmethod
+    def run_for(seconds: float, callback: Optional[Callable[[], Any]] = None):
+        """
+        Execute callback and wait until the given duration from start is over.
+        The runtime from callback is part of the duration. If callback takes longer than the duration, it is not
+        interrupted and no additional time is waited.
+
+        Args:
+            seconds (Number): Duration to wait in seconds.
+            callback (Function): Optional function to execute at the start of the duration.
+
+        Returns:
+            Result from callback or None if no callback is given.
+        """
+        deadline = time.perf_counter() + seconds
+        result = callback() if callback is not None else None
+        PreciseTimer.sleep_until(deadline)
+        return result
@@ -0,0 +1,89 @@
+from typing import Any, Iterable, List, Tuple
+from FlaUI.Core.AutomationElements import AutomationElementExtensions  # pylint: disable=import-error
+from FlaUI.Core.Definitions import ControlType  # pylint: disable=import-error
+from FlaUILibrary.flaui.util.elementcache import ElementCache
+
+
+class SelectorItems:
+    """
+    A helper class to read items from selector controls like listbox and combobox.
+
+    Listbox items are fetched with their names by one cache request. Other selectors are read from their items
+    property. Texts are only read if an item does not match by name.
+    """
+
+    @staticmethod
+    def create_cache_request(control: Any):
+        """
+        Creates a cache request for name reads from selector items.
+
+        Args:
+            control (Object): Selector control element from FlaUI.
+        """
+        return ElementCache.create_request([control.Automation.PropertyLibrary.Element.Name])
+
+    @staticmethod
+    def get_items(control: Any):
+        """
+        Get all items from selector with their names in one pass.
+
+        Args:
+            control (Object): Selector object to use (Combobox, Listbox).
+
+        Returns:
+            List from tuples (name, item).
+        """
+        if control.ControlType != ControlType.List:
+            return [(item.Name, item) for item in control.Items]
+
+        with ElementCache.activate(SelectorItems.create_cache_request(control)):
+            return [(child.Name, AutomationElementExtensions.AsListBoxItem(child))
+                    for child in SelectorItems._find_list_items(control)]
+
+    @staticmethod
+    def get_count(control: Any):
+        """
+        Get count from all items from selector.
+
+        Args:
+            control (Object): Selector object to use (Combobox, Listbox).
+        """
+        if control.ControlType != ControlType.List:
+            return control.Items.Length
+
+        with ElementCache.activate(SelectorItems.create_cache_request(control)):
+            return SelectorItems._find_list_items(control).Length
+
+    @staticmethod
+    def find_missing(items: Iterable[Tuple[str, Any]], names: List[str]):
+        """
+        Searches all given names by item name or text in one pass and stops as soon as all names are found.
+
+        Args:
+            items (Iterable): Tuples (name, item) from selector items.
+            names (List): Names or texts from items to search.
+
+        Returns:
+            List from all names which could not be found in given order.
+        """
+        remaining = set(names)
+
+        for name, item in items:
+            remaining.discard(name)
+            if remaining:
+                remaining.discard(item.Text)
+
+            if not remaining:
+                break
+
+        return [name for name in names if name in remaining]
+
+    @staticmethod
+    def _find_list_items(control: Any):
+        """
+        Find all list items from a listbox.
+
+        Args:
+            control (Object): Listbox element from FlaUI.
+        """
+        return control.FindAllChildren(control.ConditionFactory.ByControlType(ControlType.ListItem))
@@ -1,9 +1,13 @@
-from typing import Any
+from fnmatch import fnmatchcase
+from typing import Any, List, Optional
 from System import InvalidOperationException  # pylint: disable=import-error
-from FlaUI.Core.Definitions import ExpandCollapseState  # pylint: disable=import-error
+from FlaUI.Core.AutomationElements import AutomationElementExtensions  # pylint: disable=import-error
+from FlaUI.Core.Definitions import ControlType, ExpandCollapseState  # pylint: disable=import-error
 from FlaUILibrary.flaui.exception import FlaUiError
 from FlaUILibrary.flaui.enum.treeitemaction import TreeItemAction
-from FlaUILibrary.flaui.util.treeitemsparser import TreeItemsParser
+from FlaUILibrary.flaui.util.elementcache import ElementCache
+from FlaUILibrary.flaui.util.treelocation import TreeLocation
+from FlaUILibrary.flaui.util.treepathindex import TreePathIndex
 
 
 class TreeItems:
@@ -11,36 +15,133 @@ class TreeItems:
     A helper class for tree control.
     """
 
+    ExpandedStates = (ExpandCollapseState.Expanded, ExpandCollapseState.PartiallyExpanded)
+
+    @staticmethod
+    def create_cache_request(control: Any, with_selection: bool = False):
+        """
+        Creates a cache request for name and expand collapse state reads from tree items.
+
+        Args:
+            control (Object): Tree control element from FlaUI.
+            with_selection (Boolean): If selection state should be cached as well.
+        """
+        automation = control.Automation
+        properties = [automation.PropertyLibrary.Element.Name,
+                      automation.PropertyLibrary.ExpandCollapse.ExpandCollapseState]
+        patterns = [automation.PatternLibrary.ExpandCollapsePattern]
+
+        if with_selection:
+            properties.append(automation.PropertyLibrary.SelectionItem.IsSelected)
+            patterns.append(automation.PatternLibrary.SelectionItemPattern)
+
+        return ElementCache.create_request(properties, patterns)
+
+    @staticmethod
+    def walk(control: Any, max_depth: Optional[int] = None, cache_request: Any = None):
+        """
+        Iterative depth first walk through all visible tree items in tree order.
+
+        Children from each node are fetched with name and expand collapse state by one cache request.
+        Nodes are returned before their children are fetched, so a consumer can stop early without reading the
+        remaining tree.
+
+        Args:
+            control (Object): Tree control or tree item to walk through.
+            max_depth (Number): Optional maximum depth from nodes to return. Root nodes have depth 1.
+            cache_request (Object): Optional cache request to reuse.
+
+        Returns:
+            Generator from (path, node, state) with path as tuple from all names from root to node.
+        """
+        request = cache_request if cache_request is not None else TreeItems.create_cache_request(control)
+        stack = TreeItems._get_children(control, (), request)
+
+        while stack:
+            path, node, state = stack.pop()
+            yield path, node, state
+
+            if max_depth is not None and len(path) >= max_depth:
+                continue
+
+            if state in TreeItems.ExpandedStates:
+                stack.extend(TreeItems._get_children(node, path, request))
+
     @staticmethod
-    def get_visible_leaf_count(nodes: Any):
+    def iter_snapshot(control: Any, max_depth: Optional[int] = None):
+        """
+        Generator which yields name, depth, expand collapse state and selection state from all visible tree items
+        in tree order. All values are served from the cache request which fetched the tree items.
+
+        Args:
+            control (Object): Tree control element from FlaUI.
+            max_depth (Number): Optional maximum depth from nodes to return. Root nodes have depth 1.
+
+        Returns:
+            Generator from dictionaries with name, depth, state and selected.
+        """
+        request = TreeItems.create_cache_request(control, with_selection=True)
+
+        for path, node, state in TreeItems.walk(control, max_depth, request):
+            with ElementCache.activate(request):
+                selected = TreeItems._is_selected(node)
+
+            yield {"name": path[-1], "depth": len(path), "state": str(state), "selected": selected}
+
+    @staticmethod
+    def get_visible_leaf_count(control: Any):
         """
         Get count from all visible nodes which are visible.
 
         Args:
-            nodes (Object): TreeItems[] from current node
+            control (Object): Tree control element from FlaUI.
 
         Returns:
             Count from all visible nodes
         """
-        node_count = nodes.Length
-        for node in nodes:
-            if node.ExpandCollapseState in (ExpandCollapseState.Expanded, ExpandCollapseState.PartiallyExpanded):
-                node_count += TreeItems.get_visible_leaf_count(node.Items)
-
-        return node_count
+        return sum(1 for _ in TreeItems.walk(control))
 
     @staticmethod
-    def expand_all_tree_nodes(nodes: Any):
+    def expand_all_tree_nodes(control: Any, max_depth: Optional[int] = None, name_filter: Optional[str] = None):
         """
-        Expand all tree nodes.
+        Expand all tree nodes level by level.
+
+        All expand calls from a level are issued before children from this level are read, so the provider can
+        realize all children while the next expand calls are sent.
 
         Args:
-            nodes (Object): TreeItems[] from current node
+            control (Object): Tree control element from FlaUI.
+            max_depth (Number): Optional maximum depth from nodes to expand. Root nodes have depth 1.
+            name_filter (String): Optional glob pattern. Only nodes with a matching name will be expanded.
+
+        Returns:
+            Tuple from count of all visited nodes and count of expanded nodes.
         """
-        for node in nodes:
-            if node.ExpandCollapseState in (ExpandCollapseState.Expanded, ExpandCollapseState.Collapsed):
+        request = TreeItems.create_cache_request(control)
+        level = TreeItems._get_children(control, (), request)[::-1]
+        depth = 1
+        node_count = 0
+        expand_count = 0
+
+        while level and (max_depth is None or depth <= max_depth):
+            node_count += len(level)
+            nodes = [(path, node) for path, node, state in level
+                     if state != ExpandCollapseState.LeafNode
+                     and (name_filter is None or fnmatchcase(path[-1], name_filter))]
+
+            for path, node in nodes:
                 node.Expand()
-                TreeItems.expand_all_tree_nodes(node.Items)
+
+            expand_count += len(nodes)
+            level = []
+
+            if max_depth is None or depth < max_depth:
+                for path, node in nodes:
+                    level.extend(TreeItems._get_children(node, path, request)[::-1])
+
+            depth += 1
+
+        return node_count, expand_count
 
     @staticmethod
     def collapse(nodes: Any):
@@ -55,102 +156,288 @@ class TreeItems:
                 node.Collapse()
 
     @staticmethod
-    def get_all_names_from_tree_nodes(nodes: Any):
+    def get_all_names_from_tree_nodes(control: Any):
         """
         Get all names from all visible nodes.
 
         Args:
-            nodes (Object): TreeItems[] from current node
+            control (Object): Tree control element from FlaUI.
 
         Returns:
             List from all node names.
         """
-        names = []
+        return [path[-1] for path, _, _ in TreeItems.walk(control)]
 
-        for node in nodes:
-            names.append(node.Name)
-            if node.ExpandCollapseState in (ExpandCollapseState.Expanded, ExpandCollapseState.PartiallyExpanded):
-                names.extend(TreeItems.get_all_names_from_tree_nodes(node.Items))
+    @staticmethod
+    def is_visible_node(control: Any, name: str):
+        """
+        Checks if a visible node exists by a given name.
 
-        return names
+        Args:
+            control (Object): Tree control element from FlaUI.
+            name (String): Name from node to search.
+
+        Returns:
+            True if name was found on any visible node level otherwise False.
+        """
+        return TreeItems._find_visible_node_by_name(control, name) is not None
 
     @staticmethod
-    def select_visible_node_by_name(nodes: Any, name: str):
+    def select_visible_node_by_name(control: Any, name: str):
         """
         Selects a tree item with the given name in tree
 
         Args:
-            nodes (Object): TreeItems[] from current node
+            control (Object): Tree control element from FlaUI.
             name (String): Name to search on node.
 
         Raises:
             FlaUiError: If node by a given name could not be found.
         """
-        if not TreeItems._find_visible_node_by_name(nodes, name):
+        node = TreeItems._find_visible_node_by_name(control, name)
+        if node is None:
             raise FlaUiError(FlaUiError.ElementNameNotFound.format(name))
 
+        node.Select()
+
     @staticmethod
-    def execute_by_location(nodes: Any, location: str, seperator: str, action: TreeItemAction):
+    def execute_by_location(control: Any, location: str, seperator: str, action: TreeItemAction,
+                            path_index: Optional[TreePathIndex] = None):
         """
         Executes the given TreeItemAction to the last element from a tree location.
 
+        If a path index is given all intermediate tree items are stored by their location prefix and a location
+        with a known prefix continues from the deepest stored tree item instead of searching each level again.
+
         Args:
-            nodes (Object): TreeItems[] from current node
+            control (Object): Tree control element from FlaUI.
             location (String): Location string to execute operations on nodes.
             seperator (String): Seperator to split up tree items
             action (TreeItemAction) : Action to operate on node.
+            path_index (TreePathIndex): Optional prefix cache from tree items.
 
         Raises:
             FlaUiError: If action is not supported.
             FlaUiError: If location syntax is wrong.
             FlaUiError: If node is not expandable.
         """
-        parser = TreeItemsParser(location, seperator)
-        current_nodes = nodes
-
-        for index in range(len(parser.location)):
-            node = parser.get_treeitem(current_nodes, index)
-            if parser.is_last_element(index):
-                try:
-                    if action == TreeItemAction.EXPAND:
-                        node.Expand()
-                    elif action == TreeItemAction.COLLAPSE:
-                        node.Collapse()
-                    elif action == TreeItemAction.SELECT:
-                        node.Select()
-                except ValueError:
-                    raise FlaUiError(FlaUiError.FalseSyntax.format(
-                        "self.current_treeitem." + action.value + "()")) from None
-                except InvalidOperationException:
-                    raise FlaUiError(FlaUiError.ElementNotExpandable.format(node.Name)) from None
-                except Exception:
-                    raise FlaUiError(FlaUiError.FalseSyntax.format(
-                        "self.current_treeitem." + action.value + "()")) from None
-            else:
-                if node.ExpandCollapseState == ExpandCollapseState.LeafNode:
-                    raise FlaUiError(FlaUiError.ElementNotExpandable.format(node.Name))
-                node.Expand()
+        node = TreeItems._resolve(control, TreeLocation.parse(location, seperator), path_index, {})
+        TreeItems._execute_action(node, action)
+
+    @staticmethod
+    def select_by_locations(control: Any, locations: List[str], seperator: str,
+                            path_index: Optional[TreePathIndex] = None):
+        """
+        Selects the last element from each tree location in given order.
+
+        All locations are parsed before any tree item is touched and resolved in sorted order, so tree items from
+        a shared prefix are searched and expanded only once.
+
+        Args:
+            control (Object): Tree control element from FlaUI.
+            locations (List): Location strings from tree items to select.
+            seperator (String): Seperator to split up tree items
+            path_index (TreePathIndex): Optional prefix cache from tree items.
+
+        Raises:
+            FlaUiError: If location syntax is wrong.
+            FlaUiError: If node is not expandable.
+        """
+        parsed = [TreeLocation.parse(location, seperator) for location in locations]
+        resolved = {}
+
+        for location in sorted(set(parsed), key=lambda item: item.segments):
+            TreeItems._resolve(control, location, path_index, resolved)
+
+        for location in parsed:
+            TreeItems._execute_action(resolved[location.segments], TreeItemAction.SELECT)
+
+    @staticmethod
+    def _resolve(control: Any, location: TreeLocation, path_index: Optional[TreePathIndex], resolved: dict):
+        """
+        Finds the last element from a tree location and expands all intermediate tree items.
+
+        Args:
+            control (Object): Tree control element from FlaUI.
+            location (TreeLocation): Parsed location from tree item.
+            path_index (TreePathIndex): Optional prefix cache from tree items.
+            resolved (Dict): Tree items from already resolved location prefixes, will be extended.
+
+        Raises:
+            FlaUiError: If node could not be found.
+            FlaUiError: If node is not expandable.
+        """
+        start, current_nodes = TreeItems._get_cached_prefix(control, location, path_index, resolved)
+        node = None
+
+        for index in range(start, len(location)):
+            prefix = location.segments[:index + 1]
+            node = location.get_treeitem(current_nodes, index)
+            resolved[prefix] = node
+
+            if not location.is_last_element(index):
+                TreeItems._expand_node(node)
+                if path_index is not None:
+                    path_index.add(control, prefix, node)
                 current_nodes = node.Items
 
+        return resolved[location.segments] if node is None else node
+
     @staticmethod
-    def _find_visible_node_by_name(nodes: Any, name: str):
+    def _execute_action(node: Any, action: TreeItemAction):
         """
-        Finds if a node is visible by a given name.
+        Executes the given TreeItemAction on a tree item.
 
         Args:
-            nodes (Object): TreeItems[] from current node
+            node (Object): Tree item element from FlaUI.
+            action (TreeItemAction) : Action to operate on node.
+
+        Raises:
+            FlaUiError: If action is not supported.
+            FlaUiError: If node is not expandable.
+        """
+        try:
+            if action == TreeItemAction.EXPAND:
+                node.Expand()
+            elif action == TreeItemAction.COLLAPSE:
+                node.Collapse()
+            elif action == TreeItemAction.SELECT:
+                node.Select()
+        except ValueError:
+            raise FlaUiError(FlaUiError.FalseSyntax.format(
+                "self.current_treeitem." + action.value + "()")) from None
+        except InvalidOperationException:
+            raise FlaUiError(FlaUiError.ElementNotExpandable.format(node.Name)) from None
+        except Exception:
+            raise FlaUiError(FlaUiError.FalseSyntax.format(
+                "self.current_treeitem." + action.value + "()")) from None
+
+    @staticmethod
+    def _get_cached_prefix(control: Any, location: TreeLocation, path_index: Optional[TreePathIndex],
+                           resolved: dict):
+        """
+        Get deepest known tree item from all intermediate location prefixes.
+        Tree items which were resolved in the same call are used first, afterwards stored tree items from path
+        index. All stored tree items on this prefix will be expanded if they were collapsed in the meantime.
+
+        Args:
+            control (Object): Tree control element from FlaUI.
+            location (TreeLocation): Parsed location from tree item.
+            path_index (TreePathIndex): Optional prefix cache from tree items.
+            resolved (Dict): Tree items from already resolved location prefixes.
+
+        Returns:
+            Tuple from location index to continue and tree items from this level.
+        """
+        segments = location.segments
+        node = None
+        start = 0
+
+        for length in range(len(segments), 0, -1):
+            if segments[:length] in resolved:
+                if length == len(segments):
+                    return length, None
+                node = resolved[segments[:length]]
+                TreeItems._expand_node(node)
+                start = length
+                break
+
+        if path_index is not None:
+            for length in range(start + 1, len(segments)):
+                part = location.parts[length - 1]
+                cached = path_index.get(control, segments[:length], part if isinstance(part, int) else None,
+                                        control if node is None else node)
+                if cached is None:
+                    break
+
+                TreeItems._expand_node(cached)
+                node = cached
+                start = length
+
+        return start, control.Items if node is None else node.Items
+
+    @staticmethod
+    def _expand_node(node: Any):
+        """
+        Expands tree item if it is not expanded.
+
+        Args:
+            node (Object): Tree item element from FlaUI.
+
+        Raises:
+            FlaUiError: If node is not expandable.
+        """
+        state = node.ExpandCollapseState
+        if state == ExpandCollapseState.LeafNode:
+            raise FlaUiError(FlaUiError.ElementNotExpandable.format(node.Name))
+
+        if state not in TreeItems.ExpandedStates:
+            node.Expand()
+
+    @staticmethod
+    def _find_visible_node_by_name(control: Any, name: str):
+        """
+        Finds first visible node by a given name.
+
+        Args:
+            control (Object): Tree control element from FlaUI.
             name (String): Name from node to search.
 
         Returns:
-            True if name was found on any visible node level otherwise False.
+            Node if name was found on any visible node level otherwise None.
         """
-        for node in nodes:
-            if node.Name == name:
-                node.Select()
-                return True
+        for path, node, _ in TreeItems.walk(control):
+            if path[-1] == name:
+                return node
 
-            if node.ExpandCollapseState in (ExpandCollapseState.Expanded, ExpandCollapseState.PartiallyExpanded):
-                if TreeItems._find_visible_node_by_name(node.Items, name):
-                    return True
+        return None
+
+    @staticmethod
+    def _get_children(parent: Any, path: tuple, cache_request: Any):
+        """
+        Fetches all child tree items with name and expand collapse state by one cache request.
+
+        Args:
+            parent (Object): Tree control or tree item from FlaUI.
+            path (Tuple): Names from root to parent.
+            cache_request (Object): Cache request to fetch children.
+
+        Returns:
+            List from (path, node, state) in reversed tree order to be used as stack.
+        """
+        with ElementCache.activate(cache_request):
+            condition = parent.ConditionFactory.ByControlType(ControlType.TreeItem)
+            children = [(path + (child.Name,), AutomationElementExtensions.AsTreeItem(child),
+                         TreeItems._get_state(child))
+                        for child in parent.FindAllChildren(condition)]
+
+        children.reverse()
+        return children
+
+    @staticmethod
+    def _get_state(node: Any):
+        """
+        Get expand collapse state from node. Must be called while a cache request is active.
+
+        Args:
+            node (Object): Tree item element from FlaUI.
+        """
+        pattern = node.Patterns.ExpandCollapse.PatternOrDefault
+        if pattern is None:
+            return ExpandCollapseState.LeafNode
+
+        return pattern.ExpandCollapseState.Value
+
+    @staticmethod
+    def _is_selected(node: Any):
+        """
+        Get selection state from node. Must be called while a cache request is active.
+
+        Args:
+            node (Object): Tree item element from FlaUI.
+        """
+        pattern = node.Patterns.SelectionItem.PatternOrDefault
+        if pattern is None:
+            return False
 
-        return False
+        return bool(pattern.IsSelected.Value)
@@ -0,0 +1,109 @@
+from functools import lru_cache
+from typing import Any, Tuple, Union
+from FlaUILibrary.flaui.exception import FlaUiError
+
+
+class TreeLocation:
+    """
+    Parsed location string from a tree item.
+    The location is used to locate the exact tree item in the tree control.
+    Examples:
+    location = N:Nameofitem1->N:Nameofitem2->N:Nameofitem3
+    location = I:indexofitem1->I:indexofitem2->I:indexofitem3
+    location = N:Nameofitem1->I:indexofitem2->I:indexofitem3
+
+    Each location is parsed and validated once and memoized by location and seperator. Index parts are stored as
+    numbers and name parts as strings.
+    """
+
+    IndexSeperator = "I:"
+    NameSeperator = "N:"
+    MaxCachedLocations = 1024
+
+    def __init__(self, location: str, segments: Tuple[str, ...], parts: Tuple[Union[int, str], ...]):
+        self.location = location
+        self.segments = segments
+        self.parts = parts
+
+    def __len__(self):
+        return len(self.parts)
+
+    @staticmethod
+    @lru_cache(maxsize=MaxCachedLocations)
+    def parse(location: str, seperator: str):
+        """
+        Parses and validates a location string.
+
+        Args:
+            location (String): Location string to parse.
+            seperator (String): Seperator to split up tree items.
+
+        Raises:
+            FlaUiError: If any part from location has a wrong syntax. Error contains part and character position.
+
+        Returns:
+            TreeLocation object.
+        """
+        segments = tuple(location.split(seperator))
+        parts = []
+        position = 0
+
+        for segment in segments:
+            parts.append(TreeLocation._parse_segment(segment, position))
+            position += len(segment) + len(seperator)
+
+        return TreeLocation(location, segments, tuple(parts))
+
+    def get_treeitem(self, treeitems: Any, index: int):
+        """
+        Get tree item from a level of the location by index or name.
+
+        Args:
+            treeitems (Object): TreeItems[] from current level.
+            index (Number): Index from part in location.
+
+        Raises:
+            FlaUiError: If index or name could not be found.
+        """
+        part = self.parts[index]
+
+        if isinstance(part, int):
+            try:
+                return treeitems[part]
+            except IndexError:
+                raise FlaUiError(FlaUiError.ArrayOutOfBoundException.format(part)) from None
+
+        for item in treeitems:
+            if item.Name == part:
+                return item
+
+        raise FlaUiError(FlaUiError.ElementNameNotFound.format(part))
+
+    def is_last_element(self, index: int):
+        """
+        Returns true if the index corresponds the last element of location.
+        """
+        return index == len(self.parts) - 1
+
+    @staticmethod
+    def _parse_segment(segment: str, position: int):
+        """
+        Parses a single part from location.
+
+        Args:
+            segment (String): Part from location.
+            position (Number): Character position from part in location.
+
+        Raises:
+            FlaUiError: If part has a wrong syntax.
+        """
+        if segment.startswith(TreeLocation.NameSeperator):
+            return segment[2:]
+
+        if segment.startswith(TreeLocation.IndexSeperator):
+            try:
+                return int(segment[2:])
+            except ValueError:
+                pass
+
+        raise FlaUiError(FlaUiError.FalseSyntaxAtPosition.format(segment, position))
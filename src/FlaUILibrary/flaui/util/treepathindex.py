@@ -0,0 +1,100 @@
+from typing import Any, Dict, Optional, Tuple
+from System.Runtime.InteropServices import COMException  # pylint: disable=import-error
+from FlaUI.Core.Exceptions import ElementNotAvailableException  # pylint: disable=import-error
+from FlaUILibrary.flaui.util.elementcache import ElementCache
+
+
+class TreePathIndex:
+    """
+    Prefix cache from parsed tree locations to tree item handles.
+
+    Each intermediate tree item which was resolved by a location is stored by runtime id from tree and the parsed
+    location prefix, so a following location with the same prefix can continue directly from the deepest known
+    tree item. A stored tree item is only reused if it is still alive and has the same name as while it was stored.
+    Tree items from index parts are only reused if they are still at the same index from their parent, so inserted
+    or removed siblings do not resolve to another tree item than a live lookup.
+    """
+
+    MaxCachedPaths = 1024
+
+    def __init__(self):
+        self._nodes: Dict[Tuple[Any, Tuple[str, ...]], Tuple[Any, str, Tuple[Any, ...]]] = {}
+
+    def get(self, control: Any, prefix: Tuple[str, ...], index: Optional[int] = None, parent: Any = None):
+        """
+        Get tree item from a location prefix if it is stored and still valid.
+
+        Args:
+            control (Object): Tree control element from FlaUI.
+            prefix (Tuple): Parsed location parts from root to tree item.
+            index (Number): Index from tree item in parent if last location part is an index part.
+            parent (Object): Parent tree item or tree control to verify index from tree item.
+
+        Returns:
+            Tree item or None if prefix is unknown or tree item is not valid anymore.
+        """
+        key = (ElementCache.get_runtime_id(control), prefix)
+        entry = self._nodes.get(key)
+        if entry is None:
+            return None
+
+        node, name, runtime_id = entry
+        if not TreePathIndex._is_alive(node, name, runtime_id, index, parent):
+            del self._nodes[key]
+            return None
+
+        return node
+
+    def add(self, control: Any, prefix: Tuple[str, ...], node: Any):
+        """
+        Stores tree item by location prefix.
+
+        Args:
+            control (Object): Tree control element from FlaUI.
+            prefix (Tuple): Parsed location parts from root to tree item.
+            node (Object): Tree item element from FlaUI.
+        """
+        if len(self._nodes) >= TreePathIndex.MaxCachedPaths:
+            self._nodes.clear()
+
+        self._nodes[(ElementCache.get_runtime_id(control), prefix)] = (node, node.Name,
+                                                                       ElementCache.get_runtime_id(node))
+
+    def invalidate(self, control: Any = None):
+        """
+        Removes all stored tree items from given tree or all trees if no control is given.
+
+        Args:
+            control (Object): Optional tree control element from FlaUI.
+        """
+        if control is None:
+            self._nodes.clear()
+            return
+
+        runtime_id = ElementCache.get_runtime_id(control)
+        for key in [key for key in self._nodes if key[0] == runtime_id]:
+            del self._nodes[key]
+
+    @staticmethod
+    def _is_alive(node: Any, name: str, runtime_id: Tuple[Any, ...], index: Optional[int], parent: Any):
+        """
+        Checks if tree item is still available, was not reused for another item and is still at the same index.
+
+        Args:
+            node (Object): Tree item element from FlaUI.
+            name (String): Name from tree item while it was stored.
+            runtime_id (Tuple): Runtime id from tree item while it was stored.
+            index (Number): Expected index from tree item in parent or None to skip index check.
+            parent (Object): Parent tree item or tree control.
+        """
+        try:
+            if ElementCache.get_runtime_id(node) != runtime_id or node.Name != name:
+                return False
+
+            if index is None:
+                return True
+
+            items = parent.Items
+            return 0 <= index < len(items) and ElementCache.get_runtime_id(items[index]) == runtime_id
+        except (ElementNotAvailableException, COMException):
+            return False
@@ -0,0 +1,158 @@
+import json
+from enum import Enum
+from typing import Any, Dict, Iterable, List
+from FlaUILibrary.flaui.exception import FlaUiError
+
+
+class TreeSnapshot:
+    """
+    Helper class to write tree snapshots to a file and to compare them offline.
+
+    A snapshot contains name, depth, expand collapse state and selection state from each tree item in tree order.
+    Json snapshots are stored as nested objects with children and jsonl snapshots as one object per line.
+    Both formats are compared as flat item sequence, so snapshots from different formats can be compared as well.
+    """
+
+    Fields = ("name", "depth", "state", "selected")
+
+    class FileFormat(Enum):
+        """
+        Supported file formats for tree snapshots.
+        """
+        JSON = "json"
+        JSONL = "jsonl"
+
+    @staticmethod
+    def get_file_format(file_format: str):
+        """
+        Get supported file format from string.
+
+        Args:
+            file_format (String): File format as string like json or jsonl.
+
+        Raises:
+            FlaUiError: If file format is not supported.
+        """
+        try:
+            return TreeSnapshot.FileFormat(str(file_format).lower())
+        except ValueError:
+            raise FlaUiError(FlaUiError.FileFormatNotSupported.format(file_format)) from None
+
+    @staticmethod
+    def write(items: Iterable[Dict[str, Any]], path: str, file_format: str = "json"):
+        """
+        Writes all tree items to file. Jsonl items are streamed line by line.
+
+        Args:
+            items (Iterable): Tree items as dictionaries with name, depth, state and selected in tree order.
+            path (String): Filepath to write.
+            file_format (String): File format json or jsonl.
+
+        Raises:
+            FlaUiError: If file format is not supported.
+
+        Returns:
+            Count from all written tree items.
+        """
+        file_format = TreeSnapshot.get_file_format(file_format)
+        count = 0
+
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            if file_format == TreeSnapshot.FileFormat.JSONL:
+                for item in items:
+                    file.write(json.dumps(item, ensure_ascii=False) + "\n")
+                    count += 1
+            else:
+                roots = []
+                levels = [roots]
+
+                for item in items:
+                    node = dict(item, children=[])
+                    del levels[item["depth"]:]
+                    levels[-1].append(node)
+                    levels.append(node["children"])
+                    count += 1
+
+                json.dump(roots, file, ensure_ascii=False, indent=2)
+
+        return count
+
+    @staticmethod
+    def read(path: str):
+        """
+        Reads all tree items from a json or jsonl snapshot in tree order.
+
+        Args:
+            path (String): Filepath from snapshot.
+
+        Returns:
+            List from tree items as tuples (name, depth, state, selected).
+        """
+        with open(path, "r", encoding="utf-8") as file:
+            content = file.read()
+
+        if content.lstrip().startswith("["):
+            return TreeSnapshot._flatten(json.loads(content))
+
+        return [TreeSnapshot._to_tuple(json.loads(line)) for line in content.splitlines() if line.strip()]
+
+    @staticmethod
+    def should_match(path: str, expected_path: str):
+        """
+        Compares a tree snapshot against an expected snapshot in one pass.
+
+        Args:
+            path (String): Filepath from snapshot to verify.
+            expected_path (String): Filepath from expected snapshot.
+
+        Raises:
+            FlaUiError: If snapshots are not equal. Error contains the first different tree item.
+        """
+        actual = TreeSnapshot.read(path)
+        expected = TreeSnapshot.read(expected_path)
+
+        for index, (actual_item, expected_item) in enumerate(zip(actual, expected)):
+            if actual_item != expected_item:
+                raise FlaUiError(FlaUiError.TreeSnapshotNotEqual.format(
+                    index, TreeSnapshot._format(actual_item), TreeSnapshot._format(expected_item)))
+
+        if len(actual) != len(expected):
+            raise FlaUiError(FlaUiError.TreeSnapshotCountNotEqual.format(len(actual), len(expected)))
+
+    @staticmethod
+    def _flatten(roots: List[Dict[str, Any]]):
+        """
+        Converts nested tree items to a flat list in tree order.
+
+        Args:
+            roots (List): Nested tree items with children.
+        """
+        items = []
+        stack = list(reversed(roots))
+
+        while stack:
+            node = stack.pop()
+            items.append(TreeSnapshot._to_tuple(node))
+            stack.extend(reversed(node.get("children", [])))
+
+        return items
+
+    @staticmethod
+    def _to_tuple(item: Dict[str, Any]):
+        """
+        Converts tree item to a comparable tuple.
+
+        Args:
+            item (Dict): Tree item from snapshot.
+        """
+        return tuple(item.get(field) for field in TreeSnapshot.Fields)
+
+    @staticmethod
+    def _format(item: Any):
+        """
+        Formats tree item tuple for error messages.
+
+        Args:
+            item (Tuple): Tree item from snapshot.
+        """
+        return ", ".join(f"{field}={value}" for field, value in zip(TreeSnapshot.Fields, item))
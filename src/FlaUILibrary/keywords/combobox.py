@@ -213,6 +213,36 @@ class ComboBoxKeywords:
                              Selector.create_value_container(element=element, msg=msg),
                              msg=msg)
 
+    @keyword
+    def get_combobox_snapshot(self, identifier, msg=None):
+        """
+        Return names, texts, selected names and count from combobox items as dictionary.
+
+        Combobox items are read in one expand and read cycle and reused by later combobox reads until an item is
+        selected or the combobox is expanded by `Expand Combobox`.
+
+        XPaths syntax is explained in `XPath locator`.
+
+        If element could not be found by xpath an error message will be thrown.
+
+        Arguments:
+        | Argument   | Type   | Description                   |
+        | identifier | string | XPath identifier from element |
+        | msg        | string | Custom error message          |
+
+        Examples:
+        | ${SNAPSHOT}  Get Combobox Snapshot  <XPATH> |
+        | Should Be Equal  ${SNAPSHOT}[count]  ${4}   |
+        | Should Be Equal  ${SNAPSHOT}[names]  ${names} |
+        | Should Be Equal  ${SNAPSHOT}[selected]  ${selected} |
+
+        """
+        module = self._container.create_or_get_module()
+        element = module.get_element(identifier, InterfaceType.COMBOBOX, msg)
+        return module.action(Selector.Action.GET_SNAPSHOT,
+                             Selector.create_value_container(element=element, msg=msg),
+                             msg)
+
     @keyword
     def collapse_combobox(self, identifier, msg=None):
         """
@@ -241,6 +271,7 @@ class ComboBoxKeywords:
     def expand_combobox(self, identifier, msg=None):
         """
         Expand combobox.
+        Cached combobox items are read again by the next combobox read after expand.
 
         XPaths syntax is explained in `XPath locator`.
 
@@ -257,6 +288,35 @@ class ComboBoxKeywords:
         """
         module = self._container.create_or_get_module()
         element = module.get_element(identifier, InterfaceType.COMBOBOX, msg)
+        module.action(Selector.Action.INVALIDATE_ITEMS,
+                      Selector.create_value_container(element=element),
+                      msg)
         module.action(Combobox.Action.EXPAND_COMBOBOX,
                       Selector.create_value_container(element=element),
                       msg)
+
+    @keyword
+    def invalidate_combobox_items(self, identifier, msg=None):
+        """
+        Removes cached items from combobox, so the next combobox read expands the combobox and reads all items again.
+        Cached items are also revalidated on each read, use this keyword if an application changes items without
+        changing their names or runtime ids.
+
+        XPaths syntax is explained in `XPath locator`.
+
+        If element could not be found by xpath an error message will be thrown.
+
+        Arguments:
+        | Argument   | Type   | Description                   |
+        | identifier | string | XPath identifier from element |
+        | msg        | string | Custom error message          |
+
+        Examples:
+        | Invalidate Combobox Items  <XPATH> |
+
+        """
+        module = self._container.create_or_get_module()
+        element = module.get_element(identifier, InterfaceType.COMBOBOX, msg)
+        module.action(Selector.Action.INVALIDATE_ITEMS,
+                      Selector.create_value_container(element=element),
+                      msg)
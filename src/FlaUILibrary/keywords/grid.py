@@ -18,12 +18,15 @@ class GridKeywords:
         self._container = container
 
     @keyword
-    def get_all_data_from_grid(self, identifier, msg=None):
+    def get_all_data_from_grid(self, identifier, columns=None, start=None, end=None, msg=None):
         """
         Get all data from a grid as an array collection.
 
         Includes all header values as first element from list.
 
+        Data can be restricted to a subset of columns by index and to a range of rows. Each cell value is read only
+        once by a cache request, which makes this keyword usable on large grids.
+
         For example data grid:
         [
           [ "Value_1", "Value_2", "Value_3" ],
@@ -35,16 +38,22 @@ class GridKeywords:
         If element could not be found by xpath an error message will be thrown.
 
         Arguments:
-        | Argument   | Type   | Description                   |
-        | identifier | string | XPath identifier from element |
-        | msg        | string | Custom error message          |
+        | Argument   | Type   | Description                                        |
+        | identifier | string | XPath identifier from element                      |
+        | columns    | list   | Optional column indices to read                    |
+        | start      | number | Optional first row index to read                   |
+        | end        | number | Optional row index to stop reading before          |
+        | msg        | string | Custom error message                               |
 
         Examples:
         | ${data}  Get All Data From Grid  <XPath>   |
+        | ${data}  Get All Data From Grid  <XPath>  columns=${{[0, 2]}}  start=100  end=200  |
         """
         module = self._container.create_or_get_module()
         element = module.get_element(identifier, InterfaceType.LISTVIEW, msg)
-        return module.action(Grid.Action.GET_ALL_DATA, Grid.create_value_container(element=element),
+        return module.action(Grid.Action.GET_ALL_DATA,
+                             Grid.create_value_container(element=element, columns=columns, start=start, end=end,
+                                                         msg=msg),
                              msg)
 
     @keyword
@@ -103,6 +112,33 @@ class GridKeywords:
         return module.action(Grid.Action.GET_SELECTED_ROWS, Grid.create_value_container(element=element),
                              msg)
 
+    @keyword
+    def get_selected_grid_rows_as_list(self, identifier, msg=None):
+        """
+        Get all selected rows as list from cell values. If nothing is selected an empty list will be returned.
+
+        For example:
+        [
+          [ "Data_1", "Data_2", "Data_3" ],
+        ]
+
+        XPaths syntax is explained in `XPath locator`.
+
+        If element could not be found by xpath an error message will be thrown.
+
+        Arguments:
+        | Argument   | Type   | Description                   |
+        | identifier | string | XPath identifier from element |
+        | msg        | string | Custom error message          |
+
+        Examples:
+        | ${data}  Get Selected Grid Rows As List  <XPath>   |
+        """
+        module = self._container.create_or_get_module()
+        element = module.get_element(identifier, InterfaceType.LISTVIEW, msg)
+        return module.action(Grid.Action.GET_SELECTED_ROWS_AS_LIST, Grid.create_value_container(element=element),
+                             msg)
+
     @keyword
     def select_grid_row_by_index(self, identifier, index, multiselect=True, msg=None):
         """
@@ -156,6 +192,39 @@ class GridKeywords:
                       Grid.create_value_container(element=element, index=index, name=name, multiselect=multiselect),
                       msg)
 
+    @keyword
+    def select_grid_rows_by_names(self, identifier, index, names, multiselect=True, msg=None):
+        """
+        Select all rows by names from data grid.
+
+        The column is read only once and all rows are looked up by a cached index from the column, so selecting many
+        rows is much faster than repeated `Select Grid Row By Name` calls. If multiselect is false the current
+        selection will be replaced by all given rows.
+
+        XPaths syntax is explained in `XPath locator`.
+
+        If element could not be found by xpath an error message will be thrown.
+
+        Arguments:
+        | Argument    | Type   | Description                                |
+        | identifier  | string | XPath identifier from element              |
+        | index       | string | Column IndexNumber                         |
+        | names       | list   | Column items Names                         |
+        | multiselect | bool   | Add to selection or replace selection      |
+        | msg         | string | Custom error message                       |
+
+        Examples:
+        | @{NAMES}  Create List  <NAME_1>  <NAME_2>          |
+        | Select Grid Rows By Names  <XPath>  <INDEX>  ${NAMES} |
+
+        """
+        module = self._container.create_or_get_module()
+        element = module.get_element(identifier, InterfaceType.LISTVIEW, msg)
+        module.action(Grid.Action.SELECT_ROWS_BY_NAMES,
+                      Grid.create_value_container(element=element, index=index, names=names, multiselect=multiselect,
+                                                  msg=msg),
+                      msg)
+
     @keyword
     def get_grid_rows_count(self, identifier, msg=None):
         """
@@ -205,3 +274,77 @@ class GridKeywords:
         return module.action(Grid.Action.GET_COLUMN_COUNT,
                              Grid.create_value_container(element=element, msg=msg),
                              msg)
+
+    @keyword
+    def export_grid_to_file(self, identifier, path, file_format="csv", include_header=True, filters=None,
+                            columns=None, virtualized=False, msg=None):
+        """
+        Export all rows from a grid to a file. Rows are streamed to the file, so memory usage does not grow with
+        the grid size. Returns the count of exported rows without header.
+
+        Supported file formats are csv and jsonl. A jsonl row is written as object by header names if header
+        is included, otherwise as array.
+
+        Rows can be filtered by a dictionary from column index or header name to the expected cell value. Only
+        rows which match all filters are exported.
+
+        Grids with UI virtualization only contain realized rows. Set virtualized to scroll through the whole grid,
+        see `Get All Data From Virtualized Grid`.
+
+        XPaths syntax is explained in `XPath locator`.
+
+        If element could not be found by xpath an error message will be thrown.
+
+        Arguments:
+        | Argument       | Type       | Description                                       |
+        | identifier     | string     | XPath identifier from element                     |
+        | path           | string     | Filepath to export grid data                      |
+        | file_format    | string     | csv or jsonl                                      |
+        | include_header | bool       | Write header as first row                         |
+        | filters        | dictionary | Column index or header name to expected value     |
+        | columns        | list       | Optional column indices to export                 |
+        | virtualized    | bool       | Read rows by scrolling through a virtualized grid |
+        | msg            | string     | Custom error message                              |
+
+        Examples:
+        | ${COUNT}  Export Grid To File  <XPATH>  ${OUTPUT_DIR}/grid.csv  |
+        | ${COUNT}  Export Grid To File  <XPATH>  ${OUTPUT_DIR}/grid.jsonl  jsonl  filters=${{{"Name": "Doe"}}}  |
+        """
+        module = self._container.create_or_get_module()
+        element = module.get_element(identifier, InterfaceType.LISTVIEW, msg)
+        return module.action(Grid.Action.EXPORT_TO_FILE,
+                             Grid.create_value_container(element=element, path=path, file_format=file_format,
+                                                         include_header=include_header, filters=filters,
+                                                         columns=columns, virtualized=virtualized, msg=msg),
+                             msg)
+
+    @keyword
+    def get_all_data_from_virtualized_grid(self, identifier, columns=None, msg=None):
+        """
+        Get all data from a grid with UI virtualization as an array collection.
+
+        Grids like WPF DataGrids only realize visible rows, so `Get All Data From Grid` returns only a part from
+        the data. This keyword walks through all items by ItemContainer and VirtualizedItem pattern or scrolls
+        page by page through the grid if not supported. Each row is only returned once. The throughput in rows per
+        second will be logged.
+
+        Includes all header values as first element from list.
+
+        XPaths syntax is explained in `XPath locator`.
+
+        If element could not be found by xpath an error message will be thrown.
+
+        Arguments:
+        | Argument   | Type   | Description                     |
+        | identifier | string | XPath identifier from element   |
+        | columns    | list   | Optional column indices to read |
+        | msg        | string | Custom error message            |
+
+        Examples:
+        | ${data}  Get All Data From Virtualized Grid  <XPath>   |
+        """
+        module = self._container.create_or_get_module()
+        element = module.get_element(identifier, InterfaceType.LISTVIEW, msg)
+        return module.action(Grid.Action.GET_ALL_DATA_VIRTUALIZED,
+                             Grid.create_value_container(element=element, columns=columns, msg=msg),
+                             msg)
@@ -165,3 +165,68 @@ class KeyboardKeywords:
                                                       press_only=press_only,
                                                       release_only=release_only),
                       msg)
+
+    @keyword
+    def load_keyboard_macros(self, path, msg=None):
+        """
+        Loads all keyboard macros from a file. Each macro is validated and compiled once while loading,
+        so syntax errors and invalid keys combinations are raised here and not while a macro is played.
+        Loaded macros replace already loaded macros with equal names.
+
+        Json files contain an object from macro name to a list of keys combinations.
+        All other files use a line format. Each macro starts with a [name] section and is followed by one
+        keys combination per line. Empty lines and lines starting with # are ignored.
+
+        | [login]      |
+        | t'admin'     |
+        | s'TAB'       |
+        | t'secret'    |
+        | s'ENTER'     |
+
+        Arguments:
+        | Argument | Type   | Description                |
+        | path     | String | Filepath from macro file   |
+        | msg      | String | Custom error message       |
+
+        Examples:
+        | @{names}  Load Keyboard Macros  ${CURDIR}/macros.txt |
+        | Load Keyboard Macros  ${CURDIR}/macros.json          |
+
+        Returns:
+        | List from loaded macro names |
+        """
+        module = self._container.create_or_get_module()
+        return module.action(Keyboard.Action.LOAD_KEYBOARD_MACROS,
+                             Keyboard.create_value_container(path=path),
+                             msg)
+
+    @keyword
+    def play_keyboard_macro(self, name, identifier=None, delay_in_ms=None, msg=None):
+        """
+        Types a keyboard macro which was loaded by `Load Keyboard Macros`.
+        If identifier set try to attach to given element if
+        operation was successfully old element will be reattached automatically.
+
+        Arguments:
+        | Argument    | Type             | Description                                |
+        | name        | String           | Name from loaded keyboard macro            |
+        | identifier  | String *Optional | Optional XPath identifier                  |
+        | delay_in_ms | Number *Optional | Delay to wait until keyword succeeds in ms |
+        | msg         | String *Optional | Custom error message                       |
+
+        XPath syntax is explained in `XPath locator`.
+
+        Examples:
+        | Load Keyboard Macros  ${CURDIR}/macros.txt    |
+        | Play Keyboard Macro   login  <XPATH>          |
+        | Play Keyboard Macro   login  <XPATH>  500     |
+        """
+        module = self._container.create_or_get_module()
+        if identifier is not None:
+            module.action(Element.Action.FOCUS_ELEMENT,
+                          Element.create_value_container(xpath=identifier, retries=None, name=None),
+                          msg)
+
+        module.action(Keyboard.Action.PLAY_KEYBOARD_MACRO,
+                      Keyboard.create_value_container(name=name, delay_in_ms=delay_in_ms),
+                      msg)
@@ -131,6 +131,64 @@ class ListBoxKeywords:
                       Selector.create_value_container(element=element, name=name, msg=msg),
                       msg)
 
+    @keyword
+    def select_listbox_items_by_names(self, identifier, names, msg=None):
+        """
+        Selects all listbox items with the given names and returns all names which could not be found.
+
+        Listbox items are searched in one pass. The current selection is replaced by the first found item and all
+        other found items are added to the selection.
+
+        XPaths syntax is explained in `XPath locator`.
+
+        If element could not be found by xpath an error message will be thrown.
+
+        Arguments:
+        | Argument   | Type   | Description                   |
+        | identifier | string | XPath identifier from element |
+        | names      | list   | Names from items to select    |
+        | msg        | string | Custom error message          |
+
+        Examples:
+        | @{names}  Create List  <NAME1>  <NAME2>                     |
+        | ${MISSING}  Select Listbox Items By Names  <XPATH>  ${names} |
+        | Should Be Empty  ${MISSING}                                   |
+        """
+        module = self._container.create_or_get_module()
+        element = module.get_element(identifier, InterfaceType.LISTBOX, msg)
+        return module.action(Selector.Action.SELECT_ITEMS_BY_NAMES,
+                             Selector.create_value_container(element=element, names=names, msg=msg),
+                             msg)
+
+    @keyword
+    def select_listbox_items_by_indices(self, identifier, indices, msg=None):
+        """
+        Selects all listbox items with the given indices and returns all indices which could not be found.
+
+        Listbox items are enumerated once. The current selection is replaced by the first found item and all other
+        found items are added to the selection.
+
+        XPaths syntax is explained in `XPath locator`.
+
+        If element could not be found by xpath an error message will be thrown.
+
+        Arguments:
+        | Argument   | Type   | Description                    |
+        | identifier | string | XPath identifier from element  |
+        | indices    | list   | Indices from items to select   |
+        | msg        | string | Custom error message           |
+
+        Examples:
+        | @{indices}  Create List  ${0}  ${2}                               |
+        | ${MISSING}  Select Listbox Items By Indices  <XPATH>  ${indices}  |
+        | Should Be Empty  ${MISSING}                                       |
+        """
+        module = self._container.create_or_get_module()
+        element = module.get_element(identifier, InterfaceType.LISTBOX, msg)
+        return module.action(Selector.Action.SELECT_ITEMS_BY_INDICES,
+                             Selector.create_value_container(element=element, indices=indices, msg=msg),
+                             msg)
+
     @keyword
     def listbox_should_contain(self, identifier, name, msg=None):
         """
@@ -156,6 +214,33 @@ class ListBoxKeywords:
                       Selector.create_value_container(element=element, name=name, msg=msg),
                       msg)
 
+    @keyword
+    def listbox_should_contain_items(self, identifier, names, msg=None):
+        """
+        Checks if listbox contains all given items by name or text.
+
+        All items are checked in one pass over the listbox. Error message contains all missing items.
+
+        XPaths syntax is explained in `XPath locator`.
+
+        If element could not be found by xpath an error message will be thrown.
+
+        Arguments:
+        | Argument   | Type   | Description                         |
+        | identifier | string | XPath identifier from element       |
+        | names      | list   | Names or texts from items to check  |
+        | msg        | string | Custom error message                |
+
+        Examples:
+        | @{names}  Create List  <NAME1>  <NAME2>       |
+        | Listbox Should Contain Items  <XPATH>  ${names} |
+        """
+        module = self._container.create_or_get_module()
+        element = module.get_element(identifier, InterfaceType.LISTBOX, msg)
+        module.action(Selector.Action.SHOULD_CONTAIN_ITEMS,
+                      Selector.create_value_container(element=element, names=names, msg=msg),
+                      msg)
+
     @keyword
     def listbox_should_not_contain(self, identifier, name, msg=None):
         """
@@ -1,6 +1,9 @@
+from robot.libraries.BuiltIn import BuiltIn
 from robotlibcore import keyword
+from FlaUILibrary.flaui.exception import FlaUiError
 from FlaUILibrary.flaui.module import Mouse
 from FlaUILibrary.flaui.module.element import Element
+from FlaUILibrary.flaui.util.dragpath import DragPath
 from FlaUILibrary.flaui.util.automationinterfacecontainer import AutomationInterfaceContainer
 
 
@@ -102,7 +105,7 @@ class MouseKeywords:
                       msg)
 
     @keyword
-    def click_hold(self, identifier, hold_time=1000, msg=None):
+    def click_hold(self, identifier, hold_time=1000, msg=None, keyword_name=None, keyword_args=None):
         """
         Left click and hold to element by XPath and release after timeout.
 
@@ -111,20 +114,29 @@ class MouseKeywords:
         If element could not be found by xpath an error message will be thrown.
 
         Arguments:
-        | Argument         | Type   | Description                   |
-        | identifier       | string | XPath identifier from element |
-        | hold_time        | int    | Holding time of click in ms   |
-        | msg              | string | Custom error message          |
+        | Argument     | Type   | Description                                 |
+        | identifier   | string | XPath identifier from element               |
+        | hold_time    | int    | Holding time of click in ms                 |
+        | msg          | string | Custom error message                        |
+        | keyword_name | string | Optional keyword to run while click is held |
+        | keyword_args | list   | Arguments for keyword                       |
+
+        The hold time is measured by a high resolution timer. An optional keyword is executed directly after the
+        mouse button is pressed and its runtime is part of the hold time. The mouse button is released after the hold
+        time is over or the keyword takes longer. The result from keyword is returned.
 
         Examples:
         | Click Hold <XPATH>  5000 |
+        | ${tooltip}  Click Hold  <XPATH>  5000  keyword_name=Get Name From Element  keyword_args=${args} |
 
         """
         module = self._container.create_or_get_module()
         element = module.get_element(identifier, msg=msg)
-        module.action(Mouse.Action.LEFT_CLICK_HOLD,
-                      Mouse.create_value_container(element=element, hold_time_in_ms=int(hold_time)),
-                      msg)
+        callback = self._create_hold_callback(keyword_name, keyword_args)
+        return module.action(Mouse.Action.LEFT_CLICK_HOLD,
+                             Mouse.create_value_container(element=element, hold_time_in_ms=int(hold_time),
+                                                          hold_callback=callback),
+                             msg)
 
     @keyword
     def middle_click(self, identifier, msg=None):
@@ -151,7 +163,7 @@ class MouseKeywords:
                       msg)
 
     @keyword
-    def middle_click_hold(self, identifier, hold_time=1000, msg=None):
+    def middle_click_hold(self, identifier, hold_time=1000, msg=None, keyword_name=None, keyword_args=None):
         """
         Left click and hold to element by XPath and release after timeout.
 
@@ -160,20 +172,29 @@ class MouseKeywords:
         If element could not be found by xpath an error message will be thrown.
 
         Arguments:
-        | Argument         | Type   | Description                   |
-        | identifier       | string | XPath identifier from element |
-        | hold_time        | int    | Holding time of click in ms   |
-        | msg              | string | Custom error message          |
+        | Argument     | Type   | Description                                 |
+        | identifier   | string | XPath identifier from element               |
+        | hold_time    | int    | Holding time of click in ms                 |
+        | msg          | string | Custom error message                        |
+        | keyword_name | string | Optional keyword to run while click is held |
+        | keyword_args | list   | Arguments for keyword                       |
+
+        The hold time is measured by a high resolution timer. An optional keyword is executed directly after the
+        mouse button is pressed and its runtime is part of the hold time. The mouse button is released after the hold
+        time is over or the keyword takes longer. The result from keyword is returned.
 
         Examples:
         | Middle Click Hold <XPATH>  5000 |
+        | ${tooltip}  Middle Click Hold  <XPATH>  5000  keyword_name=Get Name From Element  keyword_args=${args} |
 
         """
         module = self._container.create_or_get_module()
         element = module.get_element(identifier, msg=msg)
-        module.action(Mouse.Action.MIDDLE_CLICK_HOLD,
-                      Mouse.create_value_container(element=element, hold_time_in_ms=int(hold_time)),
-                      msg)
+        callback = self._create_hold_callback(keyword_name, keyword_args)
+        return module.action(Mouse.Action.MIDDLE_CLICK_HOLD,
+                             Mouse.create_value_container(element=element, hold_time_in_ms=int(hold_time),
+                                                          hold_callback=callback),
+                             msg)
 
     @keyword
     def double_click(self, identifier, msg=None):
@@ -200,7 +221,7 @@ class MouseKeywords:
                       msg)
 
     @keyword
-    def double_click_hold(self, identifier, hold_time=1000, msg=None):
+    def double_click_hold(self, identifier, hold_time=1000, msg=None, keyword_name=None, keyword_args=None):
         """
         Double click and hold to element by XPath and release after timeout.
 
@@ -209,20 +230,29 @@ class MouseKeywords:
         If element could not be found by xpath an error message will be thrown.
 
         Arguments:
-        | Argument         | Type   | Description                       |
-        | identifier       | string | XPath identifier from element     |
-        | hold_time        | int    | Holding time of click in ms       |
-        | msg              | string | Custom error message              |
+        | Argument     | Type   | Description                                 |
+        | identifier   | string | XPath identifier from element               |
+        | hold_time    | int    | Holding time of click in ms                 |
+        | msg          | string | Custom error message                        |
+        | keyword_name | string | Optional keyword to run while click is held |
+        | keyword_args | list   | Arguments for keyword                       |
+
+        The hold time is measured by a high resolution timer. An optional keyword is executed directly after the
+        mouse button is pressed and its runtime is part of the hold time. The mouse button is released after the hold
+        time is over or the keyword takes longer. The result from keyword is returned.
 
         Examples:
         | Double Click Hold  <XPATH>  5000 |
+        | ${tooltip}  Double Click Hold  <XPATH>  5000  keyword_name=Get Name From Element  keyword_args=${args} |
 
         """
         module = self._container.create_or_get_module()
         element = module.get_element(identifier, msg=msg)
-        module.action(Mouse.Action.DOUBLE_CLICK_HOLD,
-                      Mouse.create_value_container(element=element, hold_time_in_ms=int(hold_time)),
-                      msg)
+        callback = self._create_hold_callback(keyword_name, keyword_args)
+        return module.action(Mouse.Action.DOUBLE_CLICK_HOLD,
+                             Mouse.create_value_container(element=element, hold_time_in_ms=int(hold_time),
+                                                          hold_callback=callback),
+                             msg)
 
     @keyword
     def right_click(self, identifier, msg=None):
@@ -249,7 +279,7 @@ class MouseKeywords:
                       msg)
 
     @keyword
-    def right_click_hold(self, identifier, hold_time=1000, msg=None):
+    def right_click_hold(self, identifier, hold_time=1000, msg=None, keyword_name=None, keyword_args=None):
         """
         Right click and hold to element by XPath and release after timeout.
 
@@ -258,20 +288,29 @@ class MouseKeywords:
         If element could not be found by xpath an error message will be thrown.
 
         Arguments:
-        | Argument      | Type   | Description                   |
-        | identifier    | string | XPath identifier from element |
-        | hold_time     | int    | Holding time of click in ms   |
-        | msg           | string | Custom error message          |
+        | Argument     | Type   | Description                                 |
+        | identifier   | string | XPath identifier from element               |
+        | hold_time    | int    | Holding time of click in ms                 |
+        | msg          | string | Custom error message                        |
+        | keyword_name | string | Optional keyword to run while click is held |
+        | keyword_args | list   | Arguments for keyword                       |
+
+        The hold time is measured by a high resolution timer. An optional keyword is executed directly after the
+        mouse button is pressed and its runtime is part of the hold time. The mouse button is released after the hold
+        time is over or the keyword takes longer. The result from keyword is returned.
 
         Examples:
         | Right Click Hold  <XPATH>  5000 |
+        | ${tooltip}  Right Click Hold  <XPATH>  5000  keyword_name=Get Name From Element  keyword_args=${args} |
 
         """
         module = self._container.create_or_get_module()
         element = module.get_element(identifier, msg=msg)
-        module.action(Mouse.Action.RIGHT_CLICK_HOLD,
-                      Mouse.create_value_container(element=element, hold_time_in_ms=int(hold_time)),
-                      msg)
+        callback = self._create_hold_callback(keyword_name, keyword_args)
+        return module.action(Mouse.Action.RIGHT_CLICK_HOLD,
+                             Mouse.create_value_container(element=element, hold_time_in_ms=int(hold_time),
+                                                          hold_callback=callback),
+                             msg)
 
     @keyword
     def move_to(self, identifier, msg=None):
@@ -323,6 +362,126 @@ class MouseKeywords:
                       Mouse.create_value_container(element=start_element, second_element=end_element),
                       msg)
 
+    @keyword
+    def drag_and_drop_by_path(self, start_identifier, end_identifier, duration_in_ms=500, steps_per_second=60,
+                              interpolation="LINEAR", hover_in_ms=0, msg=None):
+        # pylint: disable=C0301
+        """
+        Clicks and hold the item with start_identifier and moves it step by step to the item with end_identifier.
+
+        XPaths syntax is explained in `XPath locator`.
+
+        If element could not be found by xpath an error message will be thrown.
+
+        The path is split into duration_in_ms * steps_per_second / 1000 mouse moves with equal time between them.
+        Use a lower speed or a hover time for controls which miss drag events from fast mouse moves.
+
+        Possible interpolations are:
+          | Interpolation | Description                                    |
+          | LINEAR        | Constant speed from start to end               |
+          | EASE_IN_OUT   | Slow start and end with a fast middle movement |
+
+        Arguments:
+        | Argument         | Type   | Description                                                             |
+        | start_identifier | string | XPath identifier of element which should be holded and draged from      |
+        | end_identifier   | string | XPath identifier of element which should be holded and draged to        |
+        | duration_in_ms   | int    | Time in ms to move from start to end element                            |
+        | steps_per_second | int    | Count from mouse moves per second                                       |
+        | interpolation    | string | Interpolation from mouse positions between start and end element        |
+        | hover_in_ms      | int    | Time in ms to wait on start after press and on end element before drop |
+        | msg              | string | Custom error message                                                    |
+
+        Examples:
+        | Drag And Drop By Path  <XPATH>  <XPATH> |
+        | ${moves}  Drag And Drop By Path  <XPATH>  <XPATH>  duration_in_ms=1000  steps_per_second=30  interpolation=EASE_IN_OUT  hover_in_ms=200 |
+
+        Returns:
+        | Count from mouse moves |
+
+        """
+        # pylint: enable=C0301
+        module = self._container.create_or_get_module()
+        drag_path = DragPath(duration_in_ms, steps_per_second, interpolation, hover_in_ms)
+        start_element = module.get_element(start_identifier, msg=msg)
+        end_element = module.get_element(end_identifier, msg=msg)
+        return module.action(Mouse.Action.DRAG_AND_DROP_BY_PATH,
+                             Mouse.create_value_container(element=start_element, second_element=end_element,
+                                                          drag_path=drag_path),
+                             msg)
+
+    @keyword
+    def click_sequence(self, *steps, msg=None):
+        """
+        Clicks many elements by XPaths back to back.
+
+        XPaths syntax is explained in `XPath locator`.
+
+        Each step is an XPath with an optional click action prefix like ``DOUBLE_CLICK:<XPATH>``.
+        Steps without prefix are left clicks.
+
+        All elements are searched and their clickable points are calculated before the first click, so every element
+        must exist when the sequence starts. If an element could not be found or is not clickable an error message
+        with the step index will be thrown and no click is executed.
+
+        Possible click actions are:
+          | Action       | Description        |
+          | LEFT_CLICK   | Left click         |
+          | DOUBLE_CLICK | Double left click  |
+          | RIGHT_CLICK  | Right click        |
+          | MIDDLE_CLICK | Middle click       |
+
+        Arguments:
+        | Argument   | Type   | Description                                             |
+        | steps      | string | XPath identifiers with optional click action prefix     |
+        | msg        | string | Custom error message                                    |
+
+        Examples:
+        | Click Sequence  <XPATH>  DOUBLE_CLICK:<XPATH>  RIGHT_CLICK:<XPATH> |
+
+        """
+        module = self._container.create_or_get_module()
+        click_steps = []
+
+        for index, step in enumerate(steps, start=1):
+            action, identifier = Mouse.get_click_step(step)
+            try:
+                click_steps.append((action, module.get_element(identifier)))
+            except FlaUiError as ex:
+                raise FlaUiError(msg if msg is not None else
+                                 FlaUiError.ClickSequenceStepFailed.format(index, str(ex))) from None
+
+        module.action(Mouse.Action.CLICK_SEQUENCE,
+                      Mouse.create_value_container(steps=click_steps),
+                      msg)
+
+    @keyword
+    def get_clickable_point_statistics(self, msg=None):
+        """
+        Get counters from clickable point cache used by all mouse keywords from this library instance.
+
+        Only clickable points from elements with a slow provider are cached by element runtime id. They are reused
+        while the bounding rectangle from element is unchanged, otherwise the center from the new bounding
+        rectangle is clicked. Cached points and centers are only used if the element is not offscreen and a hit
+        test on the point finds the element or one of its descendants, otherwise the clickable point is read again
+        and hidden elements raise an error as before. Saved time is the provider time from cached points minus the
+        time spent to validate them.
+
+        Arguments:
+        | Argument | Type   | Description          |
+        | msg      | string | Custom error message |
+
+        Examples:
+        | ${statistics}  Get Clickable Point Statistics |
+
+        Returns:
+        | Dictionary with hits, misses, fallbacks, rejected, fetch_time_in_ms and saved_time_in_ms |
+
+        """
+        module = self._container.create_or_get_module()
+        return module.action(Mouse.Action.GET_CLICKABLE_POINT_STATISTICS,
+                             Mouse.create_value_container(),
+                             msg)
+
     @keyword
     def click_open(self, click_element_identifier: str,
                    open_element_identifier: str,
@@ -349,7 +508,7 @@ class MouseKeywords:
         | focus_element_identifier_before_click | string | XPath identifier from element to be focused before clicking click_element |
         | focus_element_identifier_after_open | string | XPath identifier from element to be focused after openning open_element |
         | max_repeat | int | Maximum number of tries |
-        | timeout_between_repeates | int | wait time in milli seconds in between every try |
+        | timeout_between_repeates | int | maximum wait time in milli seconds for the expected element after every try |
         | ignore_if_already_open | bool | the keyword will not be executed if excepted element is already open |
         | msg | string | Custom error message |
 
@@ -395,7 +554,7 @@ class MouseKeywords:
         | focus_element_identifier_before_click | string | XPath identifier from element to be focused before double clicking click_element |
         | focus_element_identifier_after_open | string | XPath identifier from element to be focused after openning open_element |
         | max_repeat | int | Maximum number of tries |
-        | timeout_between_repeates | int | wait time in milli seconds in between every try |
+        | timeout_between_repeates | int | maximum wait time in milli seconds for the expected element after every try |
         | ignore_if_already_open | bool | the keyword will not be executed if excepted element is already open |
         | msg | string | Custom error message |
 
@@ -439,7 +598,7 @@ class MouseKeywords:
         | focus_element_identifier_before_click | string | XPath identifier from element to be focused before right clicking click_element |
         | focus_element_identifier_after_open | string | XPath identifier from element to be focused after openning open_element |
         | max_repeat | int | Maximum number of tries |
-        | timeout_between_repeates | int | wait time in milli seconds in between every try |
+        | timeout_between_repeates | int | maximum wait time in milli seconds for the expected element after every try |
         | ignore_if_already_open | bool | the keyword will not be executed if excepted element is already open |
         | msg | string | Custom error message |
 
@@ -484,7 +643,7 @@ class MouseKeywords:
         | focus_element_identifier_before_click | string | XPath identifier from element to be focused before middle clicking click_element |
         | focus_element_identifier_after_open | string | XPath identifier from element to be focused after openning open_element |
         | max_repeat | int | Maximum number of tries |
-        | timeout_between_repeates | int | wait time in milli seconds in between every try |
+        | timeout_between_repeates | int | maximum wait time in milli seconds for the expected element after every try |
         | ignore_if_already_open | bool | the keyword will not be executed if excepted element is already open |
         | msg | string | Custom error message |
 
@@ -531,7 +690,7 @@ class MouseKeywords:
         | focus_element_identifier_before_click | string | XPath identifier from element to be focused before clicking click_element |
         | focus_element_identifier_after_open | string | XPath identifier from element to be focused after openning open_element |
         | max_repeat | int | Maximum number of tries |
-        | timeout_between_repeates | int | wait time in milli seconds in between every try |
+        | timeout_between_repeates | int | maximum wait time in milli seconds for the expected element after every try |
         | ignore_if_already_open | bool | the keyword will not be executed if excepted element is already open |
         | msg | string | Custom error message |
 
@@ -578,7 +737,7 @@ class MouseKeywords:
         | focus_element_identifier_before_click | string | XPath identifier from element to be focused before clicking click_element |
         | focus_element_identifier_after_close | string | XPath identifier from element to be focused after openning close_element |
         | max_repeat | int | Maximum number of tries |
-        | timeout_between_repeates | int | wait time in milli seconds in between every try |
+        | timeout_between_repeates | int | maximum wait time in milli seconds for the expected element after every try |
         | ignore_if_already_open | bool | the keyword will not be executed if excepted element is already closed |
         | msg        | string | Custom error message          |
 
@@ -627,7 +786,7 @@ class MouseKeywords:
         | focus_element_identifier_before_click | string | XPath identifier from element to be focused before double clicking click_element |
         | focus_element_identifier_after_close | string | XPath identifier from element to be focused after openning close_element |
         | max_repeat | int | Maximum number of tries |
-        | timeout_between_repeates | int | wait time in milli seconds in between every try |
+        | timeout_between_repeates | int | maximum wait time in milli seconds for the expected element after every try |
         | ignore_if_already_open | bool | the keyword will not be executed if excepted element is already closed |
         | msg        | string | Custom error message          |
 
@@ -676,7 +835,7 @@ class MouseKeywords:
         | focus_element_identifier_before_click | string | XPath identifier from element to be focused before right clicking click_element |
         | focus_element_identifier_after_close | string | XPath identifier from element to be focused after openning close_element |
         | max_repeat | int | Maximum number of tries |
-        | timeout_between_repeates | int | wait time in milli seconds in between every try |
+        | timeout_between_repeates | int | maximum wait time in milli seconds for the expected element after every try |
         | ignore_if_already_open | bool | the keyword will not be executed if excepted element is already closed |
         | msg        | string | Custom error message          |
 
@@ -725,7 +884,7 @@ class MouseKeywords:
         | focus_element_identifier_before_click | string | XPath identifier from element to be focused before middle clicking click_element |
         | focus_element_identifier_after_close | string | XPath identifier from element to be focused after openning close_element |
         | max_repeat | int | Maximum number of tries |
-        | timeout_between_repeates | int | wait time in milli seconds in between every try |
+        | timeout_between_repeates | int | maximum wait time in milli seconds for the expected element after every try |
         | ignore_if_already_open | bool | the keyword will not be executed if excepted element is already closed |
         | msg        | string | Custom error message          |
 
@@ -776,7 +935,7 @@ class MouseKeywords:
         | focus_element_identifier_before_click | string | XPath identifier from element to be focused before middle clicking click_element |
         | focus_element_identifier_after_close | string | XPath identifier from element to be focused after openning close_element |
         | max_repeat | int | Maximum number of tries |
-        | timeout_between_repeates | int | wait time in milli seconds in between every try |
+        | timeout_between_repeates | int | maximum wait time in milli seconds for the expected element after every try |
         | ignore_if_already_open | bool | the keyword will not be executed if excepted element is already closed |
         | msg        | string | Custom error message          |
 
@@ -799,3 +958,16 @@ class MouseKeywords:
                                                    max_repeat=max_repeat,
                                                    timeout_in_ms=timeout_between_repeates,
                                                    ignore_if=ignore_if_already_close), msg)
+
+    @staticmethod
+    def _create_hold_callback(keyword_name, keyword_args):
+        """
+        Create function to run a keyword while mouse button is held or None if no keyword is given.
+
+        ``keyword_name`` Name from keyword to run.
+        ``keyword_args`` Arguments for keyword.
+        """
+        if not keyword_name:
+            return None
+
+        return lambda: BuiltIn().run_keyword(keyword_name, *(keyword_args or []))
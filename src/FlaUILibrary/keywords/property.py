@@ -73,17 +73,7 @@ class PropertyKeywords:  # pylint: disable=too-many-public-methods
         """
         # pylint: enable=line-too-long
 
-        action_value = ""
-        try:
-            action_value = Property.Action[action.upper()]
-        except KeyError:
-            FlaUiError.raise_fla_ui_error(FlaUiError.InvalidPropertyArgument)
-
-        if action_value in [Property.Action.MAXIMIZE_WINDOW,
-                            Property.Action.MINIMIZE_WINDOW,
-                            Property.Action.NORMALIZE_WINDOW]:
-            FlaUiError.raise_fla_ui_error(FlaUiError.InvalidPropertyArgument)
-
+        action_value = self._get_property_action(action)
         module = self._container.create_or_get_module()
 
         if action_value is Property.Action.IS_SELECTED:
@@ -110,6 +100,44 @@ class PropertyKeywords:  # pylint: disable=too-many-public-methods
 
         return property_value
 
+    @keyword
+    def get_properties_from_element(self, identifier, *properties, msg=None):
+        """
+        Returns many supported property values from a given element as dictionary by property name.
+
+        The element is searched only once and each pattern is fetched only once, so all properties from the same
+        pattern like FONT_SIZE, FONT_NAME and FOREGROUND_COLOR are read from one text document range.
+
+        Supported properties are equal to `Get Property From Element`.
+
+        XPaths syntax is explained in `XPath locator`.
+
+        Possible FlaUI-Errors:
+        | Element could not be found by xpath        |
+        | Pattern is not supported by given element  |
+        | Try to execute a setter property           |
+
+        Arguments:
+        | Argument   | Type   | Description                   |
+        | identifier | string | XPath identifier from element |
+        | properties | string | Properties to receive         |
+        | msg        | string | Custom error message          |
+
+        Examples:
+        | ${properties}  Get Properties From Element  <XPATH>  FONT_SIZE  FONT_NAME  FOREGROUND_COLOR |
+        | Should Be Equal  ${properties}[FONT_NAME]  Segoe UI |
+
+        """
+        actions = [self._get_property_action(prop) for prop in properties]
+
+        module = self._container.create_or_get_module()
+        element = module.get_element(identifier, msg=msg)
+        return module.action(Property.Action.GET_PROPERTIES,
+                             Property.create_value_container(element=element,
+                                                             uia=module.identifier(),
+                                                             properties=actions),
+                             msg)
+
     @keyword
     def get_background_color(self, identifier, msg=None):
         """
@@ -841,3 +869,26 @@ class PropertyKeywords:  # pylint: disable=too-many-public-methods
         return module.action(Property.Action.CAN_WINDOW_MINIMIZE,
                              Property.create_value_container(element=element),
                              msg)
+
+    @staticmethod
+    def _get_property_action(action):
+        """
+        Get property action by name. Setter properties and internal actions are not allowed.
+
+        Args:
+            action (String): Property name to receive.
+        """
+        action_value = ""
+        try:
+            action_value = Property.Action[action.upper()]
+        except KeyError:
+            FlaUiError.raise_fla_ui_error(FlaUiError.InvalidPropertyArgument)
+
+        if action_value in [Property.Action.MAXIMIZE_WINDOW,
+                            Property.Action.MINIMIZE_WINDOW,
+                            Property.Action.NORMALIZE_WINDOW,
+                            Property.Action.STAGE_FOR_COMBOBOX_SELECTIONITEM,
+                            Property.Action.GET_PROPERTIES]:
+            FlaUiError.raise_fla_ui_error(FlaUiError.InvalidPropertyArgument)
+
+        return action_value
@@ -1,6 +1,7 @@
+from robot.libraries.BuiltIn import BuiltIn
 from robotlibcore import keyword
 from FlaUILibrary.flaui.enum import InterfaceType
-from FlaUILibrary.flaui.module import Tab
+from FlaUILibrary.flaui.module import Element, Tab
 from FlaUILibrary.flaui.util.automationinterfacecontainer import AutomationInterfaceContainer
 
 
@@ -68,3 +69,53 @@ class TabKeywords:
         return module.action(Tab.Action.SELECT_TAB_ITEM_BY_NAME,
                              Tab.create_value_container(element=element, name=name),
                              msg)
+
+    @keyword
+    def for_each_tab_item(self, identifier, keyword_name, *args, msg=None):
+        """
+        Selects each tab item in tab order and runs the given keyword for it.
+
+        Tab items are enumerated once. The keyword is called with the tab item name as first argument followed by
+        all given arguments. While the keyword runs, relative XPaths which start with '.' are searched from the
+        content of the selected tab instead of the desktop, absolute XPaths are not affected.
+
+        Returns names from all visited tab items.
+
+        XPaths syntax is explained in `XPath locator`.
+
+        If element could not be found by xpath an error message will be thrown.
+
+        Arguments:
+        | Argument     | Type   | Description                                        |
+        | identifier   | string | XPath identifier from element                      |
+        | keyword_name | string | Keyword to run for each tab item                   |
+        | args         | list   | Additional arguments for keyword after tab name    |
+        | msg          | string | Custom error message                               |
+
+        Examples:
+        | @{NAMES}  For Each Tab Item  <XPATH>  Verify Tab Fields  |
+        | Verify Tab Fields                                         |
+        |     [Arguments]  ${tab_name}                              |
+        |     Element Should Exist  .//Edit[@AutomationId='Name']   |
+        """
+        module = self._container.create_or_get_module()
+        element = module.get_element(identifier, InterfaceType.TAB, msg=msg)
+        tab_items = module.action(Tab.Action.GET_TAB_ITEMS,
+                                  Tab.create_value_container(element=element),
+                                  msg)
+
+        for name, item in tab_items:
+            content = module.action(Tab.Action.SELECT_TAB_ITEM,
+                                    Tab.create_value_container(element=element, item=item),
+                                    msg)
+            previous = module.action(Element.Action.SET_SEARCH_ROOT,
+                                     Element.create_value_container(element=content),
+                                     msg)
+            try:
+                BuiltIn().run_keyword(keyword_name, name, *args)
+            finally:
+                module.action(Element.Action.SET_SEARCH_ROOT,
+                              Element.create_value_container(element=previous),
+                              msg)
+
+        return [name for name, _ in tab_items]
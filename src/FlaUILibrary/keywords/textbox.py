@@ -49,9 +49,14 @@ class TextBoxKeywords:
         """
         Inputs value to a textbox module.
 
+        The value is set by the value pattern if supported. If the pattern is not supported, read only or the
+        textbox ignores the value, the text is typed by keyboard in chunks. The used strategy VALUE_PATTERN or
+        KEYBOARD and the elapsed time are logged and the strategy is returned.
+
         XPaths syntax is explained in `XPath locator`.
 
         If element could not be found by xpath an error message will be thrown.
+        If textbox does not contain the value after keyboard input an error message will be thrown.
 
         Arguments:
         | Argument   | Type   | Description                   |
@@ -61,10 +66,11 @@ class TextBoxKeywords:
 
         Examples:
         | Set Text To Textbox  <XPATH>  <VALUE> |
+        | ${strategy}  Set Text To Textbox  <XPATH>  <VALUE> |
 
         """
         module = self._container.create_or_get_module()
         element = module.get_element(identifier, InterfaceType.TEXTBOX, msg=msg)
-        module.action(Textbox.Action.SET_TEXT_TO_TEXTBOX,
-                      Textbox.create_value_container(element=element, value=value),
-                      msg)
+        return module.action(Textbox.Action.SET_TEXT_TO_TEXTBOX,
+                             Textbox.create_value_container(element=element, value=value),
+                             msg)
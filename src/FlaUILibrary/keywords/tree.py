@@ -94,27 +94,37 @@ class TreeKeywords:
                              msg)
 
     @keyword
-    def expand_all_treeitems(self, identifier, msg=None):
+    def expand_all_treeitems(self, identifier, max_depth=None, name_filter=None, msg=None):
         """
         Expands every expandable Tree items of the given tree.
 
+        Tree items are expanded level by level. Use max_depth to expand only the first levels from the tree, root
+        items have depth 1. Use name_filter as glob pattern to expand only tree items with a matching name,
+        children from not matching tree items are not visited.
+
+        Returns count of expanded tree items. Count from all visited tree items and elapsed time will be logged.
+
         XPaths syntax is explained in `XPath locator`.
 
         If element could not be found by xpath an error message will be thrown.
 
         Arguments:
-        | Argument   | Type            | Description                   |
-        | identifier | string          | XPath identifier from element |
-        | msg        | string          | Custom error message          |
+        | Argument    | Type            | Description                                  |
+        | identifier  | string          | XPath identifier from element                |
+        | max_depth   | number          | Optional maximum depth from items to expand  |
+        | name_filter | string          | Optional glob pattern from names to expand   |
+        | msg         | string          | Custom error message                         |
 
         Examples:
         | Expand All TreeItems  <XPATH>                 |
+        | ${COUNT}  Expand All TreeItems  <XPATH>  max_depth=3  name_filter=Folder* |
         """
         module = self._container.create_or_get_module()
         element = module.get_element(identifier, InterfaceType.TREE, msg=msg)
-        module.action(Tree.Action.EXPAND_ALL,
-                      Tree.create_value_container(element=element),
-                      msg)
+        return module.action(Tree.Action.EXPAND_ALL,
+                             Tree.create_value_container(element=element, max_depth=max_depth,
+                                                         name_filter=name_filter, msg=msg),
+                             msg)
 
     @keyword
     def collapse_all_treeitems(self, identifier, msg=None):
@@ -247,6 +257,36 @@ class TreeKeywords:
                       Tree.create_value_container(element=element, item=item),
                       msg)
 
+    @keyword
+    def select_treeitems(self, identifier, items, msg=None):
+        """
+        Selects many items from tree by hybrid pointers, series of indexes and names.
+
+        Each tree item is located by the same syntax as in `Select TreeItem`. All locations are validated before
+        any tree item is selected. Tree items from a shared location prefix are searched and expanded only once.
+        Tree items are selected in the given order.
+
+        XPaths syntax is explained in `XPath locator`.
+
+        If element could not be found by xpath an error message will be thrown.
+
+        Arguments:
+        | Argument   | Type   | Description                           |
+        | identifier | string | XPath identifier from element         |
+        | items      | list   | Hybrid solutions from items to select |
+        | msg        | string | Custom error message                  |
+
+        Examples:
+        | @{items}  N:name1->N:name2  N:name1->N:name3 |
+        | Select TreeItems   <XPATH>  ${items}       |
+
+        """
+        module = self._container.create_or_get_module()
+        element = module.get_element(identifier, InterfaceType.TREE, msg=msg)
+        module.action(Tree.Action.SELECT_ITEMS,
+                      Tree.create_value_container(element=element, items=items),
+                      msg)
+
     @keyword
     def expand_treeitem(self, identifier, item, msg=None):
         """
@@ -355,3 +395,58 @@ class TreeKeywords:
         module.action(Tree.Action.SET_SEPERATOR,
                       Tree.create_value_container(seperator=seperator),
                       msg)
+
+    @keyword
+    def export_tree_snapshot(self, identifier, path, file_format="json", max_depth=None, msg=None):
+        """
+        Writes name, depth, expand state and selection state from all visible tree items to a file.
+
+        Json snapshots contain nested objects with children, jsonl snapshots contain one object per line in tree
+        order. Use max_depth to write only the first levels from the tree, root items have depth 1.
+
+        Returns count of written tree items.
+
+        XPaths syntax is explained in `XPath locator`.
+
+        If element could not be found by xpath an error message will be thrown.
+
+        Arguments:
+        | Argument    | Type   | Description                                 |
+        | identifier  | string | XPath identifier from element               |
+        | path        | string | Filepath to write                           |
+        | file_format | string | File format json or jsonl, default is json  |
+        | max_depth   | number | Optional maximum depth from items to write  |
+        | msg         | string | Custom error message                        |
+
+        Examples:
+        | ${COUNT}  Export Tree Snapshot  <XPATH>  ${OUTPUT_DIR}/tree.json                  |
+        | ${COUNT}  Export Tree Snapshot  <XPATH>  ${OUTPUT_DIR}/tree.jsonl  jsonl  max_depth=2 |
+        """
+        module = self._container.create_or_get_module()
+        element = module.get_element(identifier, InterfaceType.TREE, msg=msg)
+        return module.action(Tree.Action.EXPORT_SNAPSHOT,
+                             Tree.create_value_container(element=element, path=path, file_format=file_format,
+                                                         max_depth=max_depth, msg=msg),
+                             msg)
+
+    @keyword
+    def tree_snapshot_should_match(self, path, expected_path, msg=None):
+        """
+        Verifies if a tree snapshot is equal to an expected snapshot.
+
+        Snapshots are compared item by item in tree order, so json and jsonl snapshots can be compared with each
+        other. Error message contains the first different tree item.
+
+        Arguments:
+        | Argument      | Type   | Description                          |
+        | path          | string | Filepath from snapshot to verify     |
+        | expected_path | string | Filepath from expected snapshot      |
+        | msg           | string | Custom error message                 |
+
+        Examples:
+        | Tree Snapshot Should Match  ${OUTPUT_DIR}/tree.json  ${CURDIR}/golden/tree.json |
+        """
+        module = self._container.create_or_get_module()
+        module.action(Tree.Action.SNAPSHOT_SHOULD_MATCH,
+                      Tree.create_value_container(path=path, expected_path=expected_path),
+                      msg)